@@ -0,0 +1,206 @@
+"""Benchmark the DMM HAL driver modules against simulated instruments.
+
+NI-DMM sessions are simulated using the driver's Simulate option and Keysight DMM sessions are
+simulated using the PyVISA-sim backend defined in `_keysight_dmm_sim.yaml`. A fake reservation
+stands in for the session management service, so the NI gRPC Device Server is not used.
+
+Run it from the measurement service directory:
+
+    python -m benchmarks.dmm_hal_drivers --iterations 100 --output results.json
+
+The results are written as JSON. Drivers that cannot be used on this computer, for example because
+NI-DMM is not installed, are reported with an error instead of timings.
+"""
+
+import contextlib
+import json
+import os
+import platform
+import time
+from typing import Any, Callable, Dict, Generator, List, Optional, Sequence
+
+import click
+import nidmm
+import numpy
+from dmm_hal.dmm import ScanStep, initialize
+from dmm_hal.function import Function as DmmFunction
+from ni_measurement_plugin_sdk_service.session_management import (
+    PinMapContext,
+    SessionInformation,
+    SessionInitializationBehavior,
+)
+
+_PIN_NAME = "DMM_Pin"
+
+_SCAN_LIST = [
+    ScanStep(DmmFunction.DC_VOLTS, 10.0, 5.5),
+    ScanStep(DmmFunction.AC_VOLTS, 10.0, 5.5),
+    ScanStep(DmmFunction.DC_VOLTS, 1.0, 4.5),
+]
+
+_NIDMM_OPTIONS = {"simulate": True, "driver_setup": {"Model": "4081", "BoardType": "PXIe"}}
+
+_SESSION_INFOS = [
+    SessionInformation(
+        session_name="NI-DMM",
+        resource_name="NI-DMM",
+        channel_list="",
+        instrument_type_id="niDMM",
+        session_exists=False,
+        channel_mappings=[],
+    ),
+    SessionInformation(
+        session_name="Sim_Keysight_DMM",
+        resource_name="GPIB0::3::INSTR",
+        channel_list="",
+        instrument_type_id="KeysightDmm",
+        session_exists=False,
+        channel_mappings=[],
+    ),
+]
+
+
+class _SimulatedReservation:
+    """Initializes a simulated instrument session in place of a session management reservation."""
+
+    def __init__(self, session_info: SessionInformation) -> None:
+        self._session_info = session_info
+        self._discovery_client = None
+
+    @property
+    def session_info(self) -> SessionInformation:
+        return self._session_info
+
+    @contextlib.contextmanager
+    def initialize_nidmm_session(
+        self,
+        reset_device: bool = False,
+        options: Optional[Dict[str, Any]] = None,
+        initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.AUTO,
+    ) -> Generator[SessionInformation, None, None]:
+        with nidmm.Session(
+            self._session_info.resource_name, reset_device=reset_device, options=_NIDMM_OPTIONS
+        ) as session:
+            yield self._session_info._replace(session=session)
+
+    @contextlib.contextmanager
+    def initialize_session(
+        self, session_constructor: Callable[[SessionInformation], Any], instrument_type_id: str
+    ) -> Generator[SessionInformation, None, None]:
+        with session_constructor(self._session_info) as session:
+            yield self._session_info._replace(session=session)
+
+
+class _SimulatedMeasurementContext:
+    """Reserves a simulated instrument session in place of the measurement service context."""
+
+    pin_map_context = PinMapContext(pin_map_id="SimulatedPinMap", sites=[0])
+
+    def __init__(self, session_info: SessionInformation) -> None:
+        self._session_info = session_info
+
+    @contextlib.contextmanager
+    def reserve_session(self, pin_name: str) -> Generator[_SimulatedReservation, None, None]:
+        yield _SimulatedReservation(self._session_info)
+
+
+def _time_calls(function: Callable[[], object], iterations: int, warmup: int) -> List[float]:
+    for _ in range(warmup):
+        function()
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _summarize(durations: Sequence[float]) -> Dict[str, float]:
+    array = numpy.asarray(durations, dtype=numpy.float64)
+    mean = float(array.mean())
+    return {
+        "mean_s": mean,
+        "median_s": float(numpy.median(array)),
+        "p95_s": float(numpy.percentile(array, 95)),
+        "min_s": float(array.min()),
+        "max_s": float(array.max()),
+        "calls_per_second": 1.0 / mean,
+    }
+
+
+def _benchmark_driver(
+    session_info: SessionInformation, iterations: int, warmup: int, count: int
+) -> Dict[str, Any]:
+    measurement_context: Any = _SimulatedMeasurementContext(session_info)
+
+    def initialize_and_close() -> None:
+        with initialize(measurement_context, _PIN_NAME):
+            pass
+
+    init_durations = _time_calls(initialize_and_close, iterations, warmup)
+
+    with initialize(measurement_context, _PIN_NAME) as dmm:
+        ranges = [10.0, 1.0]
+
+        def configure() -> None:
+            ranges.reverse()
+            dmm.configure_measurement_digits(DmmFunction.DC_VOLTS, ranges[0], 5.5)
+
+        configure_durations = _time_calls(configure, iterations, warmup)
+        dmm.configure_measurement_digits(DmmFunction.DC_VOLTS, 10.0, 5.5)
+        read_durations = _time_calls(dmm.read, iterations, warmup)
+        read_multiple_durations = _time_calls(lambda: dmm.read_multiple(count), iterations, warmup)
+        scan_durations = _time_calls(lambda: dmm.measure_scan(_SCAN_LIST), iterations, warmup)
+
+    read_multiple_summary = _summarize(read_multiple_durations)
+    return {
+        "instrument_type_id": session_info.instrument_type_id,
+        "resource_name": session_info.resource_name,
+        "initialize": _summarize(init_durations),
+        "configure_measurement_digits": _summarize(configure_durations),
+        "read": _summarize(read_durations),
+        "read_multiple": dict(
+            read_multiple_summary,
+            count=count,
+            readings_per_second=count / read_multiple_summary["mean_s"],
+        ),
+        "measure_scan": dict(_summarize(scan_durations), count=len(_SCAN_LIST)),
+    }
+
+
+@click.command
+@click.option("--iterations", default=100, show_default=True, help="Timed calls per operation.")
+@click.option("--warmup", default=5, show_default=True, help="Untimed calls per operation.")
+@click.option("--count", default=3, show_default=True, help="Readings per read_multiple() call.")
+@click.option("--output", type=click.File("w"), default="-", help="JSON output file.")
+def main(iterations: int, warmup: int, count: int, output: Any) -> None:
+    """Benchmark the DMM HAL driver modules against simulated instruments."""
+    os.environ.setdefault("MEASUREMENT_PLUGIN_VISA_DMM_SIMULATE", "1")
+
+    results: List[Dict[str, Any]] = []
+    for session_info in _SESSION_INFOS:
+        try:
+            results.append(_benchmark_driver(session_info, iterations, warmup, count))
+        except Exception as e:
+            results.append(
+                {
+                    "instrument_type_id": session_info.instrument_type_id,
+                    "resource_name": session_info.resource_name,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            )
+
+    report = {
+        "benchmark": "dmm_hal_drivers",
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "warmup": warmup,
+        "results": results,
+    }
+    json.dump(report, output, indent=2)
+    output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
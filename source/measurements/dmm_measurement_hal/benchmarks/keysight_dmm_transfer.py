@@ -0,0 +1,101 @@
+"""Compare ASCII and binary (FORM:DATA REAL,64) reading transfers for the Keysight DMM driver.
+
+The benchmark uses the PyVISA-sim backend defined in `_keysight_dmm_sim.yaml`. `GPIB0::3::INSTR`
+returns ASCII readings and `GPIB0::4::INSTR` returns REAL,64 definite length blocks.
+
+Run it from the measurement service directory:
+
+    python -m benchmarks.keysight_dmm_transfer --count 1000
+"""
+
+import time
+from typing import Callable, Iterable, Sequence, cast
+
+import click
+import numpy
+import pyvisa.util
+from dmm_hal.keysightdmm import _keysight_dmm
+
+_ASCII_RESOURCE_NAME = "GPIB0::3::INSTR"
+_BINARY_RESOURCE_NAME = "GPIB0::4::INSTR"
+
+# Format used by the Keysight 34410/34411 for ASCII readings, e.g. "+1.23456000E+00".
+_ASCII_READING_FORMAT = "%+.8E"
+
+# Number of readings returned by each READ? or FETC? query of the simulated instrument.
+_SIM_READING_COUNT = 5
+
+
+def _to_array(values: Iterable[float]) -> Sequence[float]:
+    # PyVISA types the container as returning a Sequence, which a numpy array is at runtime.
+    return cast(Sequence[float], numpy.array(values, dtype=numpy.float64))
+
+
+def _time_per_call(function: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations
+
+
+@click.command
+@click.option("--count", default=1000, show_default=True, help="Readings per parsed payload.")
+@click.option("--iterations", default=200, show_default=True, help="Iterations per measurement.")
+def main(count: int, iterations: int) -> None:
+    """Compare ASCII and binary reading transfers for the Keysight DMM driver."""
+    with _keysight_dmm.Session(
+        _ASCII_RESOURCE_NAME, simulate=True
+    ) as ascii_session, _keysight_dmm.Session(
+        _BINARY_RESOURCE_NAME, simulate=True, binary_transfer=True
+    ) as binary_session:
+        function = _keysight_dmm.Function.DC_VOLTS
+        ascii_session.configure_measurement_digits(function, 10.0, 5.5)
+        binary_session.configure_measurement_digits(function, 10.0, 5.5)
+
+        # The driver raises if it receives fewer readings than requested, so read as many readings
+        # as the simulated instrument returns.
+        ascii_read_time = _time_per_call(
+            lambda: ascii_session.read_multiple(_SIM_READING_COUNT), iterations
+        )
+        binary_read_time = _time_per_call(
+            lambda: binary_session.read_multiple(_SIM_READING_COUNT), iterations
+        )
+        sim_readings = binary_session.fetch_multiple(_SIM_READING_COUNT)
+
+    # The simulated instrument returns a fixed number of readings, so build payloads with the
+    # requested number of readings to measure parsing cost.
+    readings = numpy.resize(sim_readings, count)
+    ascii_payload = ",".join(_ASCII_READING_FORMAT % reading for reading in readings).encode()
+    binary_payload = bytes(
+        pyvisa.util.to_ieee_block(readings.tolist(), datatype="d", is_big_endian=True)
+    )
+
+    ascii_parse_time = _time_per_call(
+        lambda: pyvisa.util.from_ascii_block(
+            ascii_payload.decode(), converter="f", separator=",", container=_to_array
+        ),
+        iterations,
+    )
+    binary_parse_time = _time_per_call(
+        lambda: pyvisa.util.from_ieee_block(
+            binary_payload, datatype="d", is_big_endian=True, container=_to_array
+        ),
+        iterations,
+    )
+
+    click.echo(f"Simulated read_multiple() with {_SIM_READING_COUNT} readings per call:")
+    click.echo(f"  ascii:  {ascii_read_time * 1e6:10.1f} us/call")
+    click.echo(f"  binary: {binary_read_time * 1e6:10.1f} us/call")
+    click.echo(f"Payload of {count} readings:")
+    click.echo(
+        f"  ascii:  {len(ascii_payload) / count:5.2f} bytes/reading, "
+        f"{ascii_parse_time * 1e6:10.1f} us/parse"
+    )
+    click.echo(
+        f"  binary: {len(binary_payload) / count:5.2f} bytes/reading, "
+        f"{binary_parse_time * 1e6:10.1f} us/parse"
+    )
+
+
+if __name__ == "__main__":
+    main()
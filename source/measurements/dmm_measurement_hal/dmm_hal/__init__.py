@@ -1,6 +1,49 @@
 """HAL modules for DMM."""
 
-from dmm_hal.dmm import DmmBase, initialize, create_dmm_sessions, destroy_dmm_sessions
+from dmm_hal.async_dmm import AsyncDmm, initialize_async
+from dmm_hal.capabilities import DmmCapabilities, Feature
+from dmm_hal.dmm import (
+    DmmBase,
+    ScanStep,
+    SessionPool,
+    initialize,
+    create_dmm_sessions,
+    destroy_dmm_sessions,
+    get_capabilities,
+)
+from dmm_hal.driver_registry import register_driver
 from dmm_hal.function import Function
+from dmm_hal.instrumentation import (
+    Instrumentation,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_instrumentation,
+)
+from dmm_hal.lock_manager import InstrumentLockManager, get_lock_manager
+from dmm_hal.multi_site import SiteMeasurementContext, run_per_site
+from dmm_hal.trigger_line import TriggerLine
 
-__all__ = ["initialize", "Function", "DmmBase", "create_dmm_sessions", "destroy_dmm_sessions"]
+__all__ = [
+    "initialize",
+    "initialize_async",
+    "Function",
+    "DmmBase",
+    "ScanStep",
+    "AsyncDmm",
+    "SessionPool",
+    "create_dmm_sessions",
+    "destroy_dmm_sessions",
+    "Instrumentation",
+    "enable_instrumentation",
+    "disable_instrumentation",
+    "get_instrumentation",
+    "DmmCapabilities",
+    "Feature",
+    "get_capabilities",
+    "register_driver",
+    "TriggerLine",
+    "SiteMeasurementContext",
+    "run_per_site",
+    "InstrumentLockManager",
+    "get_lock_manager",
+]
@@ -0,0 +1,192 @@
+"""Defines an asyncio front-end for the DMM HAL."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from dmm_hal.dmm import DmmBase, SessionPool, initialize
+from dmm_hal.function import Function as DmmFunction
+from dmm_hal.lock_manager import InstrumentLockManager
+from dmm_hal.trigger_line import TriggerLine
+from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
+from ni_measurement_plugin_sdk_service.session_management import (
+    SessionInitializationBehavior,
+)
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing as npt
+
+_T = TypeVar("_T")
+
+
+async def _run_in_executor(
+    executor: concurrent.futures.Executor, function: Callable[..., _T], *args: Any
+) -> _T:
+    """Run a blocking function on the executor with a copy of the current context variables."""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, functools.partial(context.run, function, *args))
+
+
+class AsyncDmm:
+    """Asyncio interface for the DMM instrument session.
+
+    Driver calls run on an executor that is dedicated to the instrument, so calls to the same
+    instrument run one at a time and in order, while calls to different instruments can be awaited
+    concurrently with asyncio.gather().
+    """
+
+    def __init__(self, session: DmmBase, executor: concurrent.futures.Executor) -> None:
+        """Initialize the asyncio wrapper for a DMM session."""
+        self._session = session
+        self._executor = executor
+
+    @property
+    def session(self) -> DmmBase:
+        """The blocking DMM session."""
+        return self._session
+
+    async def configure_measurement_digits(
+        self,
+        measurement_function: DmmFunction,
+        range: float,
+        resolution_digits: float,
+    ) -> None:
+        """Configure the common properties of the measurement."""
+        await _run_in_executor(
+            self._executor,
+            self._session.configure_measurement_digits,
+            measurement_function,
+            range,
+            resolution_digits,
+        )
+
+    async def read(self) -> float:
+        """Acquires a single measurement and returns the measured value."""
+        return await _run_in_executor(self._executor, self._session.read)
+
+    async def read_multiple(self, count: int) -> npt.NDArray[numpy.float64]:
+        """Acquires multiple measurements and returns an array of measured values."""
+        return await _run_in_executor(self._executor, self._session.read_multiple, count)
+
+    async def fetch_multiple(self, count: int) -> npt.NDArray[numpy.float64]:
+        """Returns an array of values from an acquisition that is already in progress."""
+        return await _run_in_executor(self._executor, self._session.fetch_multiple, count)
+
+    async def configure_trigger(
+        self, trigger_source: TriggerLine, trigger_delay: Optional[float] = None
+    ) -> None:
+        """Configure the trigger that starts the measurements acquired by initiate()."""
+        await _run_in_executor(
+            self._executor, self._session.configure_trigger, trigger_source, trigger_delay
+        )
+
+    async def initiate(self) -> None:
+        """Arms the instrument to acquire the configured measurement when it is triggered."""
+        await _run_in_executor(self._executor, self._session.initiate)
+
+    async def fetch(self, timeout: float = 10.0) -> float:
+        """Waits for a measurement started by initiate() and returns the measured value."""
+        return await _run_in_executor(self._executor, self._session.fetch, timeout)
+
+    async def export_measure_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Sends a pulse on the trigger line each time a measurement completes."""
+        await _run_in_executor(
+            self._executor, self._session.export_measure_complete_trigger, output_terminal
+        )
+
+    async def measure_scan(
+        self, scan_list: Sequence[Tuple[DmmFunction, float, float]]
+    ) -> npt.NDArray[numpy.float64]:
+        """Takes one measurement with each configuration in the scan list."""
+        return await _run_in_executor(self._executor, self._session.measure_scan, scan_list)
+
+
+def _get_async_instrument_session(
+    session: DmmBase, executor: concurrent.futures.Executor
+) -> AsyncDmm:
+    """Creates an asyncio DMM HAL object for the DMM session.
+
+    Driver modules can define an AsyncSession class to customize the asyncio wrapper.
+    """
+    driver_module = sys.modules[type(session).__module__]
+    async_session = getattr(driver_module, "AsyncSession", AsyncDmm)
+    return async_session(session, executor)
+
+
+@contextlib.asynccontextmanager
+async def initialize_async(
+    measurement_context: MeasurementContext,
+    pin_name: str,
+    reset_device: bool = False,
+    options: Optional[Dict[str, Any]] = None,
+    initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.AUTO,
+    session_pool: Optional[SessionPool] = None,
+    lock_manager: Optional[InstrumentLockManager] = None,
+) -> AsyncGenerator[AsyncDmm, None]:
+    """Initialize a DMM session for use with asyncio.
+
+    The session is reserved, initialized, and closed on the executor that runs its driver calls.
+
+    Args:
+        measurement_context: Proxy for the Measurement Service's context-local state.
+
+        pin_name: The pin name to which the instrument session need to be connected.
+
+        reset_device: Specifies whether to reset channel(s) during the initialization procedure.
+
+        options: Specifies the initial value of certain properties for the session. If this argument
+            is not specified, the default value is an empty dict.
+
+        initialization_behavior: Specifies whether the NI gRPC Device Server will initialize a new
+            session or attach to an existing session.
+
+        session_pool: Specifies a session pool that keeps the DMM session alive after the
+            measurement. If this argument is not specified, the session is closed or detached when
+            the measurement completes.
+
+        lock_manager: Specifies the lock manager that serializes the measurements in this process
+            that use the same DMM. If this argument is not specified, the lock manager shared by
+            the process is used.
+
+    Yields:
+        An asyncio DMM session.
+    """
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix=f"DmmHAL-{pin_name}"
+    ) as executor:
+        stack = contextlib.ExitStack()
+        session_context = initialize(
+            measurement_context,
+            pin_name,
+            reset_device,
+            options,
+            initialization_behavior,
+            session_pool,
+            lock_manager,
+        )
+        session = await _run_in_executor(executor, stack.enter_context, session_context)
+        try:
+            yield _get_async_instrument_session(session, executor)
+        except BaseException:
+            if not await _run_in_executor(executor, stack.__exit__, *sys.exc_info()):
+                raise
+        else:
+            await _run_in_executor(executor, stack.close)
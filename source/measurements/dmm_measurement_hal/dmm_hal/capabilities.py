@@ -0,0 +1,114 @@
+"""Describes the capabilities of the DMM HAL drivers."""
+
+import bisect
+from enum import Enum
+from types import MappingProxyType
+from typing import FrozenSet, Iterable, Mapping, NamedTuple, Tuple
+
+from dmm_hal.function import Function as DmmFunction
+
+
+class Feature(Enum):
+    """Optional DMM HAL driver features that reduce the cost of a measurement."""
+
+    READ_MULTIPLE = 1
+    """read_multiple() acquires all readings with a single driver call."""
+
+    FETCH_MULTIPLE = 2
+    """fetch_multiple() returns all readings with a single driver call."""
+
+    CONFIGURATION_CACHE = 3
+    """configure_measurement_digits() only sends the properties that changed."""
+
+    COMMAND_BATCHING = 4
+    """Configuration commands are sent in the same message as the next read."""
+
+    BINARY_TRANSFER = 5
+    """Readings can be transferred in binary instead of ASCII."""
+
+    SCAN_LIST = 6
+    """measure_scan() measures the whole scan list with a single instrument transaction."""
+
+    HARDWARE_TRIGGER = 7
+    """configure_trigger(), initiate(), and fetch() take measurements with hardware timing."""
+
+
+class DmmCapabilities(NamedTuple):
+    """The measurement functions, ranges, resolutions, and features supported by a DMM driver.
+
+    Use create_capabilities() to create the lookup tables.
+    """
+
+    functions: FrozenSet[DmmFunction]
+    """The supported measurement functions."""
+
+    ranges: Mapping[DmmFunction, Tuple[float, ...]]
+    """The documented ranges of each measurement function, in ascending order.
+
+    Functions without documented ranges accept any range, which the instrument coerces.
+    """
+
+    resolution_digits: Tuple[float, ...]
+    """The supported resolutions, in digits, in ascending order."""
+
+    features: FrozenSet[Feature]
+    """The supported optional features."""
+
+    def supports_function(self, function: DmmFunction) -> bool:
+        """Returns whether the measurement function is supported."""
+        return function in self.functions
+
+    def supports_resolution_digits(self, resolution_digits: float) -> bool:
+        """Returns whether the resolution is supported."""
+        index = bisect.bisect_left(self.resolution_digits, resolution_digits)
+        return (
+            index < len(self.resolution_digits)
+            and self.resolution_digits[index] == resolution_digits
+        )
+
+    def supports_feature(self, feature: Feature) -> bool:
+        """Returns whether the optional feature is supported."""
+        return feature in self.features
+
+    def select_range(self, function: DmmFunction, value: float) -> float:
+        """Returns the smallest documented range of the function that can measure the value.
+
+        If the function has no documented ranges, the magnitude of the value is returned.
+        """
+        if not self.supports_function(function):
+            raise ValueError(f"Unsupported function value: '{function.name}'.")
+        magnitude = abs(value)
+        ranges = self.ranges.get(function, ())
+        if not ranges:
+            return magnitude
+        index = bisect.bisect_left(ranges, magnitude)
+        if index == len(ranges):
+            raise ValueError(f"Value {value} exceeds the largest {function.name} range.")
+        return ranges[index]
+
+    def select_resolution_digits(self, minimum_resolution_digits: float) -> float:
+        """Returns the fewest supported digits that are at least the requested resolution.
+
+        Fewer digits of resolution result in faster measurements.
+        """
+        index = bisect.bisect_left(self.resolution_digits, minimum_resolution_digits)
+        if index == len(self.resolution_digits):
+            raise ValueError(f"Unsupported resolution: {minimum_resolution_digits} digits.")
+        return self.resolution_digits[index]
+
+
+def create_capabilities(
+    functions: Iterable[DmmFunction],
+    ranges: Mapping[DmmFunction, Iterable[float]],
+    resolution_digits: Iterable[float],
+    features: Iterable[Feature],
+) -> DmmCapabilities:
+    """Create frozen, sorted capability lookup tables for a DMM driver."""
+    return DmmCapabilities(
+        functions=frozenset(functions),
+        ranges=MappingProxyType(
+            {function: tuple(sorted(values)) for function, values in ranges.items()}
+        ),
+        resolution_digits=tuple(sorted(resolution_digits)),
+        features=frozenset(features),
+    )
@@ -1,24 +1,68 @@
 """Declares an abstract class for the DMM HAL and defines DMM session initialization functions."""
 
+from __future__ import annotations
+
+import concurrent.futures
 import contextlib
-import importlib
+import contextvars
+import functools
+import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generator, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    ContextManager,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
+from dmm_hal.capabilities import DmmCapabilities, Feature
+from dmm_hal.driver_registry import get_driver
 from dmm_hal.function import Function as DmmFunction
+from dmm_hal.instrumentation import instrumented_context
+from dmm_hal.lock_manager import InstrumentLockManager, get_lock_manager
+from dmm_hal.trigger_line import TriggerLine
 from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
 from ni_measurement_plugin_sdk_service.session_management import (
     BaseReservation,
+    MultiSessionReservation,
     PinMapContext,
     SessionInformation,
     SessionInitializationBehavior,
     SessionManagementClient,
 )
 
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing as npt
+
+_logger = logging.getLogger(__name__)
+
+
+class ScanStep(NamedTuple):
+    """A measurement in a scan list."""
+
+    function: DmmFunction
+    range: float
+    resolution_digits: float
+
 
 class DmmBase(ABC):
     """Simplified interface for the DMM instrument session."""
 
+    capabilities: ClassVar[DmmCapabilities]
+    """The measurement functions, ranges, resolutions, and features supported by the driver."""
+
     @abstractmethod
     @contextlib.contextmanager
     def _initialize_session(
@@ -31,6 +75,26 @@ class DmmBase(ABC):
         """Initialize a DMM session."""
         pass
 
+    @classmethod
+    @contextlib.contextmanager
+    def _initialize_sessions(
+        cls,
+        reservation: BaseReservation,
+        reset_device: bool,
+        options: Optional[Dict[str, Any]],
+        initialization_behavior: SessionInitializationBehavior,
+    ) -> Generator[List[DmmBase], None, None]:
+        """Initialize the reserved DMM sessions of the driver's instrument type.
+
+        Yields the sessions in the order of the reserved sessions. Drivers that don't override this
+        method support one reserved session of their instrument type.
+        """
+        session = cls()
+        with session._initialize_session(
+            reservation, reset_device, options, initialization_behavior
+        ):
+            yield [session]
+
     @abstractmethod
     def configure_measurement_digits(
         self,
@@ -46,17 +110,342 @@ class DmmBase(ABC):
         """Acquires a single measurement and returns the measured value."""
         pass
 
+    @abstractmethod
+    def read_multiple(self, count: int) -> npt.NDArray[numpy.float64]:
+        """Acquires multiple measurements and returns an array of measured values."""
+        pass
+
+    @abstractmethod
+    def fetch_multiple(self, count: int) -> npt.NDArray[numpy.float64]:
+        """Returns an array of values from an acquisition that is already in progress."""
+        pass
+
+    def configure_trigger(
+        self, trigger_source: TriggerLine, trigger_delay: Optional[float] = None
+    ) -> None:
+        """Configure the trigger that starts the measurements acquired by initiate().
+
+        Drivers that support Feature.HARDWARE_TRIGGER override this method.
+
+        Args:
+            trigger_source: The trigger line that starts each measurement, or IMMEDIATE to start
+                measuring as soon as the acquisition is initiated.
+
+            trigger_delay: The time, in seconds, between the trigger and the measurement. If this
+                argument is not specified, the instrument selects the delay automatically.
+        """
+        self._raise_feature_not_implemented(Feature.HARDWARE_TRIGGER, "configure_trigger")
+
+    def initiate(self) -> None:
+        """Arms the instrument to acquire the configured measurement when it is triggered.
+
+        Drivers that support Feature.HARDWARE_TRIGGER override this method. Use fetch() or
+        fetch_multiple() to return the measured values.
+        """
+        self._raise_feature_not_implemented(Feature.HARDWARE_TRIGGER, "initiate")
+
+    def fetch(self, timeout: float = 10.0) -> float:
+        """Waits for a measurement started by initiate() and returns the measured value.
+
+        Drivers that support Feature.HARDWARE_TRIGGER override this method.
+
+        Args:
+            timeout: The maximum time, in seconds, to wait for the measurement.
+
+        Returns:
+            The measured value.
+        """
+        self._raise_feature_not_implemented(Feature.HARDWARE_TRIGGER, "fetch")
+
+    def export_measure_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Sends a pulse on the trigger line each time a measurement completes.
+
+        Drivers that support Feature.HARDWARE_TRIGGER override this method.
+
+        Args:
+            output_terminal: The trigger line to pulse, or NONE to stop exporting the trigger.
+        """
+        self._raise_feature_not_implemented(
+            Feature.HARDWARE_TRIGGER, "export_measure_complete_trigger"
+        )
+
+    def measure_scan(
+        self, scan_list: Sequence[Tuple[DmmFunction, float, float]]
+    ) -> npt.NDArray[numpy.float64]:
+        """Takes one measurement with each configuration in the scan list.
+
+        Drivers that support Feature.SCAN_LIST measure the whole scan list with a single instrument
+        transaction. Otherwise, each configuration is configured and read in turn.
+
+        Args:
+            scan_list: The measurement function, range, and resolution digits of each
+                measurement, such as ScanStep objects.
+
+        Returns:
+            The measured values, in scan list order.
+        """
+        # Imported here so that importing the HAL doesn't import numpy.
+        import numpy
+
+        measurements = numpy.empty(len(scan_list), dtype=numpy.float64)
+        for index, (function, range, resolution_digits) in enumerate(scan_list):
+            self.configure_measurement_digits(function, range, resolution_digits)
+            measurements[index] = self.read()
+        return measurements
+
+    def _is_session_healthy(self) -> bool:
+        """Returns whether the instrument session can still be used."""
+        return True
+
+    def _reset_cached_state(self) -> None:
+        """Forget any instrument state cached by the session wrapper."""
+        pass
+
+    def _raise_feature_not_implemented(self, feature: Feature, method_name: str) -> NoReturn:
+        """Raise an error for a method that the driver doesn't implement."""
+        if self.capabilities.supports_feature(feature):
+            raise NotImplementedError(
+                f"{type(self).__name__} reports Feature.{feature.name} but does not implement "
+                f"{method_name}()."
+            )
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support Feature.{feature.name}, which is required by "
+            f"{method_name}(). Check capabilities.supports_feature() before calling it."
+        )
+
+
+class _SessionPoolEntry:
+    """A DMM session kept alive by a session pool."""
+
+    def __init__(self, session: DmmBase, exit_stack: contextlib.ExitStack) -> None:
+        self.session = session
+        self.exit_stack = exit_stack
+        self.in_use = True
+        self.needs_health_check = False
+        self.last_used = time.monotonic()
+
+
+class SessionPool:
+    """Keeps initialized DMM sessions alive between measurements.
+
+    Pass a session pool to initialize() to reuse the instrument session of a pin across
+    measurements instead of initializing it in every measurement. Each measurement still reserves
+    the session through the session management service, so only one measurement uses a pooled
+    session at a time.
+
+    Pooled sessions are keyed by session name and are initialized with the arguments of the first
+    measurement that uses them. Sessions that have been idle for longer than idle_timeout seconds
+    are closed. Sessions that have been idle for longer than health_check_interval seconds, or that
+    were in use when an exception was raised, are checked before they are reused and are
+    initialized again if the check fails.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, health_check_interval: float = 10.0) -> None:
+        """Initialize the session pool and start closing idle sessions in the background."""
+        self._idle_timeout = idle_timeout
+        self._health_check_interval = health_check_interval
+        self._entries: Dict[str, _SessionPoolEntry] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._eviction_thread = threading.Thread(
+            target=self._evict_idle_sessions_periodically,
+            name="DmmSessionPoolEviction",
+            daemon=True,
+        )
+        self._eviction_thread.start()
+
+    def __enter__(self) -> "SessionPool":
+        """Context management protocol. Returns self."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context management protocol. Calls close()."""
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled sessions. Sessions that are in use are closed when released."""
+        self._closed.set()
+        self._close_entries(lambda entry: True)
+
+    def evict_idle_sessions(self) -> None:
+        """Close the sessions that have been idle for longer than the idle timeout."""
+        now = time.monotonic()
+        self._close_entries(lambda entry: now - entry.last_used > self._idle_timeout)
+
+    @contextlib.contextmanager
+    def _use_session(
+        self, session_name: str, initialize_session: Callable[[], ContextManager[DmmBase]]
+    ) -> Generator[DmmBase, None, None]:
+        """Yield the pooled session for the session name, initializing it if needed."""
+        if self._closed.is_set():
+            raise RuntimeError("The session pool is closed.")
+
+        entry = self._check_out(session_name)
+        if entry is None:
+            exit_stack = contextlib.ExitStack()
+            session = exit_stack.enter_context(initialize_session())
+            entry = _SessionPoolEntry(session, exit_stack)
+            with self._lock:
+                self._entries[session_name] = entry
+
+        try:
+            yield entry.session
+        except BaseException:
+            entry.needs_health_check = True
+            raise
+        finally:
+            self._check_in(session_name, entry)
+
+    def _check_out(self, session_name: str) -> Optional[_SessionPoolEntry]:
+        with self._lock:
+            entry = self._entries.get(session_name)
+            if entry is None:
+                return None
+            if entry.in_use:
+                raise RuntimeError(f"The pooled session '{session_name}' is already in use.")
+            entry.in_use = True
+
+        idle_time = time.monotonic() - entry.last_used
+        if entry.needs_health_check or idle_time > self._health_check_interval:
+            try:
+                healthy = entry.session._is_session_healthy()
+            except Exception:
+                healthy = False
+            if not healthy:
+                _logger.info("Reinitializing unhealthy pooled session '%s'.", session_name)
+                with self._lock:
+                    del self._entries[session_name]
+                self._close_entry(entry)
+                return None
+            entry.needs_health_check = False
+
+        # Another client may have used the instrument since this session was last used.
+        entry.session._reset_cached_state()
+        return entry
+
+    def _check_in(self, session_name: str, entry: _SessionPoolEntry) -> None:
+        with self._lock:
+            entry.in_use = False
+            entry.last_used = time.monotonic()
+            closed = self._closed.is_set()
+            if closed:
+                del self._entries[session_name]
+        if closed:
+            self._close_entry(entry)
+
+    def _close_entries(self, predicate: Callable[[_SessionPoolEntry], bool]) -> None:
+        with self._lock:
+            session_names = [
+                session_name
+                for session_name, entry in self._entries.items()
+                if not entry.in_use and predicate(entry)
+            ]
+            entries = [self._entries.pop(session_name) for session_name in session_names]
+        for entry in entries:
+            self._close_entry(entry)
+
+    def _close_entry(self, entry: _SessionPoolEntry) -> None:
+        try:
+            entry.exit_stack.close()
+        except Exception:
+            _logger.warning("Failed to close pooled session.", exc_info=True)
+
+    def _evict_idle_sessions_periodically(self) -> None:
+        interval = min(self._idle_timeout, self._health_check_interval)
+        while not self._closed.wait(interval):
+            self.evict_idle_sessions()
+
 
 def _get_instrument_session(instrument_type_id: str) -> DmmBase:
     """Creates a DMM HAL object based on the instrument type id."""
-    try:
-        driver_module_path = f"dmm_hal.{instrument_type_id}.{instrument_type_id}".lower()
-        driver_module = importlib.import_module(driver_module_path)
-        session = getattr(driver_module, "Session")
-        return session()
+    return get_driver(instrument_type_id)()
 
-    except ImportError:
-        raise ValueError(f"No driver found for instrument type: '{instrument_type_id}'.")
+
+def get_capabilities(instrument_type_id: str) -> DmmCapabilities:
+    """Returns the capabilities of the DMM HAL driver for the instrument type id.
+
+    Args:
+        instrument_type_id: The instrument type id from the pin map, such as 'niDMM' or
+            'KeysightDmm'.
+
+    Returns:
+        The measurement functions, ranges, resolutions, and features supported by the driver.
+    """
+    return get_driver(instrument_type_id).capabilities
+
+
+@contextlib.contextmanager
+def _initialize_instrument_session(
+    reservation: BaseReservation,
+    instrument_type_id: str,
+    reset_device: bool,
+    options: Optional[Dict[str, Any]],
+    initialization_behavior: SessionInitializationBehavior,
+) -> Generator[DmmBase, None, None]:
+    session = _get_instrument_session(instrument_type_id)
+    with session._initialize_session(reservation, reset_device, options, initialization_behavior):
+        yield session
+
+
+def _get_instrument_type_ids(session_infos: Sequence[SessionInformation]) -> List[str]:
+    """Returns the instrument type ids of the sessions in the order of their first session."""
+    return list(dict.fromkeys(session_info.instrument_type_id for session_info in session_infos))
+
+
+def _initialize_and_close_sessions(
+    reservation: MultiSessionReservation,
+    reset_device: bool,
+    options: Optional[Dict[str, Any]],
+    initialization_behavior: SessionInitializationBehavior,
+    max_workers: int,
+) -> None:
+    """Initialize and close the reserved sessions, using up to max_workers threads.
+
+    The driver of each instrument type initializes all of the reserved sessions of that type, so
+    the instrument types are processed in parallel. The time taken by each instrument type is
+    logged. When instrument types are processed in parallel, every instrument type is processed
+    even if some of them fail, and the errors are reported in the order of the reserved sessions.
+    """
+
+    def initialize_and_close(instrument_type_id: str) -> None:
+        start_time = time.perf_counter()
+        with get_driver(instrument_type_id)._initialize_sessions(
+            reservation, reset_device, options, initialization_behavior
+        ) as sessions:
+            pass
+        _logger.info(
+            "Processed %d '%s' sessions in %.3f s.",
+            len(sessions),
+            instrument_type_id,
+            time.perf_counter() - start_time,
+        )
+
+    instrument_type_ids = _get_instrument_type_ids(reservation.session_info)
+    if max_workers <= 1:
+        for instrument_type_id in instrument_type_ids:
+            initialize_and_close(instrument_type_id)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Each thread needs a copy of the context variables that hold the RPC state.
+        futures = [
+            executor.submit(contextvars.copy_context().run, initialize_and_close, type_id)
+            for type_id in instrument_type_ids
+        ]
+
+    errors: List[Tuple[str, BaseException]] = []
+    for instrument_type_id, future in zip(instrument_type_ids, futures):
+        error = future.exception()
+        if error is not None:
+            errors.append((instrument_type_id, error))
+    if len(errors) == 1:
+        raise errors[0][1]
+    elif errors:
+        details = "\n".join(f"  {type_id}: {error}" for type_id, error in errors)
+        first_error = errors[0][1]
+        raise RuntimeError(
+            f"Failed to process the sessions of {len(errors)} instrument types:\n{details}"
+        ) from first_error
 
 
 @contextlib.contextmanager
@@ -66,6 +455,8 @@ def initialize(
     reset_device: bool = False,
     options: Optional[Dict[str, Any]] = None,
     initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.AUTO,
+    session_pool: Optional[SessionPool] = None,
+    lock_manager: Optional[InstrumentLockManager] = None,
 ) -> Generator[DmmBase, None, None]:
     """Initialize a DMM session.
 
@@ -82,14 +473,45 @@ def initialize(
         initialization_behavior: Specifies whether the NI gRPC Device Server will initialize a new
             session or attach to an existing session.
 
+        session_pool: Specifies a session pool that keeps the DMM session alive after the
+            measurement. If this argument is not specified, the session is closed or detached when
+            the measurement completes.
+
+        lock_manager: Specifies the lock manager that serializes the measurements in this process
+            that use the same DMM. If this argument is not specified, the lock manager shared by
+            the process is used.
+
     Yields:
         A DMM session.
     """
-    with measurement_context.reserve_session(pin_name) as reservation:
-        session = _get_instrument_session(reservation.session_info.instrument_type_id)
-        with session._initialize_session(
-            reservation, reset_device, options, initialization_behavior
-        ):
+    if lock_manager is None:
+        lock_manager = get_lock_manager()
+    pin_map_context = measurement_context.pin_map_context
+    with lock_manager.reserve_and_lock(
+        (pin_map_context.pin_map_id, tuple(pin_map_context.sites or ()), (pin_name,)),
+        lambda: instrumented_context(
+            measurement_context.reserve_session(pin_name), "reserve_session", "unreserve_session"
+        ),
+        lambda reservation: [reservation.session_info],
+    ) as reservation:
+        session_info = reservation.session_info
+        initialize_session = functools.partial(
+            _initialize_instrument_session,
+            reservation,
+            session_info.instrument_type_id,
+            reset_device,
+            options,
+            initialization_behavior,
+        )
+        if session_pool is None:
+            session_context = initialize_session()
+        else:
+            session_context = session_pool._use_session(
+                session_info.session_name, initialize_session
+            )
+        with instrumented_context(
+            session_context, "initialize_session", "close_session"
+        ) as session:
             yield session
 
 
@@ -100,6 +522,7 @@ def create_dmm_sessions(
     reset_device: bool = True,
     options: Optional[Dict[str, Any]] = None,
     initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.INITIALIZE_SESSION_THEN_DETACH,
+    max_workers: int = 1,
 ) -> Generator[List[SessionInformation], None, None]:
     """Initialize all the available instrument session(s).
 
@@ -117,16 +540,17 @@ def create_dmm_sessions(
         initialization_behavior: Specifies whether the NI gRPC Device Server will initialize a new
             session or attach to an existing session.
 
+        max_workers: Specifies the maximum number of instrument types whose sessions are
+            processed in parallel. If this argument is not specified, the instrument types are
+            processed one at a time.
+
     Yields:
         A List of session information.
     """
     with session_management_client.reserve_sessions(pin_map_context) as reservation:
-        for session_info in reservation.session_info:
-            session = _get_instrument_session(session_info.instrument_type_id)
-            with session._initialize_session(
-                reservation, reset_device, options, initialization_behavior
-            ):
-                pass
+        _initialize_and_close_sessions(
+            reservation, reset_device, options, initialization_behavior, max_workers
+        )
         yield reservation.session_info
 
 
@@ -136,6 +560,7 @@ def destroy_dmm_sessions(
     reset_device: bool = False,
     options: Optional[Dict[str, Any]] = None,
     initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.ATTACH_TO_SESSION_THEN_CLOSE,
+    max_workers: int = 1,
 ) -> Generator[List[SessionInformation], None, None]:
     """Destroy the existing instrument session(s).
 
@@ -151,14 +576,15 @@ def destroy_dmm_sessions(
         initialization_behavior: Specifies whether the NI gRPC Device Server will initialize a new
             session or attach to an existing session.
 
+        max_workers: Specifies the maximum number of instrument types whose sessions are
+            processed in parallel. If this argument is not specified, the instrument types are
+            processed one at a time.
+
     Yields:
         A List of session information.
     """
     with session_management_client.reserve_all_registered_sessions() as reservation:
-        for session_info in reservation.session_info:
-            session = _get_instrument_session(session_info.instrument_type_id)
-            with session._initialize_session(
-                reservation, reset_device, options, initialization_behavior
-            ):
-                pass
+        _initialize_and_close_sessions(
+            reservation, reset_device, options, initialization_behavior, max_workers
+        )
         yield reservation.session_info
@@ -0,0 +1,119 @@
+"""Maps instrument type ids to DMM HAL driver classes.
+
+The registry contains the built-in drivers, the drivers registered with register_driver(), and the
+drivers advertised by installed packages in the 'dmm_hal.drivers' entry point group. The entry
+point name is the instrument type id and the entry point value refers to the driver's Session
+class, for example:
+
+    [project.entry-points."dmm_hal.drivers"]
+    MyDmm = "my_package.my_dmm:Session"
+
+Drivers are imported the first time a session with their instrument type id is initialized, so
+the packages used by other drivers are not imported.
+"""
+
+import importlib
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, List, Type, Union
+
+if TYPE_CHECKING:
+    import importlib.metadata
+
+    from dmm_hal.dmm import DmmBase
+
+ENTRY_POINT_GROUP = "dmm_hal.drivers"
+
+_BUILTIN_DRIVERS = {
+    "niDMM": "dmm_hal.nidmm.nidmm:Session",
+    "KeysightDmm": "dmm_hal.keysightdmm.keysightdmm:Session",
+}
+
+# Loaders and loaded driver classes, keyed by lowercase instrument type id. Instrument type ids
+# are not case sensitive.
+_driver_loaders: Dict[str, Callable[[], Type["DmmBase"]]] = {}
+_driver_classes: Dict[str, Type["DmmBase"]] = {}
+_populated = False
+_lock = threading.Lock()
+
+
+def register_driver(
+    instrument_type_id: str, driver: Union[Type["DmmBase"], str], replace: bool = False
+) -> None:
+    """Register a DMM HAL driver for an instrument type id.
+
+    Args:
+        instrument_type_id: The instrument type id from the pin map.
+
+        driver: The driver's Session class, or a 'module:attribute' reference to it that is
+            imported the first time a session is initialized.
+
+        replace: Specifies whether to replace a driver that is already registered for the
+            instrument type id.
+    """
+    key = instrument_type_id.lower()
+    with _lock:
+        _populate()
+        if not replace and key in _driver_loaders:
+            raise ValueError(f"A driver is already registered for '{instrument_type_id}'.")
+        if isinstance(driver, str):
+            _driver_loaders[key] = _create_loader(driver)
+        else:
+            _driver_loaders[key] = lambda: driver
+        _driver_classes.pop(key, None)
+
+
+def get_driver(instrument_type_id: str) -> Type["DmmBase"]:
+    """Returns the DMM HAL driver class for an instrument type id, importing it if needed.
+
+    Raises:
+        ValueError: If no driver is registered for the instrument type id.
+    """
+    key = instrument_type_id.lower()
+    driver_class = _driver_classes.get(key)
+    if driver_class is not None:
+        return driver_class
+
+    with _lock:
+        _populate()
+        driver_class = _driver_classes.get(key)
+        if driver_class is None:
+            loader = _driver_loaders.get(key)
+            if loader is None:
+                raise ValueError(f"No driver found for instrument type: '{instrument_type_id}'.")
+            # Import errors from a registered driver are not hidden.
+            driver_class = loader()
+            _driver_classes[key] = driver_class
+        return driver_class
+
+
+def _populate() -> None:
+    """Add the built-in drivers and the entry point drivers. Requires the lock."""
+    global _populated
+    if _populated:
+        return
+    for instrument_type_id, reference in _BUILTIN_DRIVERS.items():
+        _driver_loaders.setdefault(instrument_type_id.lower(), _create_loader(reference))
+    for entry_point in _get_entry_points():
+        _driver_loaders.setdefault(entry_point.name.lower(), entry_point.load)
+    _populated = True
+
+
+def _create_loader(reference: str) -> Callable[[], Type["DmmBase"]]:
+    module_name, _, attribute_name = reference.partition(":")
+
+    def load() -> Type["DmmBase"]:
+        module = importlib.import_module(module_name)
+        return getattr(module, attribute_name or "Session")
+
+    return load
+
+
+def _get_entry_points() -> List["importlib.metadata.EntryPoint"]:
+    # importlib.metadata is slow to import, so it is imported when the first session is created.
+    import importlib.metadata
+
+    entry_points = importlib.metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=ENTRY_POINT_GROUP))
+    # Python 3.9 returns a dictionary of entry points, keyed by group.
+    return list(entry_points.get(ENTRY_POINT_GROUP, []))  # type: ignore[attr-defined]
@@ -0,0 +1,278 @@
+"""Defines opt-in latency instrumentation for the DMM HAL.
+
+Instrumentation is disabled by default. Call enable_instrumentation() to record the duration of
+each phase of a measurement, such as reserving and initializing the session, configuring, reading,
+and closing the session, along with the number of instrument round trips made by each phase. The
+recorded histograms can be queried in-process with Instrumentation.histograms(). When an
+OpenTelemetry tracer is passed to enable_instrumentation(), each phase is also reported as a span.
+"""
+
+import bisect
+import contextlib
+import functools
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+_T = TypeVar("_T")
+
+# Upper bounds of the duration histogram buckets, in seconds, from 1 us to about 134 s.
+_DURATION_BUCKET_BOUNDS = tuple(1e-6 * 2**exponent for exponent in range(28))
+# Upper bounds of the round trip count histogram buckets.
+_COUNT_BUCKET_BOUNDS = (0.0, 1.0, 2.0, 3.0, 4.0, 6.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0)
+
+
+class HistogramSnapshot(NamedTuple):
+    """The values recorded by a histogram."""
+
+    sample_count: int
+    total: float
+    minimum: float
+    maximum: float
+    bucket_bounds: Tuple[float, ...]
+    bucket_counts: Tuple[int, ...]
+
+    @property
+    def mean(self) -> float:
+        """The mean of the recorded values, or NaN if no values were recorded."""
+        return self.total / self.sample_count if self.sample_count else float("nan")
+
+    def percentile(self, percent: float) -> float:
+        """Returns an upper bound for the given percentile of the recorded values.
+
+        The result is the upper bound of the bucket that contains the percentile, limited to the
+        maximum recorded value.
+        """
+        if not 0.0 <= percent <= 100.0:
+            raise ValueError(f"Invalid percentile: {percent}")
+        if not self.sample_count:
+            return float("nan")
+        rank = percent / 100.0 * self.sample_count
+        cumulative_count = 0
+        for bound, bucket_count in zip(self.bucket_bounds, self.bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank and cumulative_count > 0:
+                return min(bound, self.maximum)
+        return self.maximum
+
+
+class _Histogram:
+    """A histogram with fixed bucket bounds. The last bucket has no upper bound."""
+
+    def __init__(self, bucket_bounds: Tuple[float, ...]) -> None:
+        self._bucket_bounds = bucket_bounds
+        self._bucket_counts = [0] * (len(bucket_bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._minimum = float("inf")
+        self._maximum = float("-inf")
+
+    def record(self, value: float) -> None:
+        self._bucket_counts[bisect.bisect_left(self._bucket_bounds, value)] += 1
+        self._count += 1
+        self._total += value
+        self._minimum = min(self._minimum, value)
+        self._maximum = max(self._maximum, value)
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            self._count,
+            self._total,
+            self._minimum,
+            self._maximum,
+            self._bucket_bounds + (float("inf"),),
+            tuple(self._bucket_counts),
+        )
+
+
+class _ActivePhase:
+    """A phase that is in progress on the current thread."""
+
+    def __init__(self) -> None:
+        self.round_trips = 0
+
+
+class Instrumentation:
+    """Records the duration and round trip count of each measurement phase.
+
+    Durations are recorded in seconds in histograms named after the phase. The number of
+    instrument round trips made by each phase is recorded in a histogram named
+    '<phase>.round_trips', the duration of each round trip in a histogram named
+    'round_trip.<operation>', and the time spent waiting for instrument locks in a histogram named
+    'instrument_lock_wait'.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        """Initialize the instrumentation.
+
+        Args:
+            tracer: Specifies an OpenTelemetry tracer, or an object with a compatible
+                start_as_current_span() method, used to report each phase as a span. If this
+                argument is not specified, no spans are reported.
+        """
+        self._tracer = tracer
+        self._histograms: Dict[str, _Histogram] = {}
+        self._lock = threading.Lock()
+        self._thread_local = threading.local()
+
+    def histograms(self) -> Dict[str, HistogramSnapshot]:
+        """Returns a snapshot of the recorded histograms, keyed by name."""
+        with self._lock:
+            return {name: histogram.snapshot() for name, histogram in self._histograms.items()}
+
+    def reset(self) -> None:
+        """Discard the recorded histograms."""
+        with self._lock:
+            self._histograms.clear()
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Record the duration and round trip count of the code in the with statement."""
+        active_phases = self._get_active_phases()
+        active_phase = _ActivePhase()
+        active_phases.append(active_phase)
+        span_context: ContextManager[Any] = (
+            contextlib.nullcontext()
+            if self._tracer is None
+            else self._tracer.start_as_current_span(name)
+        )
+        try:
+            with span_context as span:
+                start_time = time.perf_counter()
+                try:
+                    yield
+                finally:
+                    duration = time.perf_counter() - start_time
+                    if span is not None:
+                        span.set_attribute("round_trips", active_phase.round_trips)
+        finally:
+            active_phases.pop()
+        with self._lock:
+            self._record(name, duration, _DURATION_BUCKET_BOUNDS)
+            self._record(f"{name}.round_trips", active_phase.round_trips, _COUNT_BUCKET_BOUNDS)
+
+    def record_round_trip(self, operation: str, duration: float) -> None:
+        """Record an instrument round trip made by the phases in progress on this thread."""
+        for active_phase in self._get_active_phases():
+            active_phase.round_trips += 1
+        with self._lock:
+            self._record(f"round_trip.{operation}", duration, _DURATION_BUCKET_BOUNDS)
+
+    def record_lock_wait(self, duration: float) -> None:
+        """Record the time spent waiting for instrument locks."""
+        with self._lock:
+            self._record("instrument_lock_wait", duration, _DURATION_BUCKET_BOUNDS)
+
+    def _get_active_phases(self) -> List[_ActivePhase]:
+        try:
+            return self._thread_local.active_phases
+        except AttributeError:
+            active_phases: List[_ActivePhase] = []
+            self._thread_local.active_phases = active_phases
+            return active_phases
+
+    def _record(self, name: str, value: float, bucket_bounds: Tuple[float, ...]) -> None:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = _Histogram(bucket_bounds)
+        histogram.record(value)
+
+
+_instrumentation: Optional[Instrumentation] = None
+
+
+def enable_instrumentation(tracer: Optional[Any] = None) -> Instrumentation:
+    """Start recording measurement phase timings and return the instrumentation.
+
+    Args:
+        tracer: Specifies an OpenTelemetry tracer used to report each phase as a span. If this
+            argument is not specified, no spans are reported.
+
+    Returns:
+        The instrumentation that records the histograms.
+    """
+    global _instrumentation
+    _instrumentation = Instrumentation(tracer)
+    return _instrumentation
+
+
+def disable_instrumentation() -> None:
+    """Stop recording measurement phase timings."""
+    global _instrumentation
+    _instrumentation = None
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    """Returns the enabled instrumentation, or None if instrumentation is disabled."""
+    return _instrumentation
+
+
+def instrumented(function: _F) -> _F:
+    """Record each call of a driver method as a phase named '<driver module>.<method name>'."""
+    phase_name = f"{function.__module__.rsplit('.', 1)[-1]}.{function.__name__}"
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        instrumentation = _instrumentation
+        if instrumentation is None:
+            return function(*args, **kwargs)
+        with instrumentation.phase(phase_name):
+            return function(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def instrumented_context(
+    context: ContextManager[_T], enter_phase_name: str, exit_phase_name: str
+) -> ContextManager[_T]:
+    """Record entering and exiting a context manager as separate phases."""
+    instrumentation = _instrumentation
+    if instrumentation is None:
+        return context
+    return _instrumented_context(instrumentation, context, enter_phase_name, exit_phase_name)
+
+
+@contextlib.contextmanager
+def _instrumented_context(
+    instrumentation: Instrumentation,
+    context: ContextManager[_T],
+    enter_phase_name: str,
+    exit_phase_name: str,
+) -> Generator[_T, None, None]:
+    with instrumentation.phase(enter_phase_name):
+        value = context.__enter__()
+    try:
+        yield value
+    except BaseException as e:
+        with instrumentation.phase(exit_phase_name):
+            if not context.__exit__(type(e), e, e.__traceback__):
+                raise
+    else:
+        with instrumentation.phase(exit_phase_name):
+            context.__exit__(None, None, None)
+
+
+def record_round_trip(operation: str, duration: float) -> None:
+    """Record an instrument round trip if instrumentation is enabled."""
+    instrumentation = _instrumentation
+    if instrumentation is not None:
+        instrumentation.record_round_trip(operation, duration)
+
+
+def record_lock_wait(duration: float) -> None:
+    """Record the time spent waiting for instrument locks if instrumentation is enabled."""
+    instrumentation = _instrumentation
+    if instrumentation is not None:
+        instrumentation.record_lock_wait(duration)
@@ -1,10 +1,15 @@
+import functools
 import logging
+from typing import NamedTuple, Set
 
+import pyvisa.errors
 from decouple import AutoConfig
+from dmm_hal.instrumentation import record_round_trip
 from dmm_hal.keysightdmm._keysight_dmm import Session
 from dmm_hal.utilities._visa_grpc import (
     build_visa_grpc_resource_string,
     get_visa_grpc_insecure_address,
+    invalidate_visa_grpc_address,
 )
 from ni_measurement_plugin_sdk_service.discovery import DiscoveryClient
 from ni_measurement_plugin_sdk_service.session_management import (
@@ -14,6 +19,38 @@ from ni_measurement_plugin_sdk_service.session_management import (
 
 _logger = logging.getLogger(__name__)
 
+_ATTACH_INITIALIZATION_BEHAVIORS = {
+    SessionInitializationBehavior.ATTACH_TO_SERVER_SESSION,
+    SessionInitializationBehavior.ATTACH_TO_SESSION_THEN_CLOSE,
+}
+
+# Resource names of the instruments whose ID query has succeeded in this process.
+_validated_resource_names: Set[str] = set()
+
+
+class _KeysightDmmConfig(NamedTuple):
+    """Keysight DMM settings read from the config."""
+
+    simulate: bool
+    binary_transfer: bool
+    strict_error_checking: bool
+    fast_attach: bool
+
+
+@functools.lru_cache(maxsize=None)
+def _get_keysight_dmm_config(config: AutoConfig) -> _KeysightDmmConfig:
+    """Read the Keysight DMM settings once for each config object."""
+    return _KeysightDmmConfig(
+        simulate=config("MEASUREMENT_PLUGIN_VISA_DMM_SIMULATE", default=False, cast=bool),
+        binary_transfer=config(
+            "MEASUREMENT_PLUGIN_VISA_DMM_BINARY_TRANSFER", default=False, cast=bool
+        ),
+        strict_error_checking=config(
+            "MEASUREMENT_PLUGIN_VISA_DMM_STRICT_ERROR_CHECKING", default=False, cast=bool
+        ),
+        fast_attach=config("MEASUREMENT_PLUGIN_VISA_DMM_FAST_ATTACH", default=True, cast=bool),
+    )
+
 
 class KeysightDmmSessionConstructor:
     """Measurement plug-in session constructor for Keysight DMM sessions."""
@@ -32,11 +69,9 @@ class KeysightDmmSessionConstructor:
         self._reset_device = reset_device
 
         # Hack: config is a parameter for now so TestStand code modules use the right config path.
-        self._visa_dmm_simulate: bool = config(
-            "MEASUREMENT_PLUGIN_VISA_DMM_SIMULATE", default=False, cast=bool
-        )
+        self._visa_dmm_config = _get_keysight_dmm_config(config)
 
-        if self._visa_dmm_simulate:
+        if self._visa_dmm_config.simulate:
             # _keysight_dmm_sim.yaml doesn't include the grpc:// resource names.
             _logger.debug("Not using NI gRPC Device Server due to simulation")
             self._address = ""
@@ -50,7 +85,11 @@ class KeysightDmmSessionConstructor:
     def __call__(self, session_info: SessionInformation) -> Session:
         """Construct a Keysight DMM session based on measurement plug-in session info."""
         resource_name = session_info.resource_name
+        shared_resource_key = None
         if self._address:
+            # Sessions in this process that use the same NI gRPC Device Server session share the
+            # same VISA resource.
+            shared_resource_key = session_info.session_name
             resource_name = build_visa_grpc_resource_string(
                 resource_name,
                 self._address,
@@ -58,5 +97,41 @@ class KeysightDmmSessionConstructor:
                 self._initialization_behavior,
             )
 
+        # When attaching to an existing session, the instrument has already been validated and
+        # configured by the client that initialized the session.
+        fast_attach = self._visa_dmm_config.fast_attach and self._is_attaching(session_info)
+        id_query = not fast_attach and session_info.resource_name not in _validated_resource_names
+        reset_device = self._reset_device and not fast_attach
+
         _logger.debug("Keysight resource name: %s", resource_name)
-        return Session(resource_name, self._reset_device, simulate=self._visa_dmm_simulate)
+        try:
+            session = Session(
+                resource_name,
+                id_query=id_query,
+                reset_device=reset_device,
+                simulate=self._visa_dmm_config.simulate,
+                binary_transfer=self._visa_dmm_config.binary_transfer,
+                strict_error_checking=self._visa_dmm_config.strict_error_checking,
+                round_trip_observer=record_round_trip,
+                shared_resource_key=shared_resource_key,
+            )
+        except pyvisa.errors.VisaIOError:
+            if self._address:
+                # NI gRPC Device Server may have moved to a different address.
+                invalidate_visa_grpc_address()
+            raise
+
+        if id_query:
+            _validated_resource_names.add(session_info.resource_name)
+        return session
+
+    def _is_attaching(self, session_info: SessionInformation) -> bool:
+        """Returns whether the session attaches to an existing NI gRPC Device Server session."""
+        if not self._address:
+            return False
+        if self._initialization_behavior in _ATTACH_INITIALIZATION_BEHAVIORS:
+            return True
+        return (
+            self._initialization_behavior == SessionInitializationBehavior.AUTO
+            and session_info.session_exists
+        )
@@ -4,15 +4,21 @@ from __future__ import annotations
 
 import contextlib
 import pathlib
-from typing import Any, Dict, Generator, Optional
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Generator, List, Optional, Sequence, Tuple
 
+import numpy
+import numpy.typing as npt
 from decouple import AutoConfig
+from dmm_hal.capabilities import DmmCapabilities, Feature, create_capabilities
 from dmm_hal.dmm import DmmBase
 from dmm_hal.function import Function as DmmFunction
+from dmm_hal.instrumentation import instrumented
 from dmm_hal.keysightdmm import _keysight_dmm
 from dmm_hal.keysightdmm._keysight_dmm_session_management import (
     KeysightDmmSessionConstructor,
 )
+from dmm_hal.trigger_line import TriggerLine
 from ni_measurement_plugin_sdk_service.session_management import (
     BaseReservation,
     SessionInitializationBehavior,
@@ -21,10 +27,51 @@ from ni_measurement_plugin_sdk_service.session_management import (
 # Search for the `.env` file starting with the current directory.
 _config = AutoConfig(str(pathlib.Path.cwd()))
 
+_FUNCTION_TO_KEYSIGHT_DMM_FUNCTION = MappingProxyType(
+    {
+        DmmFunction[function.name]: function
+        for function in _keysight_dmm.Function
+        if function.name in DmmFunction.__members__
+    }
+)
+
+_CAPABILITIES = create_capabilities(
+    functions=_FUNCTION_TO_KEYSIGHT_DMM_FUNCTION.keys(),
+    # Ranges of the Keysight 34401A.
+    ranges={
+        DmmFunction.DC_VOLTS: (0.1, 1.0, 10.0, 100.0, 1000.0),
+        DmmFunction.AC_VOLTS: (0.1, 1.0, 10.0, 100.0, 750.0),
+    },
+    resolution_digits=_keysight_dmm._RESOLUTION_DIGITS_TO_VALUE.keys(),
+    features=(
+        Feature.READ_MULTIPLE,
+        Feature.FETCH_MULTIPLE,
+        Feature.CONFIGURATION_CACHE,
+        Feature.COMMAND_BATCHING,
+        Feature.BINARY_TRANSFER,
+        Feature.SCAN_LIST,
+        Feature.HARDWARE_TRIGGER,
+    ),
+)
+
+
+def _get_keysight_dmm_function(
+    measurement_function: DmmFunction, resolution_digits: float
+) -> _keysight_dmm.Function:
+    """Validate the measurement configuration and return the Keysight DMM function."""
+    keysight_dmm_function = _FUNCTION_TO_KEYSIGHT_DMM_FUNCTION.get(measurement_function)
+    if keysight_dmm_function is None:
+        raise ValueError(f"Invalid function value: '{measurement_function.name}'.")
+    if not _CAPABILITIES.supports_resolution_digits(resolution_digits):
+        raise ValueError(f"Invalid resolution digits: {resolution_digits}.")
+    return keysight_dmm_function
+
 
 class Session(DmmBase):
     """NI-VISA session wrapper for Keysight DMM."""
 
+    capabilities: ClassVar[DmmCapabilities] = _CAPABILITIES
+
     @contextlib.contextmanager
     def _initialize_session(
         self,
@@ -55,6 +102,31 @@ class Session(DmmBase):
             self._session = session_info.session
             yield
 
+    @classmethod
+    @contextlib.contextmanager
+    def _initialize_sessions(
+        cls,
+        reservation: BaseReservation,
+        reset_device: bool,
+        options: Optional[Dict[str, Any]],
+        initialization_behavior: SessionInitializationBehavior,
+    ) -> Generator[List[DmmBase], None, None]:
+        """Initialize the reserved Keysight DMM sessions."""
+        session_constructor = KeysightDmmSessionConstructor(
+            _config, reservation._discovery_client, reset_device, initialization_behavior
+        )
+
+        with reservation.initialize_sessions(
+            session_constructor, _keysight_dmm.INSTRUMENT_TYPE_ID
+        ) as session_infos:
+            sessions: List[DmmBase] = []
+            for session_info in session_infos:
+                session = cls()
+                session._session = session_info.session
+                sessions.append(session)
+            yield sessions
+
+    @instrumented
     def configure_measurement_digits(
         self,
         measurement_function: DmmFunction,
@@ -70,19 +142,12 @@ class Session(DmmBase):
 
             resolution_digits: The number of digits to which the measurement is rounded.
         """
-        try:
-            self._validate_measurement_type(measurement_function)
-
-            """These properties include method, range, and resolution_digits."""
-            keysight_dmm_function = _keysight_dmm.Function(measurement_function.value)
+        keysight_dmm_function = _get_keysight_dmm_function(measurement_function, resolution_digits)
 
-            self._session.configure_measurement_digits(
-                keysight_dmm_function, range, resolution_digits
-            )
-
-        except ValueError:
-            raise ValueError(f"Invalid function value: '{measurement_function.name}'.")
+        """These properties include method, range, and resolution_digits."""
+        self._session.configure_measurement_digits(keysight_dmm_function, range, resolution_digits)
 
+    @instrumented
     def read(self) -> float:
         """Acquires a single measurement and returns the measured value.
 
@@ -91,7 +156,111 @@ class Session(DmmBase):
         """
         return self._session.read()
 
-    def _validate_measurement_type(self, measurement_type: DmmFunction) -> None:
-        function_names = [func.name for func in DmmFunction]
-        if measurement_type.name not in function_names:
-            raise ValueError(f"Invalid function value: {measurement_type.name}")
+    @instrumented
+    def read_multiple(self, count: int) -> npt.NDArray[numpy.float64]:
+        """Acquires multiple measurements and returns an array of measured values.
+
+        Args:
+            count: The number of measurements to acquire.
+
+        Returns:
+            The measured values.
+        """
+        return self._session.read_multiple(count)
+
+    @instrumented
+    def fetch_multiple(self, count: int) -> npt.NDArray[numpy.float64]:
+        """Returns an array of values from an acquisition that is already in progress.
+
+        Args:
+            count: The number of measurements to fetch.
+
+        Returns:
+            The measured values.
+        """
+        return self._session.fetch_multiple(count)
+
+    @instrumented
+    def configure_trigger(
+        self, trigger_source: TriggerLine, trigger_delay: Optional[float] = None
+    ) -> None:
+        """Configure the trigger that starts the measurements acquired by initiate().
+
+        The Keysight DMM has a single external trigger input, so every trigger line other than
+        IMMEDIATE selects `TRIG:SOUR EXT`. Route the trigger line to the Ext Trig connector.
+        Configure the trigger after the measurement because changing the measurement function
+        resets it.
+
+        Args:
+            trigger_source: The trigger line that starts each measurement, or IMMEDIATE to start
+                measuring as soon as the acquisition is initiated.
+
+            trigger_delay: The time, in seconds, between the trigger and the measurement. If this
+                argument is not specified, the instrument selects the delay automatically.
+        """
+        if trigger_source == TriggerLine.NONE:
+            raise ValueError(f"Invalid trigger source: '{trigger_source.name}'.")
+        if trigger_source == TriggerLine.IMMEDIATE:
+            source = _keysight_dmm.TriggerSource.IMMEDIATE
+        else:
+            source = _keysight_dmm.TriggerSource.EXTERNAL
+        self._session.configure_trigger(source, trigger_delay)
+
+    @instrumented
+    def initiate(self) -> None:
+        """Arms the instrument to acquire the configured measurement when it is triggered."""
+        self._session.initiate()
+
+    @instrumented
+    def fetch(self, timeout: float = 10.0) -> float:
+        """Waits for a measurement started by initiate() and returns the measured value.
+
+        Args:
+            timeout: The maximum time, in seconds, to wait for the measurement.
+
+        Returns:
+            The measured value.
+        """
+        return self._session.fetch(timeout)
+
+    def export_measure_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Sends a pulse on the trigger line each time a measurement completes.
+
+        The Keysight DMM always pulses its VM Comp connector when a measurement completes, so the
+        only supported output terminal is EXTERNAL. Route the VM Comp connector to the trigger line.
+
+        Args:
+            output_terminal: The trigger line to pulse. It must be EXTERNAL.
+        """
+        if output_terminal != TriggerLine.EXTERNAL:
+            raise ValueError(f"Invalid output terminal: '{output_terminal.name}'.")
+
+    @instrumented
+    def measure_scan(
+        self, scan_list: Sequence[Tuple[DmmFunction, float, float]]
+    ) -> npt.NDArray[numpy.float64]:
+        """Takes one measurement with each configuration in the scan list.
+
+        The configuration commands and a READ? query for each measurement are sent to the
+        instrument in a single message.
+
+        Args:
+            scan_list: The measurement function, range, and resolution digits of each
+                measurement, such as ScanStep objects.
+
+        Returns:
+            The measured values, in scan list order.
+        """
+        configurations = [
+            (_get_keysight_dmm_function(function, resolution_digits), range, resolution_digits)
+            for function, range, resolution_digits in scan_list
+        ]
+        return self._session.measure_scan(configurations)
+
+    def _is_session_healthy(self) -> bool:
+        """Returns whether the instrument session can still be used."""
+        return self._session.query_operation_complete()
+
+    def _reset_cached_state(self) -> None:
+        """Forget any instrument state cached by the session wrapper."""
+        self._session.invalidate_cached_state()
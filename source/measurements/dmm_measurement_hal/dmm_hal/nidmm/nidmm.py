@@ -1,20 +1,81 @@
 """NI-DMM session wrapper."""
 
 import contextlib
-from typing import Any, Dict, Generator, Optional
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Generator, List, NamedTuple, Optional, Sequence, Tuple
 
+import hightime
 import nidmm
+import numpy
+import numpy.typing as npt
+from dmm_hal.capabilities import DmmCapabilities, Feature, create_capabilities
 from dmm_hal.dmm import DmmBase
 from dmm_hal.function import Function as DmmFunction
+from dmm_hal.instrumentation import instrumented
+from dmm_hal.trigger_line import TriggerLine
 from ni_measurement_plugin_sdk_service.session_management import (
     BaseReservation,
     SessionInitializationBehavior,
 )
 
 
+_FUNCTION_TO_NIDMM_FUNCTION = MappingProxyType(
+    {
+        DmmFunction[function.name]: function
+        for function in nidmm.Function
+        if function.name in DmmFunction.__members__
+    }
+)
+
+_TRIGGER_LINE_TO_NIDMM_TRIGGER_SOURCE = MappingProxyType(
+    {
+        TriggerLine[trigger_source.name]: trigger_source
+        for trigger_source in nidmm.TriggerSource
+        if trigger_source.name in TriggerLine.__members__
+    }
+)
+
+_TRIGGER_LINE_TO_NIDMM_MEASUREMENT_COMPLETE_DEST = MappingProxyType(
+    {
+        TriggerLine[destination.name]: destination
+        for destination in nidmm.MeasurementCompleteDest
+        if destination.name in TriggerLine.__members__
+    }
+)
+
+# NI-DMM selects the trigger delay automatically when it is set to -1.
+_AUTO_TRIGGER_DELAY = hightime.timedelta(seconds=-1.0)
+
+_CAPABILITIES = create_capabilities(
+    functions=_FUNCTION_TO_NIDMM_FUNCTION.keys(),
+    # Ranges of the PXIe-4081. Other models coerce the range to one that they support.
+    ranges={
+        DmmFunction.DC_VOLTS: (0.1, 1.0, 10.0, 100.0, 1000.0),
+        DmmFunction.AC_VOLTS: (0.05, 0.5, 5.0, 50.0, 700.0),
+    },
+    resolution_digits=(3.5, 4.5, 5.5, 6.5, 7.5),
+    features=(
+        Feature.READ_MULTIPLE,
+        Feature.FETCH_MULTIPLE,
+        Feature.CONFIGURATION_CACHE,
+        Feature.HARDWARE_TRIGGER,
+    ),
+)
+
+
+class _MeasurementConfiguration(NamedTuple):
+    """Measurement configuration most recently applied to the session."""
+
+    function: nidmm.Function
+    range: float
+    resolution_digits: float
+
+
 class Session(DmmBase):
     """NI-DMM session wrapper."""
 
+    capabilities: ClassVar[DmmCapabilities] = _CAPABILITIES
+
     @contextlib.contextmanager
     def _initialize_session(
         self,
@@ -38,9 +99,35 @@ class Session(DmmBase):
         with reservation.initialize_nidmm_session(
             reset_device, options, initialization_behavior=initialization_behavior
         ) as session_info:
-            self._session = session_info.session
+            self._set_session(session_info.session)
             yield
 
+    @classmethod
+    @contextlib.contextmanager
+    def _initialize_sessions(
+        cls,
+        reservation: BaseReservation,
+        reset_device: bool,
+        options: Optional[Dict[str, Any]],
+        initialization_behavior: SessionInitializationBehavior,
+    ) -> Generator[List[DmmBase], None, None]:
+        """Initialize the reserved NI-DMM sessions."""
+        with reservation.initialize_nidmm_sessions(
+            reset_device, options, initialization_behavior=initialization_behavior
+        ) as session_infos:
+            sessions: List[DmmBase] = []
+            for session_info in session_infos:
+                session = cls()
+                session._set_session(session_info.session)
+                sessions.append(session)
+            yield sessions
+
+    def _set_session(self, session: nidmm.Session) -> None:
+        self._session = session
+        self._measurement_configuration: Optional[_MeasurementConfiguration] = None
+        self._sample_count: Optional[int] = None
+
+    @instrumented
     def configure_measurement_digits(
         self,
         measurement_function: DmmFunction,
@@ -56,26 +143,185 @@ class Session(DmmBase):
 
             resolution_digits: The number of digits to which the measurement is rounded.
         """
-        try:
-            self._validate_measurement_type(measurement_function)
-
-            """These properties include method, range, and resolution_digits."""
-            ni_dmm_function = nidmm.Function(measurement_function.value)
-
-            self._session.configure_measurement_digits(ni_dmm_function, range, resolution_digits)
-
-        except ValueError:
+        ni_dmm_function = _FUNCTION_TO_NIDMM_FUNCTION.get(measurement_function)
+        if ni_dmm_function is None:
             raise ValueError(f"Invalid function value: '{measurement_function.name}'.")
 
+        """These properties include method, range, and resolution_digits."""
+        with self._invalidate_state_on_error():
+            self._apply_measurement_configuration(
+                _MeasurementConfiguration(ni_dmm_function, range, resolution_digits)
+            )
+
+    @instrumented
     def read(self) -> float:
         """Acquires a single measurement and returns the measured value.
 
         Returns:
             The measured value.
         """
-        return self._session.read()
+        with self._invalidate_state_on_error():
+            self._configure_sample_count(1)
+            return self._session.read()
+
+    @instrumented
+    def read_multiple(self, count: int) -> npt.NDArray[numpy.float64]:
+        """Acquires multiple measurements and returns an array of measured values.
+
+        Args:
+            count: The number of measurements to acquire.
+
+        Returns:
+            The measured values.
+        """
+        with self._invalidate_state_on_error():
+            self._configure_sample_count(count)
+            measurements = self._session.read_multi_point(count)
+        return numpy.asarray(measurements, dtype=numpy.float64)
+
+    @instrumented
+    def fetch_multiple(self, count: int) -> npt.NDArray[numpy.float64]:
+        """Returns an array of values from an acquisition that is already in progress.
+
+        Args:
+            count: The number of measurements to fetch.
+
+        Returns:
+            The measured values.
+        """
+        with self._invalidate_state_on_error():
+            measurements = self._session.fetch_multi_point(count)
+        return numpy.asarray(measurements, dtype=numpy.float64)
+
+    @instrumented
+    def configure_trigger(
+        self, trigger_source: TriggerLine, trigger_delay: Optional[float] = None
+    ) -> None:
+        """Configure the trigger that starts the measurements acquired by initiate().
+
+        Args:
+            trigger_source: The trigger line that starts each measurement, or IMMEDIATE to start
+                measuring as soon as the acquisition is initiated.
+
+            trigger_delay: The time, in seconds, between the trigger and the measurement. If this
+                argument is not specified, the instrument selects the delay automatically.
+        """
+        nidmm_trigger_source = _TRIGGER_LINE_TO_NIDMM_TRIGGER_SOURCE.get(trigger_source)
+        if nidmm_trigger_source is None:
+            raise ValueError(f"Invalid trigger source: '{trigger_source.name}'.")
+        delay = (
+            _AUTO_TRIGGER_DELAY
+            if trigger_delay is None
+            else hightime.timedelta(seconds=trigger_delay)
+        )
+        with self._invalidate_state_on_error():
+            self._session.configure_trigger(nidmm_trigger_source, trigger_delay=delay)
+
+    @instrumented
+    def initiate(self) -> None:
+        """Arms the instrument to acquire the configured measurement when it is triggered."""
+        with self._invalidate_state_on_error():
+            self._session.initiate()
+
+    @instrumented
+    def fetch(self, timeout: float = 10.0) -> float:
+        """Waits for a measurement started by initiate() and returns the measured value.
+
+        Args:
+            timeout: The maximum time, in seconds, to wait for the measurement.
+
+        Returns:
+            The measured value.
+        """
+        with self._invalidate_state_on_error():
+            return self._session.fetch(maximum_time=hightime.timedelta(seconds=timeout))
+
+    @instrumented
+    def export_measure_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Sends a pulse on the trigger line each time a measurement completes.
+
+        Args:
+            output_terminal: The trigger line to pulse, or NONE to stop exporting the trigger.
+        """
+        destination = _TRIGGER_LINE_TO_NIDMM_MEASUREMENT_COMPLETE_DEST.get(output_terminal)
+        if destination is None:
+            raise ValueError(f"Invalid output terminal: '{output_terminal.name}'.")
+        with self._invalidate_state_on_error():
+            self._session.meas_complete_dest = destination
+
+    @instrumented
+    def measure_scan(
+        self, scan_list: Sequence[Tuple[DmmFunction, float, float]]
+    ) -> npt.NDArray[numpy.float64]:
+        """Takes one measurement with each configuration in the scan list.
+
+        The whole scan list is validated before the first measurement. The measurements are then
+        configured and read back to back while holding the session lock, and only the properties
+        that change between measurements are set.
+
+        Args:
+            scan_list: The measurement function, range, and resolution digits of each
+                measurement, such as ScanStep objects.
+
+        Returns:
+            The measured values, in scan list order.
+        """
+        configurations = []
+        for measurement_function, range, resolution_digits in scan_list:
+            ni_dmm_function = _FUNCTION_TO_NIDMM_FUNCTION.get(measurement_function)
+            if ni_dmm_function is None:
+                raise ValueError(f"Invalid function value: '{measurement_function.name}'.")
+            configurations.append(
+                _MeasurementConfiguration(ni_dmm_function, range, resolution_digits)
+            )
+
+        measurements = numpy.empty(len(configurations), dtype=numpy.float64)
+        with self._session.lock(), self._invalidate_state_on_error():
+            for index, configuration in enumerate(configurations):
+                self._apply_measurement_configuration(configuration)
+                self._configure_sample_count(1)
+                measurements[index] = self._session.read()
+        return measurements
+
+    def _is_session_healthy(self) -> bool:
+        """Returns whether the instrument session can still be used."""
+        self._session.read_status()
+        return True
+
+    def _reset_cached_state(self) -> None:
+        """Forget any instrument state cached by the session wrapper."""
+        self._measurement_configuration = None
+        self._sample_count = None
+
+    def _apply_measurement_configuration(self, configuration: _MeasurementConfiguration) -> None:
+        """Set only the properties that differ from the most recently applied configuration."""
+        previous_configuration = self._measurement_configuration
+        if (
+            previous_configuration is None
+            or previous_configuration.function != configuration.function
+        ):
+            self._session.configure_measurement_digits(
+                configuration.function, configuration.range, configuration.resolution_digits
+            )
+        else:
+            if previous_configuration.range != configuration.range:
+                self._session.range = configuration.range
+            if previous_configuration.resolution_digits != configuration.resolution_digits:
+                self._session.resolution_digits = configuration.resolution_digits
+        self._measurement_configuration = configuration
+
+    @contextlib.contextmanager
+    def _invalidate_state_on_error(self) -> Generator[None, None, None]:
+        """Forget the cached session state if the driver reports an error."""
+        try:
+            yield
+        except nidmm.errors.DriverError:
+            self._reset_cached_state()
+            raise
 
-    def _validate_measurement_type(self, measurement_type: DmmFunction) -> None:
-        function_names = [func.name for func in nidmm.Function]
-        if measurement_type.name not in function_names:
-            raise ValueError(f"Invalid function value: {measurement_type.name}")
+    def _configure_sample_count(self, count: int) -> None:
+        if count < 1:
+            raise ValueError(f"Invalid sample count: {count}")
+        if self._sample_count != count:
+            self._session.configure_multi_point(trigger_count=1, sample_count=count)
+            self._sample_count = count
@@ -0,0 +1,25 @@
+"""Trigger lines used for hardware-timed measurements."""
+
+from enum import Enum
+
+
+class TriggerLine(Enum):
+    """Trigger sources and output terminals used for hardware-timed measurements."""
+
+    NONE = 0
+    """No trigger line. Exporting to NONE stops exporting the trigger."""
+
+    IMMEDIATE = 1
+    """The measurement starts as soon as the instrument is initiated."""
+
+    EXTERNAL = 2
+    """The external trigger connector of the instrument."""
+
+    PXI_TRIG0 = 111
+    PXI_TRIG1 = 112
+    PXI_TRIG2 = 113
+    PXI_TRIG3 = 114
+    PXI_TRIG4 = 115
+    PXI_TRIG5 = 116
+    PXI_TRIG6 = 117
+    PXI_TRIG7 = 118
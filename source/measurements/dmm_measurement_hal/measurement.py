@@ -3,13 +3,15 @@
 import logging
 import pathlib
 import sys
-from typing import Tuple
+from typing import List, Tuple
 
 import click
 import ni_measurement_plugin_sdk_service as nims
 from _helpers import configure_logging, verbosity_option
 from dmm_hal.dmm import initialize
 from dmm_hal.function import Function as DmmFunction
+from dmm_hal.multi_site import run_per_site
+from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
 
 script_or_exe = sys.executable if getattr(sys, "frozen", False) else __file__
 service_directory = pathlib.Path(script_or_exe).resolve().parent
@@ -31,13 +33,19 @@ measurement_service = nims.MeasurementService(
 @measurement_service.configuration("range", nims.DataType.Double, 10.0)
 @measurement_service.configuration("resolution_digits", nims.DataType.Double, 5.5)
 @measurement_service.output("measured_value", nims.DataType.Double)
+@measurement_service.output("site_numbers", nims.DataType.Int32Array1D)
+@measurement_service.output("site_measured_values", nims.DataType.DoubleArray1D)
 def measure(
     pin_name: str,
     measurement_type: DmmFunction,
     range: float,
     resolution_digits: float,
-) -> Tuple[float]:
-    """Perform a measurement using an DMM."""
+) -> Tuple[float, List[int], List[float]]:
+    """Perform a measurement using an DMM on each site in parallel.
+
+    measured_value is the reading of the first site, and site_measured_values contains the reading
+    of each site in the order of site_numbers.
+    """
     logging.info(
         "Starting measurement: pin_name=%s measurement_type=%s range=%g resolution_digits=%g",
         pin_name,
@@ -46,12 +54,23 @@ def measure(
         resolution_digits,
     )
 
-    with initialize(measurement_context=measurement_service.context, pin_name=pin_name) as dmm:
-        dmm.configure_measurement_digits(measurement_type, range, resolution_digits)
-        measured_value = dmm.read()
+    def measure_site(measurement_context: MeasurementContext) -> float:
+        with initialize(measurement_context=measurement_context, pin_name=pin_name) as dmm:
+            dmm.configure_measurement_digits(measurement_type, range, resolution_digits)
+            return dmm.read()
+
+    # Without sites, run_per_site() measures once with the whole context, which is site 0.
+    site_numbers = list(measurement_service.context.pin_map_context.sites or [0])
+    site_measured_values = run_per_site(measurement_service.context, measure_site)
 
-    logging.info("Completed measurement: measured_value=%g", measured_value)
-    return (measured_value,)
+    logging.info(
+        "Completed measurement: measured_value=%g (first site) site_numbers=%s "
+        "site_measured_values=%s",
+        site_measured_values[0],
+        site_numbers,
+        site_measured_values,
+    )
+    return (site_measured_values[0], site_numbers, site_measured_values)
 
 
 @click.command
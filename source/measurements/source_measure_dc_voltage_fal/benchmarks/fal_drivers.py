@@ -0,0 +1,266 @@
+"""Benchmark the FAL driver modules against simulated instruments.
+
+NI-DCPower and NI-DMM sessions are simulated using the driver's Simulate option and Keysight DMM
+sessions are simulated using the PyVISA-sim backend defined in `_keysight_dmm_sim.yaml`. A fake
+reservation stands in for the session management service, so the NI gRPC Device Server is not used.
+
+Run it from the measurement service directory:
+
+    python -m benchmarks.fal_drivers --iterations 100 --output results.json
+
+The results are written as JSON. Drivers that cannot be used on this computer, for example because
+NI-DCPower is not installed, are reported with an error instead of timings.
+"""
+
+import contextlib
+import json
+import os
+import platform
+import time
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Sequence
+
+import click
+import nidcpower
+import nidmm
+import numpy
+from fal.measure_dc_voltage import MeasureDCVoltage
+from fal.session_helper import initialize
+from fal.source_and_measure_dc_voltage import SourceAndMeasureDCVoltage
+from fal.source_dc_voltage import SourceDCVoltage
+from ni_measurement_plugin_sdk_service.session_management import (
+    PinMapContext,
+    ChannelMapping,
+    SessionInformation,
+    SessionInitializationBehavior,
+)
+
+_PIN_NAME = "Pin1"
+
+_NIDCPOWER_OPTIONS = {"simulate": True, "driver_setup": {"Model": "4141", "BoardType": "PXIe"}}
+_NIDMM_OPTIONS = {"simulate": True, "driver_setup": {"Model": "4081", "BoardType": "PXIe"}}
+
+_SOURCE_ARGUMENTS = {
+    "voltage_level_range": 6.0,
+    "voltage_level": 1.0,
+    "current_limit_range": 0.01,
+    "current_limit": 0.01,
+    "source_delay": 0.0,
+}
+_MEASURE_ARGUMENTS = {"voltage_level_range": 10.0, "resolution_digits": 5.5}
+
+
+def _session_info(
+    session_name: str, resource_name: str, channel_list: str, instrument_type_id: str
+) -> SessionInformation:
+    return SessionInformation(
+        session_name=session_name,
+        resource_name=resource_name,
+        channel_list=channel_list,
+        instrument_type_id=instrument_type_id,
+        session_exists=False,
+        channel_mappings=[ChannelMapping(_PIN_NAME, 0, channel_list, "", "")],
+    )
+
+
+_SESSION_INFOS = [
+    _session_info("NI-DCPower", "NI-DCPower/0", "NI-DCPower/0", "niDCPower"),
+    _session_info("NI-DMM", "NI-DMM", "", "niDMM"),
+    _session_info("Sim_Keysight_DMM", "GPIB0::3::INSTR", "", "KeysightDmm"),
+]
+
+
+class _SimulatedReservation:
+    """Initializes simulated instrument sessions in place of a session management reservation."""
+
+    def __init__(self, session_info: SessionInformation) -> None:
+        self._session_info = session_info
+        self._discovery_client = None
+
+    @property
+    def session_info(self) -> List[SessionInformation]:
+        return [self._session_info]
+
+    @contextlib.contextmanager
+    def initialize_nidcpower_session(
+        self,
+        reset: bool = False,
+        options: Optional[Dict[str, Any]] = None,
+        initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.AUTO,
+    ) -> Generator[SessionInformation, None, None]:
+        with nidcpower.Session(
+            self._session_info.resource_name, reset=reset, options=_NIDCPOWER_OPTIONS
+        ) as session:
+            yield self._session_info._replace(session=session)
+
+    @contextlib.contextmanager
+    def initialize_nidmm_session(
+        self,
+        reset_device: bool = False,
+        options: Optional[Dict[str, Any]] = None,
+        initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.AUTO,
+    ) -> Generator[SessionInformation, None, None]:
+        with nidmm.Session(
+            self._session_info.resource_name, reset_device=reset_device, options=_NIDMM_OPTIONS
+        ) as session:
+            yield self._session_info._replace(session=session)
+
+    @contextlib.contextmanager
+    def initialize_session(
+        self, session_constructor: Callable[[SessionInformation], Any], instrument_type_id: str
+    ) -> Generator[SessionInformation, None, None]:
+        with session_constructor(self._session_info) as session:
+            yield self._session_info._replace(session=session)
+
+    @contextlib.contextmanager
+    def initialize_nidcpower_sessions(
+        self,
+        reset: bool = False,
+        options: Optional[Dict[str, Any]] = None,
+        initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.AUTO,
+    ) -> Generator[List[SessionInformation], None, None]:
+        with self.initialize_nidcpower_session(reset, options, initialization_behavior) as info:
+            yield [info]
+
+    @contextlib.contextmanager
+    def initialize_nidmm_sessions(
+        self,
+        reset_device: bool = False,
+        options: Optional[Dict[str, Any]] = None,
+        initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.AUTO,
+    ) -> Generator[List[SessionInformation], None, None]:
+        with self.initialize_nidmm_session(reset_device, options, initialization_behavior) as info:
+            yield [info]
+
+    @contextlib.contextmanager
+    def initialize_sessions(
+        self, session_constructor: Callable[[SessionInformation], Any], instrument_type_id: str
+    ) -> Generator[List[SessionInformation], None, None]:
+        with self.initialize_session(session_constructor, instrument_type_id) as info:
+            yield [info]
+
+
+class _SimulatedMeasurementContext:
+    """Reserves simulated instrument sessions in place of the measurement service context."""
+
+    pin_map_context = PinMapContext(pin_map_id="SimulatedPinMap", sites=[0])
+    time_remaining = None
+    grpc_context = None
+
+    def __init__(self, session_info: SessionInformation) -> None:
+        self._session_info = session_info
+
+    @contextlib.contextmanager
+    def reserve_sessions(
+        self, pin_names: Iterable[str]
+    ) -> Generator[_SimulatedReservation, None, None]:
+        yield _SimulatedReservation(self._session_info)
+
+    def add_cancel_callback(self, cancel_callback: Callable[[], None]) -> None:
+        pass
+
+
+def _time_calls(function: Callable[[], object], iterations: int, warmup: int) -> List[float]:
+    for _ in range(warmup):
+        function()
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _summarize(durations: Sequence[float]) -> Dict[str, float]:
+    array = numpy.asarray(durations, dtype=numpy.float64)
+    mean = float(array.mean())
+    return {
+        "mean_s": mean,
+        "median_s": float(numpy.median(array)),
+        "p95_s": float(numpy.percentile(array, 95)),
+        "min_s": float(array.min()),
+        "max_s": float(array.max()),
+        "calls_per_second": 1.0 / mean,
+    }
+
+
+def _benchmark_driver(
+    session_info: SessionInformation, iterations: int, warmup: int
+) -> Dict[str, Any]:
+    measurement_context: Any = _SimulatedMeasurementContext(session_info)
+
+    def initialize_and_close() -> None:
+        with initialize(measurement_context, _PIN_NAME):
+            pass
+
+    result: Dict[str, Any] = {
+        "instrument_type_id": session_info.instrument_type_id,
+        "resource_name": session_info.resource_name,
+        "initialize": _summarize(_time_calls(initialize_and_close, iterations, warmup)),
+    }
+
+    with initialize(measurement_context, _PIN_NAME) as sessions:
+        session = sessions[_PIN_NAME]
+        if isinstance(session, SourceDCVoltage):
+            result["source_dc_voltage"] = _summarize(
+                _time_calls(
+                    lambda: session.source_dc_voltage(**_SOURCE_ARGUMENTS), iterations, warmup
+                )
+            )
+        if isinstance(session, MeasureDCVoltage):
+            result["measure_dc_voltage"] = _summarize(
+                _time_calls(
+                    lambda: session.measure_dc_voltage(**_MEASURE_ARGUMENTS), iterations, warmup
+                )
+            )
+        if isinstance(session, SourceAndMeasureDCVoltage):
+            result["source_and_measure_dc_voltage"] = _summarize(
+                _time_calls(
+                    lambda: session.source_and_measure_dc_voltage(
+                        voltage_level_range=_SOURCE_ARGUMENTS["voltage_level_range"],
+                        voltage_level=_SOURCE_ARGUMENTS["voltage_level"],
+                        current_limit_range=_SOURCE_ARGUMENTS["current_limit_range"],
+                        current_limit=_SOURCE_ARGUMENTS["current_limit"],
+                        source_delay=_SOURCE_ARGUMENTS["source_delay"],
+                    ),
+                    iterations,
+                    warmup,
+                )
+            )
+    return result
+
+
+@click.command
+@click.option("--iterations", default=100, show_default=True, help="Timed calls per operation.")
+@click.option("--warmup", default=5, show_default=True, help="Untimed calls per operation.")
+@click.option("--output", type=click.File("w"), default="-", help="JSON output file.")
+def main(iterations: int, warmup: int, output: Any) -> None:
+    """Benchmark the FAL driver modules against simulated instruments."""
+    os.environ.setdefault("MEASUREMENT_PLUGIN_VISA_DMM_SIMULATE", "1")
+
+    results: List[Dict[str, Any]] = []
+    for session_info in _SESSION_INFOS:
+        try:
+            results.append(_benchmark_driver(session_info, iterations, warmup))
+        except Exception as e:
+            results.append(
+                {
+                    "instrument_type_id": session_info.instrument_type_id,
+                    "resource_name": session_info.resource_name,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            )
+
+    report = {
+        "benchmark": "fal_drivers",
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "warmup": warmup,
+        "results": results,
+    }
+    json.dump(report, output, indent=2)
+    output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
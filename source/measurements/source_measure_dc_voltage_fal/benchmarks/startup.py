@@ -0,0 +1,135 @@
+"""Benchmark the import time of the measurement service and check it against a budget.
+
+Each run imports `measurement.py` in a new Python interpreter with `-X importtime`, which is what
+delays registering the service when it is launched, for example by a TestStand step. The driver
+packages and numpy are only needed once a session is created, so the check also fails if they are
+imported at startup.
+
+Run it from the measurement service directory:
+
+    python -m benchmarks.startup --runs 5 --budget-ms 500 --output results.json
+
+The results are written as JSON. The command exits with a non-zero status if the median import
+time exceeds the budget or if a deferred module is imported.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, NamedTuple
+
+import click
+
+_SERVICE_MODULE = "measurement"
+
+# Modules that must not be imported until a session is created.
+_DEFERRED_MODULES = ["nidcpower", "nidmm", "pyvisa", "decouple", "numpy"]
+
+
+class _ImportTime(NamedTuple):
+    """An entry of the `-X importtime` output."""
+
+    module: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+def _parse_import_times(stderr: str) -> List[_ImportTime]:
+    import_times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        depth = (len(name) - len(module) - 1) // 2
+        import_times.append(_ImportTime(module, depth, int(fields[0]), int(fields[1])))
+    return import_times
+
+
+def _run_once() -> Dict[str, Any]:
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {_SERVICE_MODULE}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    process_s = time.perf_counter() - start
+    import_times = _parse_import_times(completed.stderr)
+    service_import = next(
+        entry for entry in import_times if entry.module == _SERVICE_MODULE and entry.depth == 0
+    )
+    return {
+        "process_s": process_s,
+        "service_import_s": service_import.cumulative_us / 1e6,
+        "import_times": import_times,
+    }
+
+
+@click.command
+@click.option("--runs", default=5, show_default=True, help="Number of interpreters to start.")
+@click.option(
+    "--budget-ms",
+    default=500.0,
+    show_default=True,
+    help="Maximum median time to import the measurement service.",
+)
+@click.option("--top", default=15, show_default=True, help="Number of slowest modules to report.")
+@click.option("--output", type=click.File("w"), default="-", help="JSON output file.")
+def main(runs: int, budget_ms: float, top: int, output: Any) -> None:
+    """Benchmark the import time of the measurement service and check it against a budget."""
+    results = [_run_once() for _ in range(runs)]
+    service_import_s = statistics.median(result["service_import_s"] for result in results)
+    process_s = statistics.median(result["process_s"] for result in results)
+
+    # The module list is the same for every run, so the last run is reported.
+    import_times: List[_ImportTime] = results[-1]["import_times"]
+    imported_modules = {entry.module for entry in import_times}
+    deferred_modules_imported = [
+        module
+        for module in _DEFERRED_MODULES
+        if module in imported_modules
+        or any(imported.startswith(f"{module}.") for imported in imported_modules)
+    ]
+    slowest_modules = sorted(import_times, key=lambda entry: entry.self_us, reverse=True)[:top]
+
+    within_budget = service_import_s * 1e3 <= budget_ms
+    report = {
+        "benchmark": "startup",
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "service_import_median_s": service_import_s,
+        "process_median_s": process_s,
+        "budget_s": budget_ms / 1e3,
+        "within_budget": within_budget,
+        "deferred_modules_imported": deferred_modules_imported,
+        "slowest_modules": [
+            {
+                "module": entry.module,
+                "self_s": entry.self_us / 1e6,
+                "cumulative_s": entry.cumulative_us / 1e6,
+            }
+            for entry in slowest_modules
+        ],
+    }
+    json.dump(report, output, indent=2)
+    output.write("\n")
+
+    if not within_budget or deferred_modules_imported:
+        raise click.ClickException(
+            f"Startup check failed: importing the measurement service took "
+            f"{service_import_s * 1e3:.1f} ms (budget {budget_ms:.1f} ms), deferred modules "
+            f"imported: {deferred_modules_imported or 'none'}."
+        )
+
+
+if __name__ == "__main__":
+    main()
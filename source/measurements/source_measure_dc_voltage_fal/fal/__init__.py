@@ -1,17 +1,65 @@
 """Source measure FAL modules."""
 
+from fal.async_session import AsyncSession, initialize_async
+from fal.driver_registry import register_driver
+from fal.export_source_complete_trigger import ExportSourceCompleteTrigger
+from fal.instrumentation import (
+    Instrumentation,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_instrumentation,
+)
+from fal.lock_manager import InstrumentLockManager, get_lock_manager
 from fal.measure_dc_voltage import MeasureDCVoltage
+from fal.multi_pin_dc_voltage import (
+    MultiPinDCVoltage,
+    SourceDCVoltageParameters,
+    measure_dc_voltage_multi,
+    source_dc_voltage_multi,
+)
+from fal.multi_site import SiteMeasurementContext, run_per_site
 from fal.session_helper import (
+    SessionPool,
     create_instrument_sessions,
     destroy_instrument_sessions,
     initialize,
 )
+from fal.source_and_measure_dc_voltage import (
+    SourceAndMeasureDCVoltage,
+    source_and_measure_dc_voltage,
+)
 from fal.source_dc_voltage import SourceDCVoltage
+from fal.sweep_dc_voltage import SweepDCVoltage, sweep_dc_voltage
+from fal.trigger_line import TriggerLine
+from fal.triggered_measure_dc_voltage import TriggeredMeasureDCVoltage
 
 __all__ = [
     "initialize",
+    "initialize_async",
+    "AsyncSession",
     "create_instrument_sessions",
     "destroy_instrument_sessions",
+    "SessionPool",
     "SourceDCVoltage",
     "MeasureDCVoltage",
+    "SourceAndMeasureDCVoltage",
+    "source_and_measure_dc_voltage",
+    "SweepDCVoltage",
+    "sweep_dc_voltage",
+    "MultiPinDCVoltage",
+    "SourceDCVoltageParameters",
+    "source_dc_voltage_multi",
+    "measure_dc_voltage_multi",
+    "TriggerLine",
+    "ExportSourceCompleteTrigger",
+    "TriggeredMeasureDCVoltage",
+    "Instrumentation",
+    "enable_instrumentation",
+    "disable_instrumentation",
+    "get_instrumentation",
+    "register_driver",
+    "SiteMeasurementContext",
+    "run_per_site",
+    "InstrumentLockManager",
+    "get_lock_manager",
 ]
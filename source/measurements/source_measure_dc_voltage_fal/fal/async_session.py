@@ -0,0 +1,289 @@
+"""Defines an asyncio front-end for the FAL instrument sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from fal.initialize_session import InitializeSession
+from fal.lock_manager import InstrumentLockManager
+from fal.multi_pin_dc_voltage import SourceDCVoltageParameters
+from fal.session_helper import SessionPool, initialize
+from fal.trigger_line import TriggerLine
+from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
+from ni_measurement_plugin_sdk_service.session_management import (
+    SessionInitializationBehavior,
+)
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing as npt
+
+_T = TypeVar("_T")
+
+
+async def _run_in_executor(
+    executor: concurrent.futures.Executor, function: Callable[..., _T], *args: Any
+) -> _T:
+    """Run a blocking function on the executor with a copy of the current context variables."""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, functools.partial(context.run, function, *args))
+
+
+class AsyncSession:
+    """Asyncio interface for a FAL instrument session.
+
+    Driver calls run on an executor that is dedicated to the instrument, so calls to the same
+    instrument run one at a time and in order, while calls to different instruments can be awaited
+    concurrently with asyncio.gather(). Each method requires the wrapped session to implement the
+    corresponding FAL abstract class.
+    """
+
+    def __init__(self, session: InitializeSession, executor: concurrent.futures.Executor) -> None:
+        """Initialize the asyncio wrapper for an instrument session."""
+        self._session = session
+        self._executor = executor
+
+    @property
+    def session(self) -> Any:
+        """The blocking instrument session."""
+        return self._session
+
+    async def source_dc_voltage(
+        self,
+        voltage_level_range: float,
+        voltage_level: float,
+        current_limit_range: float,
+        current_limit: float,
+        source_delay: float,
+    ) -> None:
+        """Source a DC voltage."""
+        await self._run(
+            "source_dc_voltage",
+            voltage_level_range=voltage_level_range,
+            voltage_level=voltage_level,
+            current_limit_range=current_limit_range,
+            current_limit=current_limit,
+            source_delay=source_delay,
+        )
+
+    async def measure_dc_voltage(
+        self,
+        voltage_level_range: float,
+        resolution_digits: float,
+    ) -> float:
+        """Acquires and returns a single measurement value."""
+        return await self._run(
+            "measure_dc_voltage",
+            voltage_level_range=voltage_level_range,
+            resolution_digits=resolution_digits,
+        )
+
+    async def source_and_measure_dc_voltage(
+        self,
+        voltage_level_range: float,
+        voltage_level: float,
+        current_limit_range: float,
+        current_limit: float,
+        source_delay: float,
+        pin_name: Optional[str] = None,
+    ) -> Tuple[float, float]:
+        """Sources a DC voltage on the pin and returns the measured voltage and current."""
+        return await self._run(
+            "source_and_measure_dc_voltage",
+            voltage_level_range=voltage_level_range,
+            voltage_level=voltage_level,
+            current_limit_range=current_limit_range,
+            current_limit=current_limit,
+            source_delay=source_delay,
+            pin_name=pin_name,
+        )
+
+    async def sweep_dc_voltage(
+        self,
+        voltage_levels: Sequence[float],
+        voltage_level_range: float,
+        current_limit_range: float,
+        current_limit: float,
+        source_delay: float,
+    ) -> Tuple[npt.NDArray[numpy.float64], npt.NDArray[numpy.float64]]:
+        """Sources each DC voltage level and returns the measured voltages and currents."""
+        return await self._run(
+            "sweep_dc_voltage",
+            voltage_levels=voltage_levels,
+            voltage_level_range=voltage_level_range,
+            current_limit_range=current_limit_range,
+            current_limit=current_limit,
+            source_delay=source_delay,
+        )
+
+    async def export_source_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Pulse the trigger line each time sourcing completes, or stop if it is NONE."""
+        await self._run("export_source_complete_trigger", output_terminal=output_terminal)
+
+    async def configure_trigger(
+        self, trigger_source: TriggerLine, trigger_delay: Optional[float] = None
+    ) -> None:
+        """Configure the trigger that starts the measurement acquired by initiate()."""
+        await self._run(
+            "configure_trigger", trigger_source=trigger_source, trigger_delay=trigger_delay
+        )
+
+    async def initiate(self, voltage_level_range: float, resolution_digits: float) -> None:
+        """Configure a DC voltage measurement and arm the instrument to take it when triggered."""
+        await self._run(
+            "initiate",
+            voltage_level_range=voltage_level_range,
+            resolution_digits=resolution_digits,
+        )
+
+    async def fetch(self, timeout: float) -> float:
+        """Waits for the measurement started by initiate() and returns the measured value."""
+        return await self._run("fetch", timeout=timeout)
+
+    async def abort(self) -> None:
+        """Abort the measurement started by initiate()."""
+        await self._run("abort")
+
+    async def export_measure_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Pulse the trigger line each time a measurement completes, or stop if it is NONE."""
+        await self._run("export_measure_complete_trigger", output_terminal=output_terminal)
+
+    async def source_dc_voltage_multi(
+        self, parameters: Mapping[str, SourceDCVoltageParameters]
+    ) -> None:
+        """Source a DC voltage on the channels of each pin of the session."""
+        await self._run("source_dc_voltage_multi", parameters=parameters)
+
+    async def measure_dc_voltage_multi(
+        self, pin_names: Sequence[str], voltage_level_range: float, resolution_digits: float
+    ) -> List[npt.NDArray[numpy.float64]]:
+        """Measure the voltage of the channels of each pin of the session with one driver call."""
+        return await self._run(
+            "measure_dc_voltage_multi",
+            pin_names=pin_names,
+            voltage_level_range=voltage_level_range,
+            resolution_digits=resolution_digits,
+        )
+
+    async def _run(self, method_name: str, **kwargs: Any) -> Any:
+        method = getattr(self._session, method_name, None)
+        if method is None:
+            raise TypeError(
+                f"The '{type(self._session).__module__}' session does not support '{method_name}'."
+            )
+        return await _run_in_executor(self._executor, functools.partial(method, **kwargs))
+
+
+def _get_async_instrument_session(
+    session: InitializeSession, executor: concurrent.futures.Executor
+) -> AsyncSession:
+    """Creates an asyncio FAL object for the instrument session.
+
+    Driver modules can define an AsyncSession class to customize the asyncio wrapper.
+    """
+    driver_module = sys.modules[type(session).__module__]
+    async_session = getattr(driver_module, "AsyncSession", AsyncSession)
+    return async_session(session, executor)
+
+
+@contextlib.asynccontextmanager
+async def initialize_async(
+    measurement_context: MeasurementContext,
+    pin_names: Union[Iterable[str], str],
+    reset_device: bool = False,
+    options: Optional[Dict[str, Any]] = None,
+    initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.AUTO,
+    session_pool: Optional[SessionPool] = None,
+    max_workers: int = 1,
+    lock_manager: Optional[InstrumentLockManager] = None,
+) -> AsyncGenerator[Dict[str, AsyncSession], None]:
+    """Initialize the instrument session(s) for use with asyncio.
+
+    The sessions are reserved, initialized, and closed without blocking the event loop. Pins that
+    map to the same instrument session share the same asyncio session and executor.
+
+    Args:
+        measurement_context: Proxy for the Measurement Service's context-local state.
+
+        pin_names: Pin names to initialize the respective instrument session(s).
+
+        reset_device: Specifies whether to reset channel(s) during the initialization procedure.
+
+        options: Specifies the initial value of certain properties for the session. If this argument
+            is not specified, the default value is an empty dict.
+
+        initialization_behavior: Specifies whether the NI gRPC Device Server will initialize a new
+            session or attach to an existing session.
+
+        session_pool: Specifies a session pool that keeps the instrument sessions alive after the
+            measurement. If this argument is not specified, the sessions are closed or detached
+            when the measurement completes.
+
+        max_workers: Specifies the maximum number of instrument types whose sessions are
+            initialized in parallel. If this argument is not specified, the instrument types are
+            initialized one at a time.
+
+        lock_manager: Specifies the lock manager that serializes the measurements in this process
+            that use the same instruments. If this argument is not specified, the lock manager
+            shared by the process is used.
+
+    Yields:
+        A dictionary of pin names and their corresponding asyncio session objects.
+    """
+    with contextlib.ExitStack() as executors:
+        initialize_executor = executors.enter_context(
+            concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="FALInitialize")
+        )
+        stack = contextlib.ExitStack()
+        session_context = initialize(
+            measurement_context,
+            pin_names,
+            reset_device,
+            options,
+            initialization_behavior,
+            session_pool,
+            max_workers,
+            lock_manager,
+        )
+        sessions = await _run_in_executor(initialize_executor, stack.enter_context, session_context)
+        try:
+            async_sessions: Dict[int, AsyncSession] = {}
+            async_sessions_by_pin_names = {}
+            for pin_name, session in sessions.items():
+                async_session = async_sessions.get(id(session))
+                if async_session is None:
+                    executor = executors.enter_context(
+                        concurrent.futures.ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix=f"FAL-{pin_name}"
+                        )
+                    )
+                    async_session = _get_async_instrument_session(session, executor)
+                    async_sessions[id(session)] = async_session
+                async_sessions_by_pin_names[pin_name] = async_session
+            yield async_sessions_by_pin_names
+        except BaseException:
+            if not await _run_in_executor(initialize_executor, stack.__exit__, *sys.exc_info()):
+                raise
+        else:
+            await _run_in_executor(initialize_executor, stack.close)
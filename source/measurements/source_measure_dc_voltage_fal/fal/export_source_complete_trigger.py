@@ -0,0 +1,14 @@
+"""An abstract class to export the Source Complete event of a source instrument."""
+
+from abc import ABC, abstractmethod
+
+from fal.trigger_line import TriggerLine
+
+
+class ExportSourceCompleteTrigger(ABC):
+    """An abstract class to export the Source Complete event of a source instrument."""
+
+    @abstractmethod
+    def export_source_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Pulse the trigger line each time sourcing completes, or stop if it is NONE."""
+        pass
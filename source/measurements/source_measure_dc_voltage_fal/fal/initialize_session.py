@@ -1,8 +1,10 @@
 """An abstract class to initialize an instrument session."""
 
+from __future__ import annotations
+
 import contextlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, List, Optional
 
 from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
 from ni_measurement_plugin_sdk_service.session_management import (
@@ -26,3 +28,32 @@ class InitializeSession(ABC):
     ) -> Generator[None, None, None]:
         """Initialize an instrument session."""
         pass
+
+    @classmethod
+    @contextlib.contextmanager
+    def initialize_sessions(
+        cls,
+        measurement_context: MeasurementContext,
+        reservation: BaseReservation,
+        reset_device: bool,
+        options: Optional[Dict[str, Any]],
+        initialization_behavior: SessionInitializationBehavior,
+    ) -> Generator[List[InitializeSession], None, None]:
+        """Initialize the reserved instrument sessions of the driver's instrument type.
+
+        Yields the sessions in the order of the reserved sessions. Drivers that don't override this
+        method support one reserved session of their instrument type.
+        """
+        session = cls()
+        with session.initialize_session(
+            measurement_context, reservation, reset_device, options, initialization_behavior
+        ):
+            yield [session]
+
+    def _is_session_healthy(self) -> bool:
+        """Returns whether the instrument session can still be used."""
+        return True
+
+    def _reset_cached_state(self) -> None:
+        """Forget any instrument state cached by the session wrapper."""
+        pass
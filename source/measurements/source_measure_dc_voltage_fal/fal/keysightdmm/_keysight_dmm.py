@@ -1,11 +1,32 @@
 from __future__ import annotations
 
+import contextlib
 import pathlib
 import sys
+import threading
+import time
 from enum import Enum
 from types import TracebackType
-from typing import TYPE_CHECKING, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
+import numpy
+import numpy.typing as npt
+import pyvisa
+import pyvisa.constants
+import pyvisa.errors
 import pyvisa.resources
 import pyvisa.typing
 
@@ -15,13 +36,18 @@ if TYPE_CHECKING:
     else:
         from typing_extensions import Self
 
+_T = TypeVar("_T")
 
 # Pin map instrument type constant for Keysight DMM
 INSTRUMENT_TYPE_ID = "KeysightDmm"
 
 _SIMULATION_YAML_PATH = pathlib.Path(__file__).resolve().parent / "_keysight_dmm_sim.yaml"
 
-_RESOLUTION_DIGITS_TO_VALUE = {"3.5": 0.001, "4.5": 0.0001, "5.5": 1e-5, "6.5": 1e-6}
+# Separates SCPI commands that are sent in a single message. The colon resets the command tree to
+# the root so each command is interpreted the same as if it were sent on its own.
+_COMMAND_SEPARATOR = ";:"
+
+_RESOLUTION_DIGITS_TO_VALUE = {3.5: 0.001, 4.5: 0.0001, 5.5: 1e-5, 6.5: 1e-6}
 
 # Supported Keysight DMM instrument IDs, both real and simulated, can be added here
 _SUPPORTED_INSTRUMENT_IDS = [
@@ -49,6 +75,119 @@ _FUNCTION_TO_VALUE = {
 }
 
 
+class TriggerSource(Enum):
+    """Enum that represents the trigger source."""
+
+    IMMEDIATE = 1
+    EXTERNAL = 2
+
+
+_TRIGGER_SOURCE_TO_VALUE = {
+    TriggerSource.IMMEDIATE: "IMM",
+    TriggerSource.EXTERNAL: "EXT",
+}
+
+
+class _MeasurementConfiguration(NamedTuple):
+    """Measurement configuration most recently applied to the instrument."""
+
+    function: Function
+    range: float
+    resolution_value: float
+
+
+class _TriggerConfiguration(NamedTuple):
+    """Trigger configuration most recently applied to the instrument."""
+
+    source: TriggerSource
+    delay: Optional[float]
+
+
+# CONFigure and *RST preset the trigger source to immediate and the trigger delay to automatic.
+_DEFAULT_TRIGGER_CONFIGURATION = _TriggerConfiguration(TriggerSource.IMMEDIATE, None)
+
+
+class _SharedResource:
+    """A VISA resource that is shared by the sessions opened with the same key."""
+
+    def __init__(self, resource: pyvisa.resources.Resource) -> None:
+        self.resource = resource
+        self.reference_count = 1
+
+
+# Resource managers are cached by VISA library so that opening a session does not load the VISA
+# library or parse the simulation YAML file again.
+_resource_managers: Dict[str, pyvisa.ResourceManager] = {}
+_shared_resources: Dict[Tuple[str, str], _SharedResource] = {}
+_resource_lock = threading.Lock()
+
+
+def close_resource_managers() -> None:
+    """Close the cached VISA resource managers and any resources that they still have open.
+
+    Sessions that are opened afterwards create new resource managers.
+    """
+    with _resource_lock:
+        resource_managers = list(_resource_managers.values())
+        _resource_managers.clear()
+        _shared_resources.clear()
+    for resource_manager in resource_managers:
+        resource_manager.close()
+
+
+def _get_resource_manager(visa_library: str) -> pyvisa.ResourceManager:
+    """Return the cached resource manager for the VISA library, creating it if needed."""
+    with _resource_lock:
+        resource_manager = _resource_managers.get(visa_library)
+        if resource_manager is None:
+            resource_manager = pyvisa.ResourceManager(visa_library)
+            _resource_managers[visa_library] = resource_manager
+        return resource_manager
+
+
+def _open_resource(
+    visa_library: str, resource_name: str, shared_resource_key: Optional[str]
+) -> pyvisa.resources.Resource:
+    """Open a VISA resource, or reuse the open resource that has the same shared resource key."""
+    if shared_resource_key is not None:
+        with _resource_lock:
+            shared_resource = _shared_resources.get((visa_library, shared_resource_key))
+            if shared_resource is not None:
+                shared_resource.reference_count += 1
+                return shared_resource.resource
+
+    resource = _get_resource_manager(visa_library).open_resource(
+        resource_name, read_termination="\n", write_termination="\n"
+    )
+    if shared_resource_key is None:
+        return resource
+
+    with _resource_lock:
+        shared_resource = _shared_resources.get((visa_library, shared_resource_key))
+        if shared_resource is None:
+            _shared_resources[(visa_library, shared_resource_key)] = _SharedResource(resource)
+            return resource
+        # Another thread opened the same resource first.
+        shared_resource.reference_count += 1
+    resource.close()
+    return shared_resource.resource
+
+
+def _close_resource(
+    visa_library: str, shared_resource_key: Optional[str], resource: pyvisa.resources.Resource
+) -> None:
+    """Close a VISA resource once no other session is sharing it."""
+    if shared_resource_key is not None:
+        with _resource_lock:
+            shared_resource = _shared_resources.get((visa_library, shared_resource_key))
+            if shared_resource is not None and shared_resource.resource is resource:
+                shared_resource.reference_count -= 1
+                if shared_resource.reference_count > 0:
+                    return
+                del _shared_resources[(visa_library, shared_resource_key)]
+    resource.close()
+
+
 class Session:
     """Keysight DMM session."""
 
@@ -58,29 +197,67 @@ class Session:
         id_query: bool = True,
         reset_device: bool = True,
         simulate: bool = False,
+        binary_transfer: bool = False,
+        strict_error_checking: bool = False,
+        round_trip_observer: Optional[Callable[[str, float], None]] = None,
+        shared_resource_key: Optional[str] = None,
     ) -> None:
-        """Open Keysight DMM session."""
-        # Create a real or simulated Keysight resource manager."""
-        visa_library = f"{_SIMULATION_YAML_PATH}@sim" if simulate else ""
-        resource_manager = pyvisa.ResourceManager(visa_library)
+        """Open Keysight DMM session.
+
+        When binary_transfer is True, the instrument returns readings as IEEE 488.2 definite length
+        blocks of float64 values (FORM:DATA REAL,64) instead of ASCII text. The Keysight 34401A
+        does not support this data format.
+
+        By default, configuration commands are deferred and sent in the same message as the next
+        query, and the error queue is checked once per transaction, after that query. Errors from
+        configure_measurement_digits() are therefore reported by the next read. If such an error
+        keeps the instrument from responding to the query, the error is read from the error queue
+        and raised instead of the I/O timeout. When strict_error_checking is True, each command is
+        sent on its own and followed by an error queue query, which makes it easier to tell which
+        command failed.
 
-        session = resource_manager.open_resource(
-            resource_name, read_termination="\n", write_termination="\n"
-        )
+        When round_trip_observer is specified, it is called with the name and duration, in seconds,
+        of each write or query sent to the instrument.
+
+        The VISA resource manager is shared by all sessions that use the same VISA library. When
+        shared_resource_key is specified, sessions opened with the same key, such as the name of a
+        NI gRPC Device Server session, share the same VISA resource, which is closed when the last
+        of these sessions is closed.
+        """
+        # Use a real or simulated Keysight resource manager.
+        self._visa_library = f"{_SIMULATION_YAML_PATH}@sim" if simulate else ""
+        self._shared_resource_key = shared_resource_key
+        session = _open_resource(self._visa_library, resource_name, shared_resource_key)
 
         if not isinstance(session, pyvisa.resources.MessageBasedResource):
+            _close_resource(self._visa_library, shared_resource_key, session)
             raise TypeError("The 'session' object must be an instance of MessageBasedResource.")
         self._session = session
+        self._measurement_configuration: Optional[_MeasurementConfiguration] = None
+        self._trigger_configuration: Optional[_TriggerConfiguration] = None
+        self._sample_count: Optional[int] = None
+        self._binary_transfer = binary_transfer
+        self._binary_format_enabled = False
+        self._strict_error_checking = strict_error_checking
+        self._pending_commands: List[str] = []
+        self._round_trip_observer = round_trip_observer
 
-        if id_query:
-            self._validate_id()
+        try:
+            if id_query:
+                self._validate_id()
 
-        if reset_device:
-            self._reset()
+            if reset_device:
+                self._reset()
+        except BaseException:
+            _close_resource(self._visa_library, shared_resource_key, session)
+            raise
 
     def close(self) -> None:
         """Close the session."""
-        self._session.close()
+        try:
+            self._flush()
+        finally:
+            _close_resource(self._visa_library, self._shared_resource_key, self._session)
 
     def __enter__(self) -> Self:
         """Context management protocol. Returns self."""
@@ -100,31 +277,322 @@ class Session:
     ) -> None:
         """Configure the common properties of the measurement.
 
-        These properties include function, range, and resolution_digits.
+        These properties include function, range, and resolution_digits. Only the properties that
+        differ from the most recently applied configuration are sent to the instrument.
         """
-        function_enum = _FUNCTION_TO_VALUE[function]
-        resolution_value = _RESOLUTION_DIGITS_TO_VALUE[str(resolution_digits)]
-
-        self._session.write("CONF:%s %.g,%.g" % (function_enum, range, resolution_value))
-        self._check_error()
+        self._configure_measurement(function, range, resolution_digits)
+        self._configure_data_format()
 
     def read(self) -> float:
         """Acquires a single measurement and returns the measured value."""
-        response = self._session.query("READ?")
-        self._check_error()
+        self._configure_sample_count(1)
+        self._configure_data_format()
+        if self._binary_format_enabled:
+            measurements = self._query_binary_values("READ?")
+            self._end_transaction()
+            return float(measurements[0])
+
+        response = self._query("READ?")
+        self._end_transaction()
         return float(response)
 
+    def read_multiple(self, count: int) -> npt.NDArray[numpy.float64]:
+        """Acquires multiple measurements and returns the measured values."""
+        self._configure_sample_count(count)
+        self._write("INIT")
+        return self.fetch_multiple(count)
+
+    def fetch_multiple(self, count: int) -> npt.NDArray[numpy.float64]:
+        """Returns the first count measured values stored in reading memory.
+
+        Raises RuntimeError if reading memory holds fewer than count values.
+        """
+        self._configure_data_format()
+        if self._binary_format_enabled:
+            measurements = self._query_binary_values("FETC?")
+        else:
+            measurements = self._query_ascii_values("FETC?")
+        self._end_transaction()
+        if len(measurements) < count:
+            # The sample count cached by the session doesn't match the instrument.
+            self.invalidate_cached_state()
+            raise RuntimeError(
+                f"The instrument returned {len(measurements)} measurements, expected {count}."
+            )
+        return numpy.ascontiguousarray(measurements[:count], dtype=numpy.float64)
+
+    def measure_scan(
+        self, configurations: Sequence[Tuple[Function, float, float]]
+    ) -> npt.NDArray[numpy.float64]:
+        """Takes one measurement with each configuration and returns the measured values.
+
+        Each configuration is a tuple of function, range, and resolution_digits. Unless strict
+        error checking is on, the configuration commands and a READ? query for each configuration
+        are sent in a single message, and the error queue is checked once at the end. Readings are
+        transferred in ASCII because the responses to the queries are separated by semicolons.
+        """
+        if self._strict_error_checking:
+            measurements = numpy.empty(len(configurations), dtype=numpy.float64)
+            for index, (function, range, resolution_digits) in enumerate(configurations):
+                self.configure_measurement_digits(function, range, resolution_digits)
+                measurements[index] = self.read()
+            return measurements
+
+        # Validate the whole scan list so that no READ? query is left behind in the deferred
+        # commands.
+        for function, _, resolution_digits in configurations:
+            if function not in _FUNCTION_TO_VALUE:
+                raise ValueError(f"Invalid function value: '{function}'.")
+            if resolution_digits not in _RESOLUTION_DIGITS_TO_VALUE:
+                raise ValueError(f"Invalid resolution digits: {resolution_digits}.")
+
+        if not configurations:
+            return numpy.empty(0, dtype=numpy.float64)
+        if self._binary_format_enabled:
+            self._write("FORM:DATA ASC")
+            self._binary_format_enabled = False
+        for index, (function, range, resolution_digits) in enumerate(configurations):
+            self._configure_measurement(function, range, resolution_digits)
+            self._configure_sample_count(1)
+            if index < len(configurations) - 1:
+                self._write("READ?")
+        responses = self._query_responses("READ?", len(configurations))
+        self._end_transaction()
+        return numpy.array([float(response) for response in responses], dtype=numpy.float64)
+
+    def configure_trigger(self, source: TriggerSource, delay: Optional[float] = None) -> None:
+        """Configure the trigger source and the delay, in seconds, between trigger and measurement.
+
+        If delay is None, the instrument selects the delay automatically. Changing the measurement
+        function resets the trigger, so configure the trigger after the measurement.
+        """
+        previous_configuration = self._trigger_configuration
+        if previous_configuration is None or previous_configuration.source != source:
+            self._write("TRIG:SOUR %s" % _TRIGGER_SOURCE_TO_VALUE[source])
+        if previous_configuration is None or previous_configuration.delay != delay:
+            self._write("TRIG:DEL:AUTO ON" if delay is None else "TRIG:DEL %g" % delay)
+        self._trigger_configuration = _TriggerConfiguration(source, delay)
+
+    def initiate(self) -> None:
+        """Send any deferred commands and arm the instrument to measure when triggered.
+
+        Errors are reported by the next fetch.
+        """
+        self._write("INIT")
+        self._flush()
+
+    def fetch(self, timeout: Optional[float] = None) -> float:
+        """Wait for the measurement started by initiate() and return the measured value.
+
+        If timeout is specified, it overrides the I/O timeout, in seconds, while waiting.
+        """
+        with self._override_timeout(timeout):
+            measurements = self.fetch_multiple(1)
+        return float(measurements[0])
+
+    def abort(self) -> None:
+        """Abort the measurement started by initiate() and discard any deferred commands.
+
+        The instrument is aborted with a device clear, which also clears its output buffer.
+        """
+        self._pending_commands.clear()
+        self.invalidate_cached_state()
+        # PyVISA-sim doesn't implement device clear, and a simulated instrument is never armed.
+        if not self._visa_library:
+            self._call_visa("clear", self._session.clear)
+
+    def invalidate_cached_state(self) -> None:
+        """Forget the cached instrument state so that it is sent again by the next operation."""
+        self._measurement_configuration = None
+        self._trigger_configuration = None
+        self._sample_count = None
+        self._binary_format_enabled = False
+
+    def query_operation_complete(self) -> bool:
+        """Returns whether the instrument responds to an operation complete query."""
+        response = self._query("*OPC?")
+        self._end_transaction()
+        return response.strip() == "1"
+
+    def _configure_measurement(
+        self, function: Function, range: float, resolution_digits: float
+    ) -> None:
+        """Configure the function, range, and resolution, skipping the ones that are unchanged."""
+        function_enum = _FUNCTION_TO_VALUE[function]
+        resolution_value = _RESOLUTION_DIGITS_TO_VALUE[resolution_digits]
+        configuration = _MeasurementConfiguration(function, range, resolution_value)
+        previous_configuration = self._measurement_configuration
+
+        if previous_configuration is None or previous_configuration.function != function:
+            self._write("CONF:%s %.g,%.g" % (function_enum, range, resolution_value))
+            # CONFigure presets the sample and trigger counts to 1 and the trigger source to
+            # immediate.
+            self._sample_count = 1
+            self._trigger_configuration = _DEFAULT_TRIGGER_CONFIGURATION
+        else:
+            if previous_configuration.range != range:
+                self._write("SENS:%s:RANG %.g" % (function_enum, range))
+            if previous_configuration.resolution_value != resolution_value:
+                self._write("SENS:%s:RES %.g" % (function_enum, resolution_value))
+        self._measurement_configuration = configuration
+
+    def _configure_sample_count(self, count: int) -> None:
+        """Configure the number of readings taken per trigger."""
+        if count < 1:
+            raise ValueError(f"Invalid sample count: {count}")
+        if self._sample_count != count:
+            self._write("SAMP:COUN %d" % count)
+            self._write("TRIG:COUN 1")
+            self._sample_count = count
+
+    def _configure_data_format(self) -> None:
+        """Switch the instrument to binary data transfer, if requested."""
+        if self._binary_transfer and not self._binary_format_enabled:
+            self._write("FORM:DATA REAL,64")
+            self._binary_format_enabled = True
+
+    def _write(self, command: str) -> None:
+        """Send a command, or defer it until the next query unless strict error checking is on."""
+        if self._strict_error_checking:
+            self._call_visa("write", self._session.write, command)
+            self._check_error()
+        else:
+            self._pending_commands.append(command)
+
+    def _query(self, command: str) -> str:
+        """Send a query along with any deferred commands and return the response."""
+        with self._invalidate_state_on_error(), self._check_error_on_timeout():
+            response = self._call_visa("query", self._session.query, self._take_message(command))
+        if self._strict_error_checking:
+            self._check_error()
+        return response
+
+    def _query_responses(self, command: str, count: int) -> List[str]:
+        """Send a message that contains count queries and return the response to each query."""
+        with self._invalidate_state_on_error(), self._check_error_on_timeout():
+            message = self._take_message(command)
+            responses = self._call_visa("query", self._session.query, message).split(";")
+            # IEEE 488.2 instruments return the responses in a single message, separated by
+            # semicolons. Some instruments, such as the PyVISA-sim simulator, return each response
+            # in a separate message.
+            while len(responses) < count:
+                responses += self._call_visa("read", self._session.read).split(";")
+        return responses
+
+    def _query_ascii_values(self, command: str) -> npt.NDArray[numpy.float64]:
+        """Query comma separated ASCII values along with any deferred commands."""
+        with self._invalidate_state_on_error(), self._check_error_on_timeout():
+            measurements = self._call_visa(
+                "query_ascii_values",
+                self._session.query_ascii_values,
+                self._take_message(command),
+                container=numpy.array,
+            )
+        if self._strict_error_checking:
+            self._check_error()
+        return numpy.asarray(measurements, dtype=numpy.float64)
+
+    def _query_binary_values(self, command: str) -> npt.NDArray[numpy.float64]:
+        """Query a definite length block of big-endian float64 values."""
+        with self._invalidate_state_on_error(), self._check_error_on_timeout():
+            measurements = self._call_visa(
+                "query_binary_values",
+                self._session.query_binary_values,
+                self._take_message(command),
+                datatype="d",
+                is_big_endian=True,
+                container=numpy.array,
+            )
+        if self._strict_error_checking:
+            self._check_error()
+        return numpy.asarray(measurements, dtype=numpy.float64)
+
+    def _take_message(self, command: str) -> str:
+        """Join the deferred commands and the given command into a single message."""
+        message = _COMMAND_SEPARATOR.join(self._pending_commands + [command])
+        self._pending_commands.clear()
+        return message
+
+    def _flush(self) -> None:
+        """Send any deferred commands."""
+        if self._pending_commands:
+            message = _COMMAND_SEPARATOR.join(self._pending_commands)
+            self._pending_commands.clear()
+            with self._invalidate_state_on_error():
+                self._call_visa("write", self._session.write, message)
+
+    def _end_transaction(self) -> None:
+        """Send any deferred commands and check the error queue once for all of them."""
+        if not self._strict_error_checking:
+            self._flush()
+            self._check_error()
+
+    def _call_visa(
+        self, operation: str, function: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> _T:
+        """Call a VISA I/O function and report its duration to the round trip observer."""
+        round_trip_observer = self._round_trip_observer
+        if round_trip_observer is None:
+            return function(*args, **kwargs)
+        start_time = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            round_trip_observer(operation, time.perf_counter() - start_time)
+
     def _check_error(self) -> None:
         """Query the instrument's error queue."""
-        response = self._session.query("SYST:ERR?")
+        response = self._call_visa("check_error", self._session.query, "SYST:ERR?")
         fields = response.split(",", maxsplit=1)
         assert len(fields) >= 1
         if int(fields[0]) != 0:
+            self.invalidate_cached_state()
             raise RuntimeError("Instrument returned error %s: %s" % (fields[0], fields[1]))
 
+    @contextlib.contextmanager
+    def _override_timeout(self, timeout: Optional[float]) -> Generator[None, None, None]:
+        """Change the I/O timeout, in seconds, until the with statement exits."""
+        if timeout is None:
+            yield
+            return
+        previous_timeout = self._session.timeout
+        self._session.timeout = timeout * 1000.0
+        try:
+            yield
+        finally:
+            self._session.timeout = previous_timeout
+
+    @contextlib.contextmanager
+    def _check_error_on_timeout(self) -> Generator[None, None, None]:
+        """Report the instrument error that caused a query with deferred commands to time out.
+
+        An error in a deferred command aborts the rest of the message, so the instrument never
+        responds to the query that was sent with it.
+        """
+        batched = bool(self._pending_commands)
+        try:
+            yield
+        except pyvisa.errors.VisaIOError as e:
+            if not batched or e.error_code != pyvisa.constants.StatusCode.error_timeout:
+                raise
+            try:
+                self._check_error()
+            except RuntimeError as error:
+                raise error from e
+            raise
+
+    @contextlib.contextmanager
+    def _invalidate_state_on_error(self) -> Generator[None, None, None]:
+        """Invalidate the cached instrument state if an I/O error occurs."""
+        try:
+            yield
+        except pyvisa.errors.VisaIOError:
+            self.invalidate_cached_state()
+            raise
+
     def _validate_id(self) -> None:
         """Check the selected instrument is proper and responding.."""
-        instrument_id = self._session.query("*IDN?")
+        instrument_id = self._call_visa("id_query", self._session.query, "*IDN?")
         if not any(id_check in instrument_id for id_check in _SUPPORTED_INSTRUMENT_IDS):
             raise RuntimeError(
                 "The ID query failed. This may mean that you selected the wrong instrument, your instrument did not respond, "
@@ -133,6 +601,10 @@ class Session:
 
     def _reset(self) -> None:
         """Reset the instrument to a known state."""
-        self._session.write("*CLS")
-        self._session.write("*RST")
+        self._call_visa("write", self._session.write, "*CLS")
+        self._call_visa("write", self._session.write, "*RST")
         self._check_error()
+        self.invalidate_cached_state()
+        # *RST presets the sample and trigger counts to 1 and the trigger source to immediate.
+        self._sample_count = 1
+        self._trigger_configuration = _DEFAULT_TRIGGER_CONFIGURATION
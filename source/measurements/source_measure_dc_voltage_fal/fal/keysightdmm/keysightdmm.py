@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import contextlib
 import pathlib
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from decouple import AutoConfig
 from fal.initialize_session import InitializeSession
+from fal.instrumentation import instrumented
 from fal.keysightdmm import _keysight_dmm
 from fal.keysightdmm._keysight_dmm_session_management import (
     KeysightDmmSessionConstructor,
 )
 from fal.measure_dc_voltage import MeasureDCVoltage
+from fal.trigger_line import TriggerLine
+from fal.triggered_measure_dc_voltage import TriggeredMeasureDCVoltage
 from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
 from ni_measurement_plugin_sdk_service.session_management import (
     BaseReservation,
@@ -23,7 +26,7 @@ from ni_measurement_plugin_sdk_service.session_management import (
 _config = AutoConfig(str(pathlib.Path.cwd()))
 
 
-class Session(InitializeSession, MeasureDCVoltage):
+class Session(InitializeSession, MeasureDCVoltage, TriggeredMeasureDCVoltage):
     """NI-VISA session wrapper for Keysight DMM."""
 
     @contextlib.contextmanager
@@ -55,9 +58,40 @@ class Session(InitializeSession, MeasureDCVoltage):
         with reservation.initialize_session(
             session_constructor, _keysight_dmm.INSTRUMENT_TYPE_ID
         ) as session_info:
-            self._session = session_info.session
+            self._set_session(session_info.session)
             yield
 
+    @classmethod
+    @contextlib.contextmanager
+    def initialize_sessions(
+        cls,
+        measurement_context: MeasurementContext,
+        reservation: BaseReservation,
+        reset_device: bool,
+        options: Optional[Dict[str, Any]],
+        initialization_behavior: SessionInitializationBehavior,
+    ) -> Generator[List[InitializeSession], None, None]:
+        """Initialize the reserved Keysight DMM sessions."""
+        session_constructor = KeysightDmmSessionConstructor(
+            _config, reservation._discovery_client, reset_device, initialization_behavior
+        )
+        with reservation.initialize_sessions(
+            session_constructor, _keysight_dmm.INSTRUMENT_TYPE_ID
+        ) as session_infos:
+            sessions: List[InitializeSession] = []
+            for session_info in session_infos:
+                session = cls()
+                session._set_session(session_info.session)
+                sessions.append(session)
+            yield sessions
+
+    def _set_session(self, session: _keysight_dmm.Session) -> None:
+        self._session = session
+        self._initiate_trigger_configuration: Tuple[
+            _keysight_dmm.TriggerSource, Optional[float]
+        ] = (_keysight_dmm.TriggerSource.IMMEDIATE, None)
+
+    @instrumented
     def measure_dc_voltage(
         self,
         voltage_level_range: float,
@@ -78,4 +112,80 @@ class Session(InitializeSession, MeasureDCVoltage):
         self._session.configure_measurement_digits(
             keysight_dmm_function, voltage_level_range, resolution_digits
         )
+        self._session.configure_trigger(_keysight_dmm.TriggerSource.IMMEDIATE)
         return self._session.read()
+
+    def configure_trigger(
+        self, trigger_source: TriggerLine, trigger_delay: Optional[float] = None
+    ) -> None:
+        """Configure the trigger that starts the measurement acquired by initiate().
+
+        The Keysight DMM has a single external trigger input, so every trigger line other than
+        IMMEDIATE selects `TRIG:SOUR EXT`. Route the trigger line to the Ext Trig connector.
+
+        Args:
+            trigger_source: The trigger line that starts the measurement, or IMMEDIATE to start
+                measuring as soon as the acquisition is initiated.
+
+            trigger_delay: The time, in seconds, between the trigger and the measurement. If this
+                argument is not specified, the instrument selects the delay automatically.
+        """
+        if trigger_source == TriggerLine.NONE:
+            raise ValueError(f"Invalid trigger source: '{trigger_source.name}'.")
+        if trigger_source == TriggerLine.IMMEDIATE:
+            source = _keysight_dmm.TriggerSource.IMMEDIATE
+        else:
+            source = _keysight_dmm.TriggerSource.EXTERNAL
+        self._initiate_trigger_configuration = (source, trigger_delay)
+
+    @instrumented
+    def initiate(self, voltage_level_range: float, resolution_digits: float) -> None:
+        """Configure a DC voltage measurement and arm the instrument to take it when triggered.
+
+        Args:
+            voltage_level_range: The range defines the valid values to which the voltage level can
+                be set.
+
+            resolution_digits: The number of digits to which the measurement is rounded.
+        """
+        self._session.configure_measurement_digits(
+            _keysight_dmm.Function.DC_VOLTS, voltage_level_range, resolution_digits
+        )
+        self._session.configure_trigger(*self._initiate_trigger_configuration)
+        self._session.initiate()
+
+    @instrumented
+    def fetch(self, timeout: float) -> float:
+        """Waits for the measurement started by initiate() and returns the measured value.
+
+        Args:
+            timeout: The maximum time, in seconds, to wait for the measurement.
+
+        Returns:
+            The measured voltage value.
+        """
+        return self._session.fetch(timeout)
+
+    def abort(self) -> None:
+        """Abort the measurement started by initiate()."""
+        self._session.abort()
+
+    def export_measure_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Pulses the trigger line each time a measurement completes.
+
+        The Keysight DMM always pulses its VM Comp connector when a measurement completes, so the
+        only supported output terminal is EXTERNAL. Route the VM Comp connector to the trigger line.
+
+        Args:
+            output_terminal: The trigger line to pulse. It must be EXTERNAL.
+        """
+        if output_terminal != TriggerLine.EXTERNAL:
+            raise ValueError(f"Invalid output terminal: '{output_terminal.name}'.")
+
+    def _is_session_healthy(self) -> bool:
+        """Returns whether the instrument session can still be used."""
+        return self._session.query_operation_complete()
+
+    def _reset_cached_state(self) -> None:
+        """Forget any instrument state cached by the session wrapper."""
+        self._session.invalidate_cached_state()
@@ -0,0 +1,147 @@
+"""Serializes the measurements in this process that use the same instruments."""
+
+import contextlib
+import threading
+import time
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from fal.instrumentation import (
+    _DURATION_BUCKET_BOUNDS,
+    HistogramSnapshot,
+    _Histogram,
+    record_lock_wait,
+)
+from ni_measurement_plugin_sdk_service.session_management import SessionInformation
+
+_T = TypeVar("_T")
+
+
+def get_lock_names(session_infos: Iterable[SessionInformation]) -> List[str]:
+    """Returns the names of the instruments used by the sessions.
+
+    A session that spans several instruments has a comma-separated resource name. Sessions without
+    a resource name are identified by their session name.
+    """
+    names: Set[str] = set()
+    for session_info in session_infos:
+        resource_names = [name.strip() for name in session_info.resource_name.split(",")]
+        names.update(name for name in resource_names if name)
+        if not any(resource_names):
+            names.add(session_info.session_name)
+    return sorted(names)
+
+
+class InstrumentLockManager:
+    """Serializes the measurements in this process that use the same instruments.
+
+    Each instrument has a lock, keyed by its resource name. Measurements that use different
+    instruments run in parallel, and measurements that share an instrument run one at a time.
+    Locks are always acquired in sorted order, so measurements that lock several instruments can't
+    deadlock each other. The time spent waiting for the locks is recorded in a histogram.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the lock manager."""
+        self._locks: Dict[str, threading.RLock] = {}
+        self._lock_names_by_key: Dict[Hashable, List[str]] = {}
+        self._lock = threading.Lock()
+        self._wait_time_histogram = _Histogram(_DURATION_BUCKET_BOUNDS)
+
+    def wait_times(self) -> HistogramSnapshot:
+        """Returns a snapshot of the time, in seconds, spent waiting for instrument locks."""
+        with self._lock:
+            return self._wait_time_histogram.snapshot()
+
+    @contextlib.contextmanager
+    def lock(self, names: Iterable[str]) -> Generator[None, None, None]:
+        """Lock the instruments for the duration of the with statement.
+
+        Args:
+            names: The names of the instruments to lock.
+        """
+        with self._lock:
+            locks = [self._locks.setdefault(name, threading.RLock()) for name in sorted(set(names))]
+        if not locks:
+            yield
+            return
+        start_time = time.perf_counter()
+        with contextlib.ExitStack() as stack:
+            for lock in locks:
+                lock.acquire()
+                stack.callback(lock.release)
+            wait_time = time.perf_counter() - start_time
+            with self._lock:
+                self._wait_time_histogram.record(wait_time)
+            record_lock_wait(wait_time)
+            yield
+
+    @contextlib.contextmanager
+    def reserve_and_lock(
+        self,
+        key: Hashable,
+        reserve: Callable[[], ContextManager[_T]],
+        get_session_infos: Callable[[_T], Iterable[SessionInformation]],
+    ) -> Generator[_T, None, None]:
+        """Reserve sessions and lock their instruments for the duration of the with statement.
+
+        The sessions are reserved after locking the instruments that were reserved the last time
+        the same key was used, so a measurement waits for other measurements in this process
+        instead of failing to reserve the sessions. If the reservation includes instruments that
+        were not locked, which only happens the first time a key is used or when the pin map
+        changes, the sessions are unreserved and the instruments are released, and then all of
+        the instruments of the reservation are locked in sorted order and the sessions are
+        reserved again. If the sessions can't be reserved the first time a key is used, another
+        measurement in this process may be using the instruments, so the sessions are reserved
+        again after locking every instrument that this lock manager has locked before.
+
+        Args:
+            key: Identifies the pins and sites being reserved.
+
+            reserve: Reserves the sessions.
+
+            get_session_infos: Returns the session information of the reservation.
+
+        Yields:
+            The reservation.
+        """
+        with self._lock:
+            names: Optional[List[str]] = self._lock_names_by_key.get(key)
+        while True:
+            with contextlib.ExitStack() as stack:
+                stack.enter_context(self.lock(names or []))
+                try:
+                    reservation = stack.enter_context(reserve())
+                except Exception:
+                    if names is not None:
+                        raise
+                    with self._lock:
+                        names = sorted(self._locks)
+                    if not names:
+                        raise
+                    continue
+                reserved_names = get_lock_names(get_session_infos(reservation))
+                with self._lock:
+                    self._lock_names_by_key[key] = reserved_names
+                if names is not None and set(reserved_names).issubset(names):
+                    yield reservation
+                    return
+            names = reserved_names
+
+
+_lock_manager = InstrumentLockManager()
+
+
+def get_lock_manager() -> InstrumentLockManager:
+    """Returns the lock manager shared by the measurements in this process."""
+    return _lock_manager
@@ -0,0 +1,137 @@
+"""An abstract class to source and measure DC voltage on several pins and helpers for pin groups."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, NamedTuple, Sequence, Tuple
+
+from fal.measure_dc_voltage import MeasureDCVoltage
+from fal.source_dc_voltage import SourceDCVoltage
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing as npt
+
+
+class SourceDCVoltageParameters(NamedTuple):
+    """The parameters to source a DC voltage on a pin."""
+
+    voltage_level_range: float
+    voltage_level: float
+    current_limit_range: float
+    current_limit: float
+    source_delay: float
+
+
+class MultiPinDCVoltage(ABC):
+    """An abstract class to source and measure DC voltage on several pins of a session at once."""
+
+    @abstractmethod
+    def source_dc_voltage_multi(self, parameters: Mapping[str, SourceDCVoltageParameters]) -> None:
+        """Sources a DC voltage on the channels of each pin, with one driver call per operation."""
+        pass
+
+    @abstractmethod
+    def measure_dc_voltage_multi(
+        self, pin_names: Sequence[str], voltage_level_range: float, resolution_digits: float
+    ) -> List[npt.NDArray[numpy.float64]]:
+        """Measures the voltage of the channels of each pin, in pin order, with one driver call."""
+        pass
+
+    @abstractmethod
+    def get_channel_names(self, pin_name: str) -> List[str]:
+        """Returns the channels of the session that the pin is connected to."""
+        pass
+
+
+def source_dc_voltage_multi(
+    sessions: Mapping[str, Any], parameters: Mapping[str, SourceDCVoltageParameters]
+) -> None:
+    """Sources a DC voltage on each pin.
+
+    The pins are grouped by session. Sessions that support multi-pin operations source all of their
+    pins with one driver call per operation. Other sessions source their pins with a single
+    source_dc_voltage() call, so all of their pins must use the same parameters.
+
+    Args:
+        sessions: A dictionary of pin names and their corresponding session objects, as returned
+            by initialize().
+
+        parameters: A dictionary of pin names and the parameters to source on them.
+    """
+    for session, pin_names in _group_pins_by_session(sessions, list(parameters)):
+        if isinstance(session, MultiPinDCVoltage):
+            session.source_dc_voltage_multi({pin: parameters[pin] for pin in pin_names})
+            continue
+
+        session_parameters = parameters[pin_names[0]]
+        if any(parameters[pin] != session_parameters for pin in pin_names):
+            raise ValueError(
+                f"The pins {pin_names} share a session that can't source different parameters on "
+                f"each pin."
+            )
+        source_session: SourceDCVoltage = session
+        source_session.source_dc_voltage(**session_parameters._asdict())
+
+
+def measure_dc_voltage_multi(
+    sessions: Mapping[str, Any],
+    pin_names: Sequence[str],
+    voltage_level_range: float,
+    resolution_digits: float,
+) -> npt.NDArray[numpy.float64]:
+    """Measures the voltage of each pin.
+
+    The pins are grouped by session and each session measures all of its pins with one driver call.
+    Sessions that support multi-pin operations return one reading per channel of each pin, so a pin
+    that is connected to a channel on several sites of the session returns one reading per site.
+    Other sessions measure once and the reading is returned for each of their pins.
+
+    Args:
+        sessions: A dictionary of pin names and their corresponding session objects, as returned
+            by initialize().
+
+        pin_names: The pins to measure.
+
+        voltage_level_range: The range defines the valid values to which the voltage level can
+            be set.
+
+        resolution_digits: The number of digits to which each measurement is rounded.
+
+    Returns:
+        The measured voltages, in the order of pin_names.
+    """
+    # Imported here so that importing the FAL doesn't import numpy.
+    import numpy
+
+    readings: Dict[str, npt.NDArray[numpy.float64]] = {}
+    for session, session_pin_names in _group_pins_by_session(sessions, pin_names):
+        if isinstance(session, MultiPinDCVoltage):
+            unique_pin_names = list(dict.fromkeys(session_pin_names))
+            session_readings = session.measure_dc_voltage_multi(
+                unique_pin_names, voltage_level_range, resolution_digits
+            )
+            readings.update(zip(unique_pin_names, session_readings))
+        else:
+            measure_session: MeasureDCVoltage = session
+            reading = measure_session.measure_dc_voltage(
+                voltage_level_range=voltage_level_range, resolution_digits=resolution_digits
+            )
+            for pin in session_pin_names:
+                readings[pin] = numpy.array([reading], dtype=numpy.float64)
+    if not pin_names:
+        return numpy.empty(0, dtype=numpy.float64)
+    return numpy.concatenate([readings[pin] for pin in pin_names])
+
+
+def _group_pins_by_session(
+    sessions: Mapping[str, Any], pin_names: Sequence[str]
+) -> List[Tuple[Any, List[str]]]:
+    """Returns each session with its pins, in the order in which the sessions are first used."""
+    groups: Dict[int, Tuple[Any, List[str]]] = {}
+    for pin in pin_names:
+        session = sessions.get(pin)
+        if session is None:
+            raise ValueError(f"No session found for pin: '{pin}'.")
+        groups.setdefault(id(session), (session, []))[1].append(pin)
+    return list(groups.values())
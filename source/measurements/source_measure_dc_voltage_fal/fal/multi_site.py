@@ -0,0 +1,147 @@
+"""Runs a measurement on each site in parallel."""
+
+import concurrent.futures
+import contextvars
+import logging
+import time
+from typing import Callable, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
+from ni_measurement_plugin_sdk_service.session_management import (
+    MultiSessionReservation,
+    PinMapContext,
+    SingleSessionReservation,
+)
+
+_logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Sites that share an instrument wait for each other's reservation, up to this many seconds.
+_DEFAULT_RESERVATION_TIMEOUT = 10.0
+
+
+class SiteMeasurementContext(MeasurementContext):
+    """A measurement context that reserves the sessions of one site of the measurement.
+
+    Pins and pin groups reserved through this context resolve to the sessions and channels of the
+    site, so initialize() returns the site's sessions. Cancellation, deadlines, and aborting apply
+    to the whole measurement.
+    """
+
+    def __init__(
+        self, site: int, reservation_timeout: float = _DEFAULT_RESERVATION_TIMEOUT
+    ) -> None:
+        """Initialize the measurement context of a site.
+
+        Args:
+            site: The site number.
+
+            reservation_timeout: The default timeout, in seconds, to wait for the site's sessions
+                to be reserved. Sites that share an instrument wait for each other to unreserve
+                it. Specify -1 to wait indefinitely.
+        """
+        self._site = site
+        self._reservation_timeout = reservation_timeout
+
+    @property
+    def site(self) -> int:
+        """The site number."""
+        return self._site
+
+    @property
+    def pin_map_context(self) -> PinMapContext:
+        """Get the pin map context for the site."""
+        return super().pin_map_context._replace(sites=[self._site])
+
+    def reserve_session(
+        self,
+        pin_or_relay_names: Union[str, Iterable[str]],
+        timeout: Optional[float] = None,
+    ) -> SingleSessionReservation:
+        """Reserve a single session of the site.
+
+        If timeout is not specified, the site's reservation timeout is used.
+        """
+        if timeout is None:
+            timeout = self._reservation_timeout
+        return super().reserve_session(pin_or_relay_names, timeout)
+
+    def reserve_sessions(
+        self,
+        pin_or_relay_names: Union[str, Iterable[str]],
+        timeout: Optional[float] = None,
+    ) -> MultiSessionReservation:
+        """Reserve the sessions of the site.
+
+        If timeout is not specified, the site's reservation timeout is used.
+        """
+        if timeout is None:
+            timeout = self._reservation_timeout
+        return super().reserve_sessions(pin_or_relay_names, timeout)
+
+
+def run_per_site(
+    measurement_context: MeasurementContext,
+    function: Callable[[MeasurementContext], _T],
+    max_workers: Optional[int] = None,
+    reservation_timeout: float = _DEFAULT_RESERVATION_TIMEOUT,
+) -> List[_T]:
+    """Run a function for each site of the measurement, in parallel.
+
+    Each call receives a SiteMeasurementContext for its site. The calls run on a thread pool, so
+    the measurement takes as long as the slowest site rather than the sum of the sites. Sites that
+    share an instrument wait for each other's reservation, and a site fails if its sessions can't be
+    reserved within the reservation timeout.
+
+    Args:
+        measurement_context: Proxy for the Measurement Service's context-local state.
+
+        function: The function that measures a site. It is called with the site's measurement
+            context.
+
+        max_workers: Specifies the maximum number of sites to run in parallel. If this argument is
+            not specified, all of the sites run in parallel.
+
+        reservation_timeout: The timeout, in seconds, to wait for each site's sessions to be
+            reserved. If this argument is not specified, each site waits up to 10 seconds. Specify 0
+            to fail if another site has reserved one of the sessions, or -1 to wait indefinitely.
+
+    Returns:
+        The return values of the function, in the order of the sites in the pin map context. If
+        the pin map context doesn't specify sites, the function is called once with
+        measurement_context and its return value is the only element.
+    """
+    sites = list(measurement_context.pin_map_context.sites or [])
+    if not sites:
+        return [function(measurement_context)]
+
+    def run_site(site: int) -> _T:
+        start_time = time.perf_counter()
+        result = function(SiteMeasurementContext(site, reservation_timeout))
+        _logger.info("Measured site %d in %.3f s.", site, time.perf_counter() - start_time)
+        return result
+
+    if len(sites) == 1 or (max_workers is not None and max_workers <= 1):
+        return [run_site(site) for site in sites]
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers or len(sites), thread_name_prefix="MeasurementSite"
+    ) as executor:
+        # Each thread needs a copy of the context variables that hold the RPC state.
+        futures = [
+            executor.submit(contextvars.copy_context().run, run_site, site) for site in sites
+        ]
+
+    errors: List[Tuple[int, BaseException]] = []
+    for site, future in zip(sites, futures):
+        error = future.exception()
+        if error is not None:
+            errors.append((site, error))
+    if len(errors) == 1:
+        raise errors[0][1]
+    elif errors:
+        details = "\n".join(f"  site {site}: {error}" for site, error in errors)
+        first_error = errors[0][1]
+        raise RuntimeError(f"Failed to measure {len(errors)} sites:\n{details}") from first_error
+    return [future.result() for future in futures]
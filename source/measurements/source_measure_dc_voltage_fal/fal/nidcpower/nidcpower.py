@@ -3,18 +3,27 @@
 import contextlib
 import threading
 import time
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
 
 import grpc
 import hightime
 import nidcpower
+import numpy
+import numpy.typing as npt
+from fal.export_source_complete_trigger import ExportSourceCompleteTrigger
 from fal.initialize_session import InitializeSession
+from fal.instrumentation import instrumented
 from fal.measure_dc_voltage import MeasureDCVoltage
+from fal.multi_pin_dc_voltage import MultiPinDCVoltage, SourceDCVoltageParameters
+from fal.source_and_measure_dc_voltage import SourceAndMeasureDCVoltage
 from fal.source_dc_voltage import SourceDCVoltage
+from fal.sweep_dc_voltage import SweepDCVoltage
+from fal.trigger_line import TriggerLine
 from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
 from ni_measurement_plugin_sdk_service.session_management import (
     BaseReservation,
     SessionInitializationBehavior,
+    TypedSessionInformation,
 )
 
 _NIDCPOWER_WAIT_FOR_EVENT_TIMEOUT_ERROR_CODE = -1074116059
@@ -24,8 +33,48 @@ _NIDCPOWER_TIMEOUT_ERROR_CODES = [
     _NIDCPOWER_TIMEOUT_EXCEEDED_ERROR_CODE,
 ]
 
+# Bounds for the time spent in each wait_for_event call. The wait returns as soon as the event
+# occurs; the interval only limits how long cancellation and deadlines go unchecked. It starts
+# near the expected wait time and doubles while the event is still pending.
+_WAIT_FOR_EVENT_MIN_POLL_INTERVAL = 1e-3
+_WAIT_FOR_EVENT_MAX_POLL_INTERVAL = 100e-3
 
-class Session(InitializeSession, SourceDCVoltage, MeasureDCVoltage):
+# Properties that can be changed while the output is running. Changing them updates the output and
+# generates the Source Complete event after the source delay, without aborting and initiating.
+_DYNAMIC_PROPERTIES = frozenset({"voltage_level"})
+
+# NI-DCPower accepts terminal names without the device name. An empty terminal name stops
+# exporting the event.
+_TRIGGER_LINE_TO_TERMINAL = {
+    TriggerLine.NONE: "",
+    TriggerLine.PXI_TRIG0: "PXI_Trig0",
+    TriggerLine.PXI_TRIG1: "PXI_Trig1",
+    TriggerLine.PXI_TRIG2: "PXI_Trig2",
+    TriggerLine.PXI_TRIG3: "PXI_Trig3",
+    TriggerLine.PXI_TRIG4: "PXI_Trig4",
+    TriggerLine.PXI_TRIG5: "PXI_Trig5",
+    TriggerLine.PXI_TRIG6: "PXI_Trig6",
+    TriggerLine.PXI_TRIG7: "PXI_Trig7",
+}
+
+
+class _PropertyWrite(NamedTuple):
+    """A property value to write to a group of channels."""
+
+    name: str
+    value: Any
+    channel_names: Tuple[str, ...]
+
+
+class Session(
+    InitializeSession,
+    SourceDCVoltage,
+    MeasureDCVoltage,
+    SourceAndMeasureDCVoltage,
+    SweepDCVoltage,
+    ExportSourceCompleteTrigger,
+    MultiPinDCVoltage,
+):
     """NI-DCPower session Wrapper."""
 
     @contextlib.contextmanager
@@ -54,12 +103,64 @@ class Session(InitializeSession, SourceDCVoltage, MeasureDCVoltage):
         with reservation.initialize_nidcpower_session(
             reset_device, options, initialization_behavior
         ) as session_info:
-            self._measurement_context = measurement_context
-            self._channel_list = session_info.channel_list
-            self._session = session_info.session
+            self._set_session(measurement_context, session_info)
             yield
-            self._session.abort()  # Aborts any ongoing sourcing before closing the session.
+            self._release_session()
 
+    @classmethod
+    @contextlib.contextmanager
+    def initialize_sessions(
+        cls,
+        measurement_context: MeasurementContext,
+        reservation: BaseReservation,
+        reset_device: bool,
+        options: Optional[Dict[str, Any]],
+        initialization_behavior: SessionInitializationBehavior,
+    ) -> Generator[List[InitializeSession], None, None]:
+        """Initialize the reserved NI-DCPower sessions."""
+        with reservation.initialize_nidcpower_sessions(
+            reset_device, options, initialization_behavior
+        ) as session_infos, contextlib.ExitStack() as stack:
+            sessions: List[InitializeSession] = []
+            for session_info in session_infos:
+                session = cls()
+                session._set_session(measurement_context, session_info)
+                stack.callback(session._release_session)
+                sessions.append(session)
+            yield sessions
+
+    def _set_session(
+        self,
+        measurement_context: MeasurementContext,
+        session_info: TypedSessionInformation[nidcpower.Session],
+    ) -> None:
+        self._measurement_context = measurement_context
+        self._channel_list = session_info.channel_list
+        self._session = session_info.session
+        self._channel_names = [
+            channel.strip() for channel in self._channel_list.split(",") if channel.strip()
+        ]
+        # The channels of each pin, in site order.
+        self._pin_channel_names: Dict[str, List[str]] = {}
+        for channel_mapping in session_info.channel_mappings:
+            self._pin_channel_names.setdefault(channel_mapping.pin_or_relay_name, []).append(
+                channel_mapping.channel
+            )
+        self._channels = self._session.channels[self._channel_list]
+        # Channel handles for groups of channels, keyed by channel names.
+        self._channel_handles = {tuple(self._channel_names): self._channels}
+        # Property values most recently written to each channel, keyed by property name.
+        self._properties: Dict[str, Dict[str, Any]] = {}
+        # The channels that are sourcing the configuration written by source_dc_voltage().
+        self._sourcing_channel_names: Set[str] = set()
+        # The gRPC context of the measurement whose cancellation sets the event.
+        self._cancellation: Optional[Tuple[grpc.ServicerContext, threading.Event]] = None
+
+    def _release_session(self) -> None:
+        self._cancellation = None
+        self._session.abort()  # Aborts any ongoing sourcing before closing the session.
+
+    @instrumented
     def source_dc_voltage(
         self,
         voltage_level_range: float,
@@ -86,19 +187,12 @@ class Session(InitializeSession, SourceDCVoltage, MeasureDCVoltage):
             source_delay: Determines when, in seconds, the device generates the Source Complete
                 event.
         """
-        channels = self._session.channels[self._channel_list]
-        channels.abort()  # Abort any ongoing sourcing from these channels.
-        channels.source_mode = nidcpower.SourceMode.SINGLE_POINT
-        channels.output_function = nidcpower.OutputFunction.DC_VOLTAGE
-        channels.voltage_level_range = voltage_level_range
-        channels.voltage_level = voltage_level
-        channels.source_delay = hightime.timedelta(seconds=source_delay)
-        channels.current_limit = current_limit
-        channels.current_limit_range = current_limit_range
-        timeout = source_delay + 10.0
-        channels.initiate()
-        self._wait_for_event(channels, threading.Event(), nidcpower.Event.SOURCE_COMPLETE, timeout)
+        parameters = SourceDCVoltageParameters(
+            voltage_level_range, voltage_level, current_limit_range, current_limit, source_delay
+        )
+        self._source_dc_voltage({channel: parameters for channel in self._channel_names})
 
+    @instrumented
     def measure_dc_voltage(
         self,
         voltage_level_range: float,
@@ -114,37 +208,439 @@ class Session(InitializeSession, SourceDCVoltage, MeasureDCVoltage):
         Returns:
             The measured voltage value.
         """
-        channels = self._session.channels[self._channel_list]
-        voltage_measurement: float = channels.measure(nidcpower.MeasurementTypes.VOLTAGE)
+        with self._invalidate_state_on_error():
+            voltage_measurement: float = self._channels.measure(nidcpower.MeasurementTypes.VOLTAGE)
         return voltage_measurement
 
+    @instrumented
+    def source_and_measure_dc_voltage(
+        self,
+        voltage_level_range: float,
+        voltage_level: float,
+        current_limit_range: float,
+        current_limit: float,
+        source_delay: float,
+        pin_name: Optional[str] = None,
+    ) -> Tuple[float, float]:
+        """Sources a DC voltage and measures the voltage and current when sourcing completes.
+
+        The measurement is triggered by the Source Complete event, so the voltage and current are
+        returned by a single fetch instead of separate wait and measure calls.
+
+        Args:
+            voltage_level_range: The range defines the valid values to which the voltage level can
+                be set.
+
+            voltage_level: Specifies the voltage level, in volts, that the device attempts to
+                generate on the specified channel(s).
+
+            current_limit_range: The range defines the valid values to which the current limit can
+                be set.
+
+            current_limit: Specifies the current limit, in amps, that the output cannot exceed when
+                generating the desired voltage level on the specified channel(s).
+
+            source_delay: Determines when, in seconds, the device generates the Source Complete
+                event.
+
+            pin_name: The pin whose channels source and measure the voltage. If this argument is
+                not specified, all of the channels of the session are used.
+
+        Returns:
+            The voltage and current measured on the first channel of the pin.
+        """
+        if pin_name is None:
+            channel_names = self._channel_names
+        else:
+            channel_names = self._get_pin_channel_names([pin_name])
+        channels = self._get_channels(channel_names)
+        timeout = source_delay + 10.0
+        properties = {
+            "source_mode": nidcpower.SourceMode.SINGLE_POINT,
+            "measure_when": nidcpower.MeasureWhen.AUTOMATICALLY_AFTER_SOURCE_COMPLETE,
+            "measure_record_length": 1,
+            "output_function": nidcpower.OutputFunction.DC_VOLTAGE,
+            "voltage_level_range": voltage_level_range,
+            "voltage_level": voltage_level,
+            "source_delay": hightime.timedelta(seconds=source_delay),
+            "current_limit": current_limit,
+            "current_limit_range": current_limit_range,
+        }
+        property_writes = self._get_property_writes(dict.fromkeys(channel_names, properties))
+        with self._invalidate_state_on_error():
+            self._abort(channel_names)  # Abort any ongoing sourcing from these channels.
+            self._write_properties(property_writes)
+            channels.initiate()
+            measurement = channels.fetch_multiple(1, timeout=hightime.timedelta(seconds=timeout))[0]
+        return measurement.voltage, measurement.current
+
+    @instrumented
+    def sweep_dc_voltage(
+        self,
+        voltage_levels: Sequence[float],
+        voltage_level_range: float,
+        current_limit_range: float,
+        current_limit: float,
+        source_delay: float,
+    ) -> Tuple[npt.NDArray[numpy.float64], npt.NDArray[numpy.float64]]:
+        """Sources a hardware-timed sequence of DC voltages and measures after each step.
+
+        Args:
+            voltage_levels: The voltage levels, in volts, to source in order.
+
+            voltage_level_range: The range defines the valid values to which the voltage level can
+                be set.
+
+            current_limit_range: The range defines the valid values to which the current limit can
+                be set.
+
+            current_limit: Specifies the current limit, in amps, that the output cannot exceed when
+                generating the desired voltage level on the specified channel(s).
+
+            source_delay: Determines when, in seconds, the device generates the Source Complete
+                event for each step.
+
+        Returns:
+            The measured voltages and currents. The readings of each channel of the session are
+            returned one after another, in channel order, with one reading per voltage level.
+
+        Raises:
+            ValueError: If voltage_levels is empty.
+        """
+        count = len(voltage_levels)
+        if not count:
+            raise ValueError("The voltage levels must not be empty.")
+        timeout = source_delay * count + 10.0
+        properties = {
+            "source_mode": nidcpower.SourceMode.SEQUENCE,
+            "measure_when": nidcpower.MeasureWhen.AUTOMATICALLY_AFTER_SOURCE_COMPLETE,
+            "measure_record_length": 1,
+            "output_function": nidcpower.OutputFunction.DC_VOLTAGE,
+            "voltage_level_range": voltage_level_range,
+            "current_limit": current_limit,
+            "current_limit_range": current_limit_range,
+        }
+        property_writes = self._get_property_writes(dict.fromkeys(self._channel_names, properties))
+        with self._invalidate_state_on_error():
+            self._abort(self._channel_names)  # Abort any ongoing sourcing from these channels.
+            self._write_properties(property_writes)
+            self._channels.set_sequence(list(voltage_levels), [source_delay] * count)
+            self._channels.initiate()
+            self._wait_for_event(
+                self._channels,
+                nidcpower.Event.SEQUENCE_ENGINE_DONE,
+                timeout,
+                source_delay * count,
+            )
+            measurements = self._channels.fetch_multiple(
+                count, timeout=hightime.timedelta(seconds=10.0)
+            )
+        voltages = numpy.fromiter(
+            (measurement.voltage for measurement in measurements), dtype=numpy.float64
+        )
+        currents = numpy.fromiter(
+            (measurement.current for measurement in measurements), dtype=numpy.float64
+        )
+        return voltages, currents
+
+    @instrumented
+    def export_source_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Pulses the trigger line each time sourcing completes.
+
+        The terminal is applied by the next source_dc_voltage() call, which generates the Source
+        Complete event after the source delay. While the event is exported, source_dc_voltage()
+        re-initiates the channels if the configuration didn't change, so every call pulses the
+        trigger line.
+
+        Args:
+            output_terminal: The PXI trigger line to pulse, or NONE to stop exporting the event.
+        """
+        terminal = _TRIGGER_LINE_TO_TERMINAL.get(output_terminal)
+        if terminal is None:
+            raise ValueError(f"Invalid output terminal: '{output_terminal.name}'.")
+        property_writes = self._get_property_writes(
+            dict.fromkeys(self._channel_names, {"source_complete_event_output_terminal": terminal})
+        )
+        if property_writes:
+            with self._invalidate_state_on_error():
+                # The terminal can't be changed while the channels are running.
+                self._abort(self._channel_names)
+                self._write_properties(property_writes)
+
+    @instrumented
+    def source_dc_voltage_multi(self, parameters: Mapping[str, SourceDCVoltageParameters]) -> None:
+        """Sources a DC voltage on the channels of each pin.
+
+        All of the channels are aborted, configured, and initiated together. Channels that use the
+        same value of a property are configured with one property write. If only the voltage
+        levels change while the channels are sourcing, the levels are updated without aborting.
+
+        Args:
+            parameters: A dictionary of pin names and the parameters to source on them.
+        """
+        channel_parameters: Dict[str, SourceDCVoltageParameters] = {}
+        for pin, pin_parameters in parameters.items():
+            for channel in self._get_pin_channel_names([pin]):
+                channel_parameters[channel] = pin_parameters
+        if channel_parameters:
+            self._source_dc_voltage(channel_parameters)
+
+    @instrumented
+    def measure_dc_voltage_multi(
+        self, pin_names: Sequence[str], voltage_level_range: float, resolution_digits: float
+    ) -> List[npt.NDArray[numpy.float64]]:
+        """Measures the voltage of the channels of each pin with one driver call.
+
+        Args:
+            pin_names: The pins to measure.
+
+            voltage_level_range: This parameter is unused.
+
+            resolution_digits: This parameter is unused.
+
+        Returns:
+            The measured voltages of the channels of each pin, in site order, in the order of
+            pin_names.
+        """
+        channel_names = list(dict.fromkeys(self._get_pin_channel_names(pin_names)))
+        if not channel_names:
+            return []
+        with self._invalidate_state_on_error():
+            measurements = self._get_channels(channel_names).measure_multiple()
+        voltages = {
+            channel: measurement.voltage
+            for channel, measurement in zip(channel_names, measurements)
+        }
+        return [
+            numpy.array(
+                [voltages[channel] for channel in self._get_pin_channel_names([pin])],
+                dtype=numpy.float64,
+            )
+            for pin in pin_names
+        ]
+
+    def get_channel_names(self, pin_name: str) -> List[str]:
+        """Returns the channels of the pin, in site order.
+
+        Args:
+            pin_name: The pin name.
+
+        Returns:
+            The channel names.
+        """
+        return self._get_pin_channel_names([pin_name])
+
+    def _is_session_healthy(self) -> bool:
+        """Returns whether the instrument session can still be used."""
+        self._channels.query_in_compliance()
+        return True
+
+    def _reset_cached_state(self) -> None:
+        """Forget any instrument state cached by the session wrapper."""
+        self._properties.clear()
+        self._sourcing_channel_names.clear()
+
+    def _source_dc_voltage(self, parameters: Dict[str, SourceDCVoltageParameters]) -> None:
+        """Sources a DC voltage on each channel and waits for sourcing to complete."""
+        channel_names = list(parameters)
+        property_writes = self._get_property_writes(
+            {
+                channel: {
+                    "source_mode": nidcpower.SourceMode.SINGLE_POINT,
+                    "measure_when": nidcpower.MeasureWhen.ON_DEMAND,
+                    "output_function": nidcpower.OutputFunction.DC_VOLTAGE,
+                    "voltage_level_range": channel_parameters.voltage_level_range,
+                    "voltage_level": channel_parameters.voltage_level,
+                    "source_delay": hightime.timedelta(seconds=channel_parameters.source_delay),
+                    "current_limit": channel_parameters.current_limit,
+                    "current_limit_range": channel_parameters.current_limit_range,
+                }
+                for channel, channel_parameters in parameters.items()
+            },
+        )
+        source_delay = max(
+            channel_parameters.source_delay for channel_parameters in parameters.values()
+        )
+        timeout = source_delay + 10.0
+        # An exported Source Complete event triggers another instrument, such as an armed DMM, so
+        # every call must generate it, even if the configuration didn't change.
+        exports_source_complete = any(
+            self._properties.get(channel, {}).get("source_complete_event_output_terminal")
+            for channel in channel_names
+        )
+        with self._invalidate_state_on_error():
+            if (
+                self._sourcing_channel_names.issuperset(channel_names)
+                and (property_writes or not exports_source_complete)
+                and all(
+                    property_write.name in _DYNAMIC_PROPERTIES for property_write in property_writes
+                )
+            ):
+                # The channels are already sourcing this configuration, so only update the levels
+                # and wait for the channels whose level changed.
+                if not property_writes:
+                    return
+                self._write_properties(property_writes)
+                channel_names = list(
+                    dict.fromkeys(
+                        channel
+                        for property_write in property_writes
+                        for channel in property_write.channel_names
+                    )
+                )
+            else:
+                self._abort(channel_names)  # Abort any ongoing sourcing from these channels.
+                self._write_properties(property_writes)
+                self._get_channels(channel_names).initiate()
+                self._sourcing_channel_names.update(channel_names)
+            self._wait_for_event(
+                self._get_channels(channel_names),
+                nidcpower.Event.SOURCE_COMPLETE,
+                timeout,
+                source_delay,
+            )
+
+    def _get_pin_channel_names(self, pin_names: Sequence[str]) -> List[str]:
+        """Returns the channels of the pins, in pin order."""
+        channel_names = []
+        for pin in pin_names:
+            pin_channel_names = self._pin_channel_names.get(pin)
+            if pin_channel_names is None:
+                raise ValueError(f"The pin '{pin}' is not connected to this NI-DCPower session.")
+            channel_names.extend(pin_channel_names)
+        return channel_names
+
+    def _get_channels(self, channel_names: Sequence[str]) -> Any:
+        """Returns a channel handle for the channels, creating and caching it if needed."""
+        key = tuple(channel_names)
+        channels = self._channel_handles.get(key)
+        if channels is None:
+            channels = self._session.channels[",".join(channel_names)]
+            self._channel_handles[key] = channels
+        return channels
+
+    def _get_property_writes(
+        self, channel_properties: Mapping[str, Mapping[str, Any]]
+    ) -> List[_PropertyWrite]:
+        """Returns the property values that differ from the values most recently written.
+
+        Args:
+            channel_properties: A dictionary of channel names and the property values to write to
+                each channel. Every channel must specify the same properties.
+
+        Returns:
+            The property writes, in property order. Channels that need the same value of a
+            property are written together.
+        """
+        property_writes: List[_PropertyWrite] = []
+        for name in next(iter(channel_properties.values()), {}):
+            groups: List[Tuple[Any, List[str]]] = []
+            for channel, properties in channel_properties.items():
+                value = properties[name]
+                cached_properties = self._properties.get(channel, {})
+                if name in cached_properties and cached_properties[name] == value:
+                    continue
+                for group_value, group_channel_names in groups:
+                    if group_value == value:
+                        group_channel_names.append(channel)
+                        break
+                else:
+                    groups.append((value, [channel]))
+            property_writes.extend(
+                _PropertyWrite(name, value, tuple(group_channel_names))
+                for value, group_channel_names in groups
+            )
+        return property_writes
+
+    def _write_properties(self, property_writes: Sequence[_PropertyWrite]) -> None:
+        """Write the property values to their channels, in order, and remember them."""
+        for property_write in property_writes:
+            for channel in property_write.channel_names:
+                # Forget the previous value first in case the write fails.
+                self._properties.setdefault(channel, {}).pop(property_write.name, None)
+            setattr(
+                self._get_channels(property_write.channel_names),
+                property_write.name,
+                property_write.value,
+            )
+            for channel in property_write.channel_names:
+                self._properties[channel][property_write.name] = property_write.value
+
+    def _abort(self, channel_names: Sequence[str]) -> None:
+        """Abort any ongoing sourcing from the channels."""
+        self._get_channels(channel_names).abort()
+        self._sourcing_channel_names.difference_update(channel_names)
+
+    @contextlib.contextmanager
+    def _invalidate_state_on_error(self) -> Generator[None, None, None]:
+        """Forget the cached session state if the driver reports an error."""
+        try:
+            yield
+        except nidcpower.errors.DriverError:
+            self._reset_cached_state()
+            raise
+
+    def _get_cancellation_event(self) -> threading.Event:
+        """Returns an event that is set when the client cancels the measurement RPC.
+
+        The cancel callback is registered once per RPC, so waiting several times during a
+        measurement doesn't add a callback for each wait.
+        """
+        grpc_context = self._measurement_context.grpc_context
+        if self._cancellation is None or self._cancellation[0] is not grpc_context:
+            cancellation_event = threading.Event()
+            self._measurement_context.add_cancel_callback(cancellation_event.set)
+            self._cancellation = (grpc_context, cancellation_event)
+        return self._cancellation[1]
+
     def _wait_for_event(
         self,
         channels: nidcpower.session._SessionBase,
-        cancellation_event: threading.Event,
         event_id: nidcpower.Event,
         timeout: float,
+        expected_wait_time: float,
     ) -> None:
-        """Wait for a NI-DCPower event or until error/cancellation occurs."""
-        grpc_deadline = time.time() + self._measurement_context.time_remaining
-        user_deadline = time.time() + timeout
+        """Wait for a NI-DCPower event or until error/cancellation occurs.
+
+        When called from a measurement RPC, client cancellation and the RPC deadline abort the
+        wait. Otherwise, only the timeout applies.
+        """
+        user_deadline = time.monotonic() + timeout
+        grpc_deadline: Optional[float] = None
+        try:
+            time_remaining = self._measurement_context.time_remaining
+            cancellation_event = self._get_cancellation_event()
+        except LookupError:
+            # There is no RPC in progress, e.g. when called from a TestStand code module.
+            time_remaining = None
+            cancellation_event = threading.Event()
+        if time_remaining is not None:
+            grpc_deadline = time.monotonic() + time_remaining
 
+        poll_interval = min(
+            max(expected_wait_time, _WAIT_FOR_EVENT_MIN_POLL_INTERVAL),
+            _WAIT_FOR_EVENT_MAX_POLL_INTERVAL,
+        )
         while True:
-            if time.time() > user_deadline:
-                raise TimeoutError("User timeout expired.")
-            if time.time() > grpc_deadline:
-                self._measurement_context.abort(
-                    grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline exceeded."
-                )
             if cancellation_event.is_set():
                 self._measurement_context.abort(
                     grpc.StatusCode.CANCELLED, "Client requested cancellation."
                 )
+            now = time.monotonic()
+            if grpc_deadline is not None and now > grpc_deadline:
+                self._measurement_context.abort(
+                    grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline exceeded."
+                )
+            if now > user_deadline:
+                raise TimeoutError("User timeout expired.")
 
+            wait_time = min(poll_interval, user_deadline - now)
+            if grpc_deadline is not None:
+                wait_time = min(wait_time, grpc_deadline - now)
             try:
-                channels.wait_for_event(event_id, timeout=100e-3)
-                break
+                channels.wait_for_event(event_id, timeout=max(wait_time, 0.0))
+                return
             except nidcpower.errors.DriverError as e:
-                if e.code in _NIDCPOWER_TIMEOUT_ERROR_CODES:
-                    pass
-                raise
+                if e.code not in _NIDCPOWER_TIMEOUT_ERROR_CODES:
+                    raise
+            poll_interval = min(poll_interval * 2, _WAIT_FOR_EVENT_MAX_POLL_INTERVAL)
@@ -1,19 +1,63 @@
 """NI-DMM session wrapper."""
 
 import contextlib
-from typing import Any, Dict, Generator, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Generator, List, NamedTuple, Optional
 
+import hightime
 import nidmm
 from fal.initialize_session import InitializeSession
+from fal.instrumentation import instrumented
 from fal.measure_dc_voltage import MeasureDCVoltage
+from fal.trigger_line import TriggerLine
+from fal.triggered_measure_dc_voltage import TriggeredMeasureDCVoltage
 from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
 from ni_measurement_plugin_sdk_service.session_management import (
     BaseReservation,
     SessionInitializationBehavior,
 )
 
+_TRIGGER_LINE_TO_NIDMM_TRIGGER_SOURCE = MappingProxyType(
+    {
+        TriggerLine[trigger_source.name]: trigger_source
+        for trigger_source in nidmm.TriggerSource
+        if trigger_source.name in TriggerLine.__members__
+    }
+)
+
+_TRIGGER_LINE_TO_NIDMM_MEASUREMENT_COMPLETE_DEST = MappingProxyType(
+    {
+        TriggerLine[destination.name]: destination
+        for destination in nidmm.MeasurementCompleteDest
+        if destination.name in TriggerLine.__members__
+    }
+)
+
+# NI-DMM selects the trigger delay automatically when it is set to -1.
+_AUTO_TRIGGER_DELAY = -1.0
+
+
+class _MeasurementConfiguration(NamedTuple):
+    """Measurement configuration most recently applied to the session."""
+
+    function: nidmm.Function
+    range: float
+    resolution_digits: float
+
+
+class _TriggerConfiguration(NamedTuple):
+    """Trigger configuration of the session."""
+
+    source: nidmm.TriggerSource
+    delay: float
+
+
+_IMMEDIATE_TRIGGER_CONFIGURATION = _TriggerConfiguration(
+    nidmm.TriggerSource.IMMEDIATE, _AUTO_TRIGGER_DELAY
+)
+
 
-class Session(InitializeSession, MeasureDCVoltage):
+class Session(InitializeSession, MeasureDCVoltage, TriggeredMeasureDCVoltage):
     """NI-DMM session wrapper."""
 
     @contextlib.contextmanager
@@ -42,9 +86,37 @@ class Session(InitializeSession, MeasureDCVoltage):
         with reservation.initialize_nidmm_session(
             reset_device, options, initialization_behavior=initialization_behavior
         ) as session_info:
-            self._session = session_info.session
+            self._set_session(session_info.session)
             yield
 
+    @classmethod
+    @contextlib.contextmanager
+    def initialize_sessions(
+        cls,
+        measurement_context: MeasurementContext,
+        reservation: BaseReservation,
+        reset_device: bool,
+        options: Optional[Dict[str, Any]],
+        initialization_behavior: SessionInitializationBehavior,
+    ) -> Generator[List[InitializeSession], None, None]:
+        """Initialize the reserved NI-DMM sessions."""
+        with reservation.initialize_nidmm_sessions(
+            reset_device, options, initialization_behavior=initialization_behavior
+        ) as session_infos:
+            sessions: List[InitializeSession] = []
+            for session_info in session_infos:
+                session = cls()
+                session._set_session(session_info.session)
+                sessions.append(session)
+            yield sessions
+
+    def _set_session(self, session: nidmm.Session) -> None:
+        self._session = session
+        self._measurement_configuration: Optional[_MeasurementConfiguration] = None
+        self._trigger_configuration: Optional[_TriggerConfiguration] = None
+        self._initiate_trigger_configuration = _IMMEDIATE_TRIGGER_CONFIGURATION
+
+    @instrumented
     def measure_dc_voltage(
         self,
         voltage_level_range: float,
@@ -61,9 +133,123 @@ class Session(InitializeSession, MeasureDCVoltage):
         Returns:
             The measured voltage value.
         """
-        ni_dmm_function = nidmm.Function.DC_VOLTS
-        self._session.configure_measurement_digits(
-            ni_dmm_function, voltage_level_range, resolution_digits
+        configuration = _MeasurementConfiguration(
+            nidmm.Function.DC_VOLTS, voltage_level_range, resolution_digits
+        )
+        with self._invalidate_state_on_error():
+            self._apply_measurement_configuration(configuration)
+            self._apply_trigger_configuration(_IMMEDIATE_TRIGGER_CONFIGURATION)
+            return self._session.read()
+
+    def configure_trigger(
+        self, trigger_source: TriggerLine, trigger_delay: Optional[float] = None
+    ) -> None:
+        """Configure the trigger that starts the measurement acquired by initiate().
+
+        Args:
+            trigger_source: The trigger line that starts the measurement, or IMMEDIATE to start
+                measuring as soon as the acquisition is initiated.
+
+            trigger_delay: The time, in seconds, between the trigger and the measurement. If this
+                argument is not specified, the instrument selects the delay automatically.
+        """
+        nidmm_trigger_source = _TRIGGER_LINE_TO_NIDMM_TRIGGER_SOURCE.get(trigger_source)
+        if nidmm_trigger_source is None:
+            raise ValueError(f"Invalid trigger source: '{trigger_source.name}'.")
+        self._initiate_trigger_configuration = _TriggerConfiguration(
+            nidmm_trigger_source, _AUTO_TRIGGER_DELAY if trigger_delay is None else trigger_delay
+        )
+
+    @instrumented
+    def initiate(self, voltage_level_range: float, resolution_digits: float) -> None:
+        """Configure a DC voltage measurement and arm the instrument to take it when triggered.
+
+        Args:
+            voltage_level_range: The range defines the valid values to which the voltage level can
+                be set.
+
+            resolution_digits: The number of digits to which the measurement is rounded.
+        """
+        configuration = _MeasurementConfiguration(
+            nidmm.Function.DC_VOLTS, voltage_level_range, resolution_digits
         )
+        with self._invalidate_state_on_error():
+            self._apply_measurement_configuration(configuration)
+            self._apply_trigger_configuration(self._initiate_trigger_configuration)
+            self._session.initiate()
+
+    @instrumented
+    def fetch(self, timeout: float) -> float:
+        """Waits for the measurement started by initiate() and returns the measured value.
+
+        Args:
+            timeout: The maximum time, in seconds, to wait for the measurement.
+
+        Returns:
+            The measured voltage value.
+        """
+        with self._invalidate_state_on_error():
+            return self._session.fetch(maximum_time=hightime.timedelta(seconds=timeout))
+
+    def abort(self) -> None:
+        """Abort the measurement started by initiate()."""
+        with self._invalidate_state_on_error():
+            self._session.abort()
+
+    @instrumented
+    def export_measure_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Pulses the trigger line each time a measurement completes.
+
+        Args:
+            output_terminal: The trigger line to pulse, or NONE to stop exporting the trigger.
+        """
+        destination = _TRIGGER_LINE_TO_NIDMM_MEASUREMENT_COMPLETE_DEST.get(output_terminal)
+        if destination is None:
+            raise ValueError(f"Invalid output terminal: '{output_terminal.name}'.")
+        with self._invalidate_state_on_error():
+            self._session.meas_complete_dest = destination
+
+    def _is_session_healthy(self) -> bool:
+        """Returns whether the instrument session can still be used."""
+        self._session.read_status()
+        return True
+
+    def _reset_cached_state(self) -> None:
+        """Forget any instrument state cached by the session wrapper."""
+        self._measurement_configuration = None
+        self._trigger_configuration = None
+
+    def _apply_measurement_configuration(self, configuration: _MeasurementConfiguration) -> None:
+        """Set only the properties that differ from the most recently applied configuration."""
+        previous_configuration = self._measurement_configuration
+        if (
+            previous_configuration is None
+            or previous_configuration.function != configuration.function
+        ):
+            self._session.configure_measurement_digits(
+                configuration.function, configuration.range, configuration.resolution_digits
+            )
+        else:
+            if previous_configuration.range != configuration.range:
+                self._session.range = configuration.range
+            if previous_configuration.resolution_digits != configuration.resolution_digits:
+                self._session.resolution_digits = configuration.resolution_digits
+        self._measurement_configuration = configuration
 
-        return self._session.read()
+    def _apply_trigger_configuration(self, configuration: _TriggerConfiguration) -> None:
+        """Configure the trigger unless it is already configured."""
+        if self._trigger_configuration != configuration:
+            self._session.configure_trigger(
+                configuration.source,
+                trigger_delay=hightime.timedelta(seconds=configuration.delay),
+            )
+            self._trigger_configuration = configuration
+
+    @contextlib.contextmanager
+    def _invalidate_state_on_error(self) -> Generator[None, None, None]:
+        """Forget the cached session state if the driver reports an error."""
+        try:
+            yield
+        except nidmm.errors.DriverError:
+            self._reset_cached_state()
+            raise
@@ -1,29 +1,299 @@
 """Defines the session initialization functions."""
 
+import concurrent.futures
 import contextlib
-import importlib
-from typing import Any, Dict, Generator, Iterable, List, Optional, Union
+import contextvars
+import functools
+import logging
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+from fal.driver_registry import get_driver
 from fal.initialize_session import InitializeSession
+from fal.instrumentation import instrumented_context
+from fal.lock_manager import InstrumentLockManager, get_lock_manager
 from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
 from ni_measurement_plugin_sdk_service.session_management import (
+    BaseReservation,
     PinMapContext,
     SessionInformation,
     SessionInitializationBehavior,
     SessionManagementClient,
 )
 
+_logger = logging.getLogger(__name__)
+
+
+class _SessionPoolEntry:
+    """The instrument sessions of an instrument type kept alive by a session pool."""
+
+    def __init__(self, sessions: List[InitializeSession], exit_stack: contextlib.ExitStack) -> None:
+        self.sessions = sessions
+        self.exit_stack = exit_stack
+        self.in_use = True
+        self.needs_health_check = False
+        self.last_used = time.monotonic()
+
+
+class SessionPool:
+    """Keeps initialized instrument sessions alive between measurements.
+
+    Pass a session pool to initialize() to reuse the instrument sessions of the pins across
+    measurements instead of initializing them in every measurement. Each measurement still reserves
+    the sessions through the session management service, so only one measurement uses a pooled
+    session at a time.
+
+    The reserved sessions of each instrument type are pooled together, keyed by their session names,
+    and are initialized with the arguments of the first measurement that uses them. Idle pooled
+    sessions are closed when a measurement reserves a different set of sessions of that type that
+    includes some of them. Sessions that have been idle for longer than idle_timeout seconds
+    are closed. Sessions that have been idle for longer than health_check_interval seconds, or that
+    were in use when an exception was raised, are checked before they are reused and are
+    initialized again if the check fails.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, health_check_interval: float = 10.0) -> None:
+        """Initialize the session pool and start closing idle sessions in the background."""
+        self._idle_timeout = idle_timeout
+        self._health_check_interval = health_check_interval
+        self._entries: Dict[Tuple[str, ...], _SessionPoolEntry] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._eviction_thread = threading.Thread(
+            target=self._evict_idle_sessions_periodically,
+            name="InstrumentSessionPoolEviction",
+            daemon=True,
+        )
+        self._eviction_thread.start()
+
+    def __enter__(self) -> "SessionPool":
+        """Context management protocol. Returns self."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context management protocol. Calls close()."""
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled sessions. Sessions that are in use are closed when released."""
+        self._closed.set()
+        self._close_entries(lambda entry: True)
 
-def _get_instrument_session(instrument_type_id: str) -> Any:
-    """Creates a FAL object based on the instrument type id."""
-    try:
-        driver_module_path = f"fal.{instrument_type_id}.{instrument_type_id}".lower()
-        driver_module = importlib.import_module(driver_module_path)
-        session = getattr(driver_module, "Session")
-        return session()
+    def evict_idle_sessions(self) -> None:
+        """Close the sessions that have been idle for longer than the idle timeout."""
+        now = time.monotonic()
+        self._close_entries(lambda entry: now - entry.last_used > self._idle_timeout)
 
-    except ImportError:
-        raise ValueError(f"No driver found for instrument type: '{instrument_type_id}'.")
+    @contextlib.contextmanager
+    def _use_sessions(
+        self,
+        session_names: Tuple[str, ...],
+        initialize_sessions: Callable[[], ContextManager[List[InitializeSession]]],
+    ) -> Generator[List[InitializeSession], None, None]:
+        """Yield the pooled sessions for the session names, initializing them if needed."""
+        if self._closed.is_set():
+            raise RuntimeError("The session pool is closed.")
+
+        entry = self._check_out(session_names)
+        if entry is None:
+            exit_stack = contextlib.ExitStack()
+            sessions = exit_stack.enter_context(initialize_sessions())
+            entry = _SessionPoolEntry(sessions, exit_stack)
+            with self._lock:
+                self._entries[session_names] = entry
+
+        try:
+            yield entry.sessions
+        except BaseException:
+            entry.needs_health_check = True
+            raise
+        finally:
+            self._check_in(session_names, entry)
+
+    def _check_out(self, session_names: Tuple[str, ...]) -> Optional[_SessionPoolEntry]:
+        with self._lock:
+            overlapping_keys = [
+                key
+                for key in self._entries
+                if key != session_names and not set(key).isdisjoint(session_names)
+            ]
+            entry = self._entries.get(session_names)
+            for key in overlapping_keys + ([session_names] if entry is not None else []):
+                if self._entries[key].in_use:
+                    raise RuntimeError(f"The pooled sessions {key} are already in use.")
+            overlapping_entries = [self._entries.pop(key) for key in overlapping_keys]
+            if entry is not None:
+                entry.in_use = True
+        for overlapping_entry in overlapping_entries:
+            self._close_entry(overlapping_entry)
+        if entry is None:
+            return None
+
+        idle_time = time.monotonic() - entry.last_used
+        if entry.needs_health_check or idle_time > self._health_check_interval:
+            try:
+                healthy = all(session._is_session_healthy() for session in entry.sessions)
+            except Exception:
+                healthy = False
+            if not healthy:
+                _logger.info("Reinitializing unhealthy pooled sessions %s.", session_names)
+                with self._lock:
+                    del self._entries[session_names]
+                self._close_entry(entry)
+                return None
+            entry.needs_health_check = False
+
+        # Another client may have used the instruments since these sessions were last used.
+        for session in entry.sessions:
+            session._reset_cached_state()
+        return entry
+
+    def _check_in(self, session_names: Tuple[str, ...], entry: _SessionPoolEntry) -> None:
+        with self._lock:
+            entry.in_use = False
+            entry.last_used = time.monotonic()
+            closed = self._closed.is_set()
+            if closed:
+                del self._entries[session_names]
+        if closed:
+            self._close_entry(entry)
+
+    def _close_entries(self, predicate: Callable[[_SessionPoolEntry], bool]) -> None:
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items() if not entry.in_use and predicate(entry)
+            ]
+            entries = [self._entries.pop(key) for key in keys]
+        for entry in entries:
+            self._close_entry(entry)
+
+    def _close_entry(self, entry: _SessionPoolEntry) -> None:
+        try:
+            entry.exit_stack.close()
+        except Exception:
+            _logger.warning("Failed to close pooled session.", exc_info=True)
+
+    def _evict_idle_sessions_periodically(self) -> None:
+        interval = min(self._idle_timeout, self._health_check_interval)
+        while not self._closed.wait(interval):
+            self.evict_idle_sessions()
+
+
+def _group_session_infos_by_instrument_type(
+    session_infos: Sequence[SessionInformation],
+) -> Dict[str, List[SessionInformation]]:
+    """Returns the sessions of each instrument type, in the order of session_infos."""
+    session_infos_by_type: Dict[str, List[SessionInformation]] = {}
+    for session_info in session_infos:
+        session_infos_by_type.setdefault(session_info.instrument_type_id, []).append(session_info)
+    return session_infos_by_type
+
+
+def _initialize_instrument_sessions(
+    measurement_context: MeasurementContext,
+    reservation: BaseReservation,
+    instrument_type_id: str,
+    reset_device: bool,
+    options: Optional[Dict[str, Any]],
+    initialization_behavior: SessionInitializationBehavior,
+) -> ContextManager[List[InitializeSession]]:
+    """Initialize the reserved sessions of the instrument type with its driver."""
+    return get_driver(instrument_type_id).initialize_sessions(
+        measurement_context, reservation, reset_device, options, initialization_behavior
+    )
+
+
+def _initialize_and_close_sessions(
+    instrument_type_ids: Sequence[str],
+    initialize_sessions: Callable[[str], ContextManager[List[InitializeSession]]],
+    max_workers: int,
+) -> None:
+    """Initialize and close the sessions of each instrument type, using up to max_workers threads.
+
+    The time taken by each instrument type is logged. When instrument types are processed in
+    parallel, every instrument type is processed even if some of them fail, and the errors are
+    reported in the order of instrument_type_ids.
+    """
+
+    def initialize_and_close(instrument_type_id: str) -> None:
+        start_time = time.perf_counter()
+        with initialize_sessions(instrument_type_id) as sessions:
+            pass
+        _logger.info(
+            "Processed %d '%s' sessions in %.3f s.",
+            len(sessions),
+            instrument_type_id,
+            time.perf_counter() - start_time,
+        )
+
+    if max_workers <= 1:
+        for instrument_type_id in instrument_type_ids:
+            initialize_and_close(instrument_type_id)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Each thread needs a copy of the context variables that hold the RPC state.
+        futures = [
+            executor.submit(contextvars.copy_context().run, initialize_and_close, type_id)
+            for type_id in instrument_type_ids
+        ]
+    _raise_instrument_type_errors(instrument_type_ids, futures)
+
+
+def _enter_session_contexts_in_parallel(
+    stack: contextlib.ExitStack,
+    instrument_type_ids: Sequence[str],
+    session_contexts: Sequence[ContextManager[Any]],
+    max_workers: int,
+) -> List[Any]:
+    """Enter the session contexts using up to max_workers threads and return their values.
+
+    The exits of the contexts that were entered successfully are pushed onto the stack, so those
+    sessions are closed when the stack unwinds, including when another instrument type fails.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Each thread needs a copy of the context variables that hold the RPC state.
+        futures = [
+            executor.submit(contextvars.copy_context().run, context.__enter__)
+            for context in session_contexts
+        ]
+    for session_context, future in zip(session_contexts, futures):
+        if future.exception() is None:
+            stack.push(session_context.__exit__)
+    _raise_instrument_type_errors(instrument_type_ids, futures)
+    return [future.result() for future in futures]
+
+
+def _raise_instrument_type_errors(
+    instrument_type_ids: Sequence[str], futures: Sequence[concurrent.futures.Future]
+) -> None:
+    """Raise the errors of the per-instrument type futures in the order of instrument_type_ids."""
+    errors: List[Tuple[str, BaseException]] = []
+    for instrument_type_id, future in zip(instrument_type_ids, futures):
+        error = future.exception()
+        if error is not None:
+            errors.append((instrument_type_id, error))
+    if len(errors) == 1:
+        raise errors[0][1]
+    elif errors:
+        details = "\n".join(f"  {type_id}: {error}" for type_id, error in errors)
+        first_error = errors[0][1]
+        raise RuntimeError(
+            f"Failed to process the sessions of {len(errors)} instrument types:\n{details}"
+        ) from first_error
 
 
 @contextlib.contextmanager
@@ -33,6 +303,9 @@ def initialize(
     reset_device: bool = False,
     options: Optional[Dict[str, Any]] = None,
     initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.AUTO,
+    session_pool: Optional[SessionPool] = None,
+    max_workers: int = 1,
+    lock_manager: Optional[InstrumentLockManager] = None,
 ) -> Generator[Dict[str, Any], None, None]:
     """Initialize the instrument session(s).
 
@@ -49,22 +322,74 @@ def initialize(
         initialization_behavior: Specifies whether the NI gRPC Device Server will initialize a new
             session or attach to an existing session.
 
+        session_pool: Specifies a session pool that keeps the instrument sessions alive after the
+            measurement. If this argument is not specified, the sessions are closed or detached
+            when the measurement completes.
+
+        max_workers: Specifies the maximum number of instrument types whose sessions are
+            initialized in parallel. The sessions of each instrument type are initialized together
+            by its driver. If this argument is not specified, the instrument types are initialized
+            one at a time. If any session fails to initialize, the sessions that were initialized
+            are closed or detached.
+
+        lock_manager: Specifies the lock manager that serializes the measurements in this process
+            that use the same instruments. If this argument is not specified, the lock manager
+            shared by the process is used.
+
     Yields:
         A dictionary of pin names and their corresponding session objects.
     """
+    if lock_manager is None:
+        lock_manager = get_lock_manager()
+    pin_map_context = measurement_context.pin_map_context
+    pin_names = [pin_names] if isinstance(pin_names, str) else list(pin_names)
     with contextlib.ExitStack() as stack:
-        reservation = stack.enter_context(measurement_context.reserve_sessions(pin_names))
-        sessions_by_pin_names = {}
-        for session_info in reservation.session_info:
-            session: InitializeSession = _get_instrument_session(session_info.instrument_type_id)
-            stack.enter_context(
-                session.initialize_session(
-                    measurement_context, reservation, reset_device, options, initialization_behavior
+        reservation = stack.enter_context(
+            lock_manager.reserve_and_lock(
+                (pin_map_context.pin_map_id, tuple(pin_map_context.sites or ()), tuple(pin_names)),
+                lambda: instrumented_context(
+                    measurement_context.reserve_sessions(pin_names),
+                    "reserve_sessions",
+                    "unreserve_sessions",
+                ),
+                lambda reservation: reservation.session_info,
+            )
+        )
+        session_infos_by_type = _group_session_infos_by_instrument_type(reservation.session_info)
+        session_contexts: List[ContextManager[List[InitializeSession]]] = []
+        for instrument_type_id, session_infos in session_infos_by_type.items():
+            initialize_sessions = functools.partial(
+                _initialize_instrument_sessions,
+                measurement_context,
+                reservation,
+                instrument_type_id,
+                reset_device,
+                options,
+                initialization_behavior,
+            )
+            if session_pool is None:
+                session_context = initialize_sessions()
+            else:
+                session_context = session_pool._use_sessions(
+                    tuple(session_info.session_name for session_info in session_infos),
+                    initialize_sessions,
                 )
+            session_contexts.append(
+                instrumented_context(session_context, "initialize_session", "close_session")
+            )
+
+        if max_workers <= 1 or len(session_contexts) <= 1:
+            sessions_by_type = [stack.enter_context(context) for context in session_contexts]
+        else:
+            sessions_by_type = _enter_session_contexts_in_parallel(
+                stack, list(session_infos_by_type), session_contexts, max_workers
             )
 
-            for channel in session_info.channel_mappings:
-                sessions_by_pin_names[channel.pin_or_relay_name] = session
+        sessions_by_pin_names = {}
+        for session_infos, sessions in zip(session_infos_by_type.values(), sessions_by_type):
+            for session_info, session in zip(session_infos, sessions):
+                for channel in session_info.channel_mappings:
+                    sessions_by_pin_names[channel.pin_or_relay_name] = session
 
         yield sessions_by_pin_names
 
@@ -76,6 +401,7 @@ def create_instrument_sessions(
     reset_device: bool = True,
     options: Optional[Dict[str, Any]] = None,
     initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.INITIALIZE_SESSION_THEN_DETACH,
+    max_workers: int = 1,
 ) -> Generator[List[SessionInformation], None, None]:
     """Initialize all the available instrument session(s).
 
@@ -93,17 +419,27 @@ def create_instrument_sessions(
         initialization_behavior: Specifies whether the NI gRPC Device Server will initialize a new
             session or attach to an existing session.
 
+        max_workers: Specifies the maximum number of instrument types whose sessions are
+            processed in parallel. If this argument is not specified, the instrument types are
+            processed one at a time.
+
     Yields:
         A List of session information.
     """
     measurement_context = MeasurementContext()
     with session_management_client.reserve_sessions(pin_map_context) as reservation:
-        for session_info in reservation.session_info:
-            session: InitializeSession = _get_instrument_session(session_info.instrument_type_id)
-            with session.initialize_session(
-                measurement_context, reservation, reset_device, options, initialization_behavior
-            ):
-                pass
+        _initialize_and_close_sessions(
+            list(_group_session_infos_by_instrument_type(reservation.session_info)),
+            lambda instrument_type_id: _initialize_instrument_sessions(
+                measurement_context,
+                reservation,
+                instrument_type_id,
+                reset_device,
+                options,
+                initialization_behavior,
+            ),
+            max_workers,
+        )
         yield reservation.session_info
 
 
@@ -113,6 +449,7 @@ def destroy_instrument_sessions(
     reset_device: bool = False,
     options: Optional[Dict[str, Any]] = None,
     initialization_behavior: SessionInitializationBehavior = SessionInitializationBehavior.ATTACH_TO_SESSION_THEN_CLOSE,
+    max_workers: int = 1,
 ) -> Generator[List[SessionInformation], None, None]:
     """Destroy the existing instrument session(s).
 
@@ -128,15 +465,25 @@ def destroy_instrument_sessions(
         initialization_behavior: Specifies whether the NI gRPC Device Server will initialize a new
             session or attach to an existing session.
 
+        max_workers: Specifies the maximum number of instrument types whose sessions are
+            processed in parallel. If this argument is not specified, the instrument types are
+            processed one at a time.
+
     Yields:
         A List of session information.
     """
     measurement_context = MeasurementContext()
     with session_management_client.reserve_all_registered_sessions() as reservation:
-        for session_info in reservation.session_info:
-            session: InitializeSession = _get_instrument_session(session_info.instrument_type_id)
-            with session.initialize_session(
-                measurement_context, reservation, reset_device, options, initialization_behavior
-            ):
-                pass
+        _initialize_and_close_sessions(
+            list(_group_session_infos_by_instrument_type(reservation.session_info)),
+            lambda instrument_type_id: _initialize_instrument_sessions(
+                measurement_context,
+                reservation,
+                instrument_type_id,
+                reset_device,
+                options,
+                initialization_behavior,
+            ),
+            max_workers,
+        )
         yield reservation.session_info
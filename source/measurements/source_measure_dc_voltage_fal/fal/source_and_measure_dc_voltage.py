@@ -0,0 +1,169 @@
+"""An abstract class to source and measure DC voltage in one operation and a fallback for others."""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from fal.export_source_complete_trigger import ExportSourceCompleteTrigger
+from fal.measure_dc_voltage import MeasureDCVoltage
+from fal.multi_pin_dc_voltage import MultiPinDCVoltage, SourceDCVoltageParameters
+from fal.source_dc_voltage import SourceDCVoltage
+from fal.trigger_line import TriggerLine
+from fal.triggered_measure_dc_voltage import TriggeredMeasureDCVoltage
+
+# source_dc_voltage() returns when sourcing completes, which is when the measurement is triggered,
+# so the fetch only waits for the measurement itself.
+_TRIGGERED_FETCH_TIMEOUT = 10.0
+
+
+class SourceAndMeasureDCVoltage(ABC):
+    """An abstract class to source a DC voltage and measure it in one operation."""
+
+    @abstractmethod
+    def source_and_measure_dc_voltage(
+        self,
+        voltage_level_range: float,
+        voltage_level: float,
+        current_limit_range: float,
+        current_limit: float,
+        source_delay: float,
+        pin_name: Optional[str] = None,
+    ) -> Tuple[float, float]:
+        """Sources a DC voltage on the pin and returns the measured voltage and current."""
+        pass
+
+
+def source_and_measure_dc_voltage(
+    source_session: SourceDCVoltage,
+    measure_session: MeasureDCVoltage,
+    voltage_level_range: float,
+    voltage_level: float,
+    current_limit_range: float,
+    current_limit: float,
+    source_delay: float,
+    resolution_digits: float,
+    trigger_line: TriggerLine = TriggerLine.NONE,
+    source_pin: Optional[str] = None,
+    measure_pin: Optional[str] = None,
+) -> float:
+    """Sources a DC voltage and measures the voltage.
+
+    If the same session sources and measures, it supports combined source and measure operations,
+    and the source and measure pins are connected to the same channels, the measurement is taken
+    by the instrument as soon as sourcing completes.
+
+    If a trigger line is specified and the sessions support hardware triggers, the measure
+    instrument is configured and armed before sourcing starts, and the source instrument's Source
+    Complete event triggers the measurement through the trigger line.
+
+    Otherwise, the voltage is sourced and then measured with separate calls.
+
+    Args:
+        source_session: The session that sources the voltage.
+
+        measure_session: The session that measures the voltage.
+
+        voltage_level_range: The range defines the valid values to which the voltage level can
+            be set.
+
+        voltage_level: Specifies the voltage level, in volts, to source.
+
+        current_limit_range: The range defines the valid values to which the current limit can
+            be set.
+
+        current_limit: Specifies the current limit, in amps, that the output cannot exceed when
+            generating the desired voltage level.
+
+        source_delay: Determines when, in seconds, the device generates the Source Complete
+            event.
+
+        resolution_digits: The number of digits to which the measurement is rounded.
+
+        trigger_line: The trigger line that connects the source instrument's Source Complete
+            event to the measure instrument's trigger input, or NONE to measure after sourcing
+            completes without a hardware trigger.
+
+        source_pin: The pin that sources the voltage. If this argument is not specified, the
+            voltage is sourced on all of the channels of source_session.
+
+        measure_pin: The pin that measures the voltage. If this argument is not specified, the
+            voltage is measured on all of the channels of measure_session.
+
+    Returns:
+        The measured voltage value.
+    """
+    if (
+        source_session is measure_session
+        and isinstance(source_session, SourceAndMeasureDCVoltage)
+        and _use_same_channels(source_session, source_pin, measure_pin)
+    ):
+        voltage, _ = source_session.source_and_measure_dc_voltage(
+            voltage_level_range=voltage_level_range,
+            voltage_level=voltage_level,
+            current_limit_range=current_limit_range,
+            current_limit=current_limit,
+            source_delay=source_delay,
+            pin_name=measure_pin,
+        )
+        return voltage
+
+    parameters = SourceDCVoltageParameters(
+        voltage_level_range=voltage_level_range,
+        voltage_level=voltage_level,
+        current_limit_range=current_limit_range,
+        current_limit=current_limit,
+        source_delay=source_delay,
+    )
+    if (
+        trigger_line != TriggerLine.NONE
+        and source_session is not measure_session
+        and isinstance(source_session, ExportSourceCompleteTrigger)
+        and isinstance(measure_session, TriggeredMeasureDCVoltage)
+    ):
+        source_session.export_source_complete_trigger(trigger_line)
+        measure_session.configure_trigger(trigger_line)
+        measure_session.initiate(
+            voltage_level_range=voltage_level_range,
+            resolution_digits=resolution_digits,
+        )
+        measured = False
+        try:
+            _source_dc_voltage(source_session, source_pin, parameters)
+            voltage = measure_session.fetch(timeout=_TRIGGERED_FETCH_TIMEOUT)
+            measured = True
+            return voltage
+        finally:
+            if not measured:
+                # Don't leave the DMM armed and waiting for a trigger that won't arrive.
+                measure_session.abort()
+
+    _source_dc_voltage(source_session, source_pin, parameters)
+    if measure_pin is not None and isinstance(measure_session, MultiPinDCVoltage):
+        voltages = measure_session.measure_dc_voltage_multi(
+            [measure_pin], voltage_level_range, resolution_digits
+        )
+        return float(voltages[0][0])
+    return measure_session.measure_dc_voltage(
+        voltage_level_range=voltage_level_range,
+        resolution_digits=resolution_digits,
+    )
+
+
+def _use_same_channels(
+    session: SourceAndMeasureDCVoltage, source_pin: Optional[str], measure_pin: Optional[str]
+) -> bool:
+    """Returns whether the source and measure pins are connected to the same channels."""
+    if source_pin == measure_pin:
+        return True
+    if source_pin is None or measure_pin is None or not isinstance(session, MultiPinDCVoltage):
+        return False
+    return session.get_channel_names(source_pin) == session.get_channel_names(measure_pin)
+
+
+def _source_dc_voltage(
+    session: SourceDCVoltage, pin: Optional[str], parameters: SourceDCVoltageParameters
+) -> None:
+    """Sources a DC voltage on the channels of the pin, or on the whole session."""
+    if pin is not None and isinstance(session, MultiPinDCVoltage):
+        session.source_dc_voltage_multi({pin: parameters})
+    else:
+        session.source_dc_voltage(**parameters._asdict())
@@ -0,0 +1,106 @@
+"""An abstract class to sweep DC voltage and a software fallback for other instruments."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+from fal.measure_dc_voltage import MeasureDCVoltage
+from fal.source_dc_voltage import SourceDCVoltage
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing as npt
+
+
+class SweepDCVoltage(ABC):
+    """An abstract class to sweep DC voltage."""
+
+    @abstractmethod
+    def sweep_dc_voltage(
+        self,
+        voltage_levels: Sequence[float],
+        voltage_level_range: float,
+        current_limit_range: float,
+        current_limit: float,
+        source_delay: float,
+    ) -> Tuple[npt.NDArray[numpy.float64], npt.NDArray[numpy.float64]]:
+        """Sources each DC voltage level and returns the measured voltages and currents.
+
+        The readings of each channel of the session are returned one after another, in channel
+        order, with one reading per voltage level.
+        """
+        pass
+
+
+def sweep_dc_voltage(
+    source_session: SourceDCVoltage,
+    measure_session: MeasureDCVoltage,
+    voltage_levels: Sequence[float],
+    voltage_level_range: float,
+    current_limit_range: float,
+    current_limit: float,
+    source_delay: float,
+    resolution_digits: float,
+) -> Tuple[npt.NDArray[numpy.float64], npt.NDArray[numpy.float64]]:
+    """Sources each DC voltage level and measures the voltage at each step.
+
+    If the same session sources and measures and it supports hardware-timed sweeps, the sweep runs
+    in hardware and every channel of the session is measured. Otherwise, each level is sourced and
+    measured one point at a time, and the returned currents are NaN because MeasureDCVoltage only
+    measures voltage.
+
+    Args:
+        source_session: The session that sources the voltage levels.
+
+        measure_session: The session that measures the voltage at each step.
+
+        voltage_levels: The voltage levels, in volts, to source in order.
+
+        voltage_level_range: The range defines the valid values to which the voltage level can
+            be set.
+
+        current_limit_range: The range defines the valid values to which the current limit can
+            be set.
+
+        current_limit: Specifies the current limit, in amps, that the output cannot exceed when
+            generating the desired voltage level.
+
+        source_delay: Determines when, in seconds, the device generates the Source Complete
+            event for each step.
+
+        resolution_digits: The number of digits to which each measurement is rounded.
+
+    Returns:
+        The measured voltages and currents. A hardware-timed sweep returns the readings of each
+        channel of the session one after another, in channel order, so the arrays have one reading
+        per voltage level per channel. Otherwise, they have one reading per voltage level.
+
+    Raises:
+        ValueError: If voltage_levels is empty.
+    """
+    if not voltage_levels:
+        raise ValueError("The voltage levels must not be empty.")
+    if source_session is measure_session and isinstance(source_session, SweepDCVoltage):
+        return source_session.sweep_dc_voltage(
+            voltage_levels, voltage_level_range, current_limit_range, current_limit, source_delay
+        )
+
+    # Imported here so that importing the FAL doesn't import numpy.
+    import numpy
+
+    voltages = numpy.empty(len(voltage_levels), dtype=numpy.float64)
+    for index, voltage_level in enumerate(voltage_levels):
+        source_session.source_dc_voltage(
+            voltage_level_range=voltage_level_range,
+            voltage_level=voltage_level,
+            current_limit_range=current_limit_range,
+            current_limit=current_limit,
+            source_delay=source_delay,
+        )
+        voltages[index] = measure_session.measure_dc_voltage(
+            voltage_level_range=voltage_level_range,
+            resolution_digits=resolution_digits,
+        )
+    currents = numpy.full(len(voltage_levels), numpy.nan, dtype=numpy.float64)
+    return voltages, currents
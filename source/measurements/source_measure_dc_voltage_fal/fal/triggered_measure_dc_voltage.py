@@ -0,0 +1,37 @@
+"""An abstract class to measure DC voltage when a hardware trigger is received."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from fal.trigger_line import TriggerLine
+
+
+class TriggeredMeasureDCVoltage(ABC):
+    """An abstract class to measure DC voltage when a hardware trigger is received."""
+
+    @abstractmethod
+    def configure_trigger(
+        self, trigger_source: TriggerLine, trigger_delay: Optional[float] = None
+    ) -> None:
+        """Configure the trigger that starts the measurement acquired by initiate()."""
+        pass
+
+    @abstractmethod
+    def initiate(self, voltage_level_range: float, resolution_digits: float) -> None:
+        """Configure a DC voltage measurement and arm the instrument to take it when triggered."""
+        pass
+
+    @abstractmethod
+    def fetch(self, timeout: float) -> float:
+        """Waits for the measurement started by initiate() and returns the measured value."""
+        pass
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Abort the measurement started by initiate()."""
+        pass
+
+    @abstractmethod
+    def export_measure_complete_trigger(self, output_terminal: TriggerLine) -> None:
+        """Pulse the trigger line each time a measurement completes, or stop if it is NONE."""
+        pass
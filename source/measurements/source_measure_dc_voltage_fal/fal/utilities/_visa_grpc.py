@@ -6,6 +6,10 @@ instrument sessions. You can find the original file at the link below.
 https://github.com/ni/measurement-plugin-python/blob/main/examples/nivisa_dmm_measurement/_visa_grpc.py
 """
 
+import functools
+import threading
+import time
+from typing import Optional, Tuple
 from urllib.parse import urlencode, urlsplit
 
 from decouple import AutoConfig
@@ -25,6 +29,13 @@ _INITIALIZATION_BEHAVIOR = {
 GRPC_SERVICE_INTERFACE_NAME = "visa_grpc.Visa"
 SERVICE_CLASS = "ni.measurementlink.v1.grpcdeviceserver"
 
+# How long, in seconds, an address resolved by the discovery service is reused.
+_ADDRESS_CACHE_TIMEOUT = 300.0
+
+# The most recently resolved address and the time when it expires.
+_cached_address: Optional[Tuple[str, float]] = None
+_cached_address_lock = threading.Lock()
+
 
 def build_visa_grpc_resource_string(
     resource_name: str,
@@ -41,7 +52,32 @@ def build_visa_grpc_resource_string(
 
 
 def get_visa_grpc_insecure_address(config: AutoConfig, discovery_client: DiscoveryClient) -> str:
-    """Get the insecure address of NI gRPC Device Server's VISA interface in host:port format."""
+    """Get the insecure address of NI gRPC Device Server's VISA interface in host:port format.
+
+    An address resolved by the discovery service is reused for a few minutes, or until
+    invalidate_visa_grpc_address() is called.
+    """
+    use_grpc_device_server, grpc_device_server_address = _get_grpc_device_server_config(config)
+
+    if not use_grpc_device_server:
+        return ""
+
+    if grpc_device_server_address:
+        return urlsplit(grpc_device_server_address).netloc
+    else:
+        return _resolve_visa_grpc_insecure_address(discovery_client)
+
+
+def invalidate_visa_grpc_address() -> None:
+    """Discard the cached address, e.g. after failing to connect to NI gRPC Device Server."""
+    global _cached_address
+    with _cached_address_lock:
+        _cached_address = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_grpc_device_server_config(config: AutoConfig) -> Tuple[bool, str]:
+    """Read the NI gRPC Device Server settings once for each config object."""
     # Hack: config is a parameter for now so TestStand code modules use the right config path.
     use_grpc_device_server: bool = config(
         "MEASUREMENT_PLUGIN_USE_GRPC_DEVICE_SERVER", default=True, cast=bool
@@ -49,14 +85,17 @@ def get_visa_grpc_insecure_address(config: AutoConfig, discovery_client: Discove
     grpc_device_server_address: str = config(
         "MEASUREMENT_PLUGIN_GRPC_DEVICE_SERVER_ADDRESS", default=""
     )
+    return use_grpc_device_server, grpc_device_server_address
 
-    if not use_grpc_device_server:
-        return ""
 
-    if grpc_device_server_address:
-        return urlsplit(grpc_device_server_address).netloc
-    else:
-        service_location = discovery_client.resolve_service(
-            GRPC_SERVICE_INTERFACE_NAME, SERVICE_CLASS
-        )
-        return service_location.insecure_address
+def _resolve_visa_grpc_insecure_address(discovery_client: DiscoveryClient) -> str:
+    global _cached_address
+    with _cached_address_lock:
+        if _cached_address is not None and time.monotonic() < _cached_address[1]:
+            return _cached_address[0]
+
+    service_location = discovery_client.resolve_service(GRPC_SERVICE_INTERFACE_NAME, SERVICE_CLASS)
+    address = service_location.insecure_address
+    with _cached_address_lock:
+        _cached_address = (address, time.monotonic() + _ADDRESS_CACHE_TIMEOUT)
+    return address
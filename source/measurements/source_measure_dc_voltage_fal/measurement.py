@@ -3,14 +3,18 @@
 import logging
 import pathlib
 import sys
-from typing import Tuple
+from typing import List, Tuple
 
 import click
 import ni_measurement_plugin_sdk_service as nims
 from _helpers import configure_logging, verbosity_option
 from fal.measure_dc_voltage import MeasureDCVoltage
+from fal.multi_site import run_per_site
 from fal.session_helper import initialize
+from fal.source_and_measure_dc_voltage import source_and_measure_dc_voltage
 from fal.source_dc_voltage import SourceDCVoltage
+from fal.trigger_line import TriggerLine
+from ni_measurement_plugin_sdk_service.measurement.service import MeasurementContext
 
 script_or_exe = sys.executable if getattr(sys, "frozen", False) else __file__
 service_directory = pathlib.Path(script_or_exe).resolve().parent
@@ -35,7 +39,12 @@ measurement_service = nims.MeasurementService(
 )
 @measurement_service.configuration("resolution_digits", nims.DataType.Double, 5.5)
 @measurement_service.configuration("measure_pin", nims.DataType.IOResource, "NI_DMM_Pin")
+@measurement_service.configuration(
+    "trigger_line", nims.DataType.Enum, TriggerLine.NONE, enum_type=TriggerLine
+)
 @measurement_service.output("measured_value", nims.DataType.Double)
+@measurement_service.output("site_numbers", nims.DataType.Int32Array1D)
+@measurement_service.output("site_measured_values", nims.DataType.DoubleArray1D)
 def measure(
     voltage_level: float,
     voltage_level_range: float,
@@ -45,11 +54,17 @@ def measure(
     source_pin: str,
     resolution_digits: float,
     measure_pin: str,
-) -> Tuple[float]:
-    """Source DC voltage using NI SMU and measure the same using an NI SMU or DMM."""
+    trigger_line: TriggerLine,
+) -> Tuple[float, List[int], List[float]]:
+    """Source and measure DC voltage on each site in parallel, or one at a time with a trigger line.
+
+    measured_value is the reading of the first site, and site_measured_values contains the reading
+    of each site in the order of site_numbers.
+    """
     logging.info(
         """Starting measurement: pin_names=%s voltage_level=%g voltage_level_range=%g
-        current_limit=%g current_limit_range=%g source_delay=%g resolution_digits=%g""",
+        current_limit=%g current_limit_range=%g source_delay=%g resolution_digits=%g
+        trigger_line=%s""",
         [source_pin, measure_pin],
         voltage_level,
         voltage_level_range,
@@ -57,26 +72,49 @@ def measure(
         current_limit_range,
         source_delay,
         resolution_digits,
+        trigger_line,
     )
 
-    with initialize(
-        measurement_context=measurement_service.context,
-        pin_names=[source_pin, measure_pin],
-    ) as sessions:
-        source_session: SourceDCVoltage = sessions[source_pin]
-        source_session.source_dc_voltage(
-            voltage_level_range=voltage_level_range,
-            voltage_level=voltage_level,
-            current_limit_range=current_limit_range,
-            current_limit=current_limit,
-            source_delay=source_delay,
-        )
-        measure_session: MeasureDCVoltage = sessions[measure_pin]
-        measured_value = measure_session.measure_dc_voltage(
-            voltage_level_range=voltage_level_range,
-            resolution_digits=resolution_digits,
-        )
-    return (measured_value,)
+    def measure_site(measurement_context: MeasurementContext) -> float:
+        with initialize(
+            measurement_context=measurement_context,
+            pin_names=[source_pin, measure_pin],
+            max_workers=2,
+        ) as sessions:
+            source_session: SourceDCVoltage = sessions[source_pin]
+            measure_session: MeasureDCVoltage = sessions[measure_pin]
+            return source_and_measure_dc_voltage(
+                source_session,
+                measure_session,
+                voltage_level_range=voltage_level_range,
+                voltage_level=voltage_level,
+                current_limit_range=current_limit_range,
+                current_limit=current_limit,
+                source_delay=source_delay,
+                resolution_digits=resolution_digits,
+                trigger_line=trigger_line,
+                source_pin=source_pin,
+                measure_pin=measure_pin,
+            )
+
+    # Without sites, run_per_site() measures once with the whole context, which is site 0.
+    site_numbers = list(measurement_service.context.pin_map_context.sites or [0])
+    # Every site uses the same trigger line, so a site's Source Complete event would also trigger
+    # the DMMs of the other sites. Measure the sites one at a time when a trigger line is used.
+    site_measured_values = run_per_site(
+        measurement_service.context,
+        measure_site,
+        max_workers=1 if trigger_line != TriggerLine.NONE else None,
+    )
+
+    logging.info(
+        "Completed measurement: measured_value=%g (first site) site_numbers=%s "
+        "site_measured_values=%s",
+        site_measured_values[0],
+        site_numbers,
+        site_measured_values,
+    )
+    return (site_measured_values[0], site_numbers, site_measured_values)
 
 
 @click.command
@@ -12,12 +12,14 @@ from ni_measurement_plugin_sdk_service.session_management import (
 )
 
 
-def create_instrument_sessions(sequence_context: Any) -> None:
+def create_instrument_sessions(sequence_context: Any, max_workers: int = 1) -> None:
     """Create and register all instrument session(s).
 
     Args:
         sequence_context: The SequenceContext COM object from the TestStand sequence execution.
             (Dynamically typed.)
+
+        max_workers: The maximum number of sessions to initialize in parallel.
     """
     with GrpcChannelPool() as grpc_channel_pool:
         teststand_support = TestStandSupport(sequence_context)
@@ -32,12 +34,17 @@ def create_instrument_sessions(sequence_context: Any) -> None:
         with session_helper.create_instrument_sessions(
             session_management_client,
             pin_map_context,
+            max_workers=max_workers,
         ) as session_info:
             session_management_client.register_sessions(session_info)
 
 
-def destroy_instrument_sessions() -> None:
-    """Destroy and unregister all instrument session(s)."""
+def destroy_instrument_sessions(max_workers: int = 1) -> None:
+    """Destroy and unregister all instrument session(s).
+
+    Args:
+        max_workers: The maximum number of sessions to close in parallel.
+    """
     with GrpcChannelPool() as grpc_channel_pool:
         discovery_client = DiscoveryClient(grpc_channel_pool=grpc_channel_pool)
         session_management_client = SessionManagementClient(
@@ -45,5 +52,6 @@ def destroy_instrument_sessions() -> None:
         )
         with session_helper.destroy_instrument_sessions(
             session_management_client,
+            max_workers=max_workers,
         ) as session_info:
             session_management_client.unregister_sessions(session_info)